@@ -19,10 +19,7 @@ Resources:
         - https://www.w3schools.com/python/ref_func_reversed.asp
 """
 
-# External Libraries
-from requests import get
-from bs4 import BeautifulSoup
-
+# External Libraries (imported in Grid.__init__, so importing this module stays fast)
 """
 pip install requests
 pip install bs4
@@ -67,6 +64,9 @@ class Grid:
         """
         creates a grid given a url (to google doc)
         """
+        from requests import get
+        from bs4 import BeautifulSoup
+
         self.points = []
         titles = BeautifulSoup(get(url).text, 'html.parser').find_all('table')
         rows = BeautifulSoup(str(titles), 'html.parser').find_all('tr')[1:]  # skips title row
@@ -145,9 +145,10 @@ def decode(url:str)->None:
     print(Grid(url))
 
 
-# Google Doc Tests
-url = "https://docs.google.com/document/d/e/2PACX-1vRMx5YQlZNa3ra8dYYxmv-QIQ3YJe8tbI3kqcuC7lQiZm-CSEznKfN_HYNSpoXcZIV3Y_O3YoUB1ecq/pub"
-decode(url)
+# Google Doc Tests (only when run directly, so importing doesn't make any requests)
+if __name__ == "__main__":
+    url = "https://docs.google.com/document/d/e/2PACX-1vRMx5YQlZNa3ra8dYYxmv-QIQ3YJe8tbI3kqcuC7lQiZm-CSEznKfN_HYNSpoXcZIV3Y_O3YoUB1ecq/pub"
+    decode(url)
 
-url2 = "https://docs.google.com/document/d/e/2PACX-1vQGUck9HIFCyezsrBSnmENk5ieJuYwpt7YHYEzeNJkIb9OSDdx-ov2nRNReKQyey-cwJOoEKUhLmN9z/pub"
-decode(url2)
\ No newline at end of file
+    url2 = "https://docs.google.com/document/d/e/2PACX-1vQGUck9HIFCyezsrBSnmENk5ieJuYwpt7YHYEzeNJkIb9OSDdx-ov2nRNReKQyey-cwJOoEKUhLmN9z/pub"
+    decode(url2)
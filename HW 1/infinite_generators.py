@@ -1,92 +1,490 @@
-"""
-FileName: infinite_generators.py
-Author: Karina Solis
-Date: 1/15/2025
-Resources:
-    - Wolf Paulus: Python Syntax (ex. I didn't know that you could declare variables simultaneously [ln 30])
-    - PEP: Python Style Guide (ex. PEP 484 - Type Hints [ln 12])
-        https://peps.python.org/pep-0484/
-    - typing module: Generator Class (ex. )
-        https://docs.python.org/3/library/typing.html#annotating-generators-and-coroutines
-"""
-from typing import Generator
-
-# Fibonacci Sequence Definition
-def fibonacci(n:int = None)->Generator[int]:
-    """
-    Generates the fibonacci sequence.
-
-    Args:
-        (optional) n (int): The amount of numbers in the sequence to be generated.
-
-    Yields:
-        n1 (int): The nth number in the sequence.
-    """
-    n1 = 0 # 1st num in seq, later used to hold the (n - 2)th number to determine the nth number in the sequence
-    n2 = 1 # 2nd num in seq, later used to hold the (n - 1)st number to determine the nth number in the sequence
-    count = 0 # loop var (inc)
-    while True:
-        if n != None:
-            if count >= n:
-                break
-        yield n1
-        n1, n2 = n2, n1 + n2
-        count += 1
-        
-
-# Custom Sequence Definition
-def custom_seq(n:int = None)->Generator[int]:
-    """
-    Generates a custom sequence, where the difference between each subsequent number in the sequence increases by one.
-
-    Args:
-        (optional) n (int): The amount of numbers in the sequence to be generated.
-
-    Yields:
-        n1 (int): The nth number in the sequence.
-    """
-    n1 = 1 # 1st num in the seq, diff is added to determine the next num in sequence
-    diff = 1 # difference var (inc)
-    count = 0 # loop var (inc)
-    while True: 
-        if n != None:
-            if count >= n:
-                break
-        yield n1  
-        n1 += diff
-        diff += 1
-        count += 1
-
-
-# Testing out the generators
-print("Testing infinite fibonacci generator:")
-count = 0
-stop = 10 # used to test without generator parameter
-for i in fibonacci():
-    if count >= stop:
-        break
-    print(i)
-    count += 1
-
-print("Testing infinite custom generator:")
-count = 0
-# used same stop variable to test both custom and fibonacci generator
-for i in custom_seq():
-    if count >= stop:
-        break
-    print(i)
-    count += 1
-    
-
-assert list(fibonacci(10)) == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
-assert list(fibonacci(-1)) == []
-assert list(fibonacci(0)) == []
-assert list(fibonacci(1)) == [0]
-assert list(fibonacci(2)) == [0, 1]
-
-# Calculation of First 10 Terms: 1, 1+1=2, 2+2=4, 4+3=7, 7+4=11, 11+5=16, 16+6=22, 22+7=29, 29+8=37, 37+9=46
-assert list(custom_seq(10)) == [1, 2, 4, 7, 11, 16, 22, 29, 37, 46]
-assert list(custom_seq(-1)) == []
-assert list(custom_seq(0)) == []
-assert list(custom_seq(1)) == [1]
-assert list(custom_seq(2)) == [1, 2]
\ No newline at end of file
+"""
+FileName: infinite_generators.py
+Author: Karina Solis
+Date: 1/15/2025
+Resources:
+    - Wolf Paulus: Python Syntax (ex. I didn't know that you could declare variables simultaneously [ln 30])
+    - PEP: Python Style Guide (ex. PEP 484 - Type Hints [ln 12])
+        https://peps.python.org/pep-0484/
+    - typing module: Generator Class (ex. )
+        https://docs.python.org/3/library/typing.html#annotating-generators-and-coroutines
+    - array module: typed arrays (custom_seq_batch)
+        https://docs.python.org/3/library/array.html
+    - collections module: OrderedDict as an LRU cache (SequenceCache)
+        https://docs.python.org/3/library/collections.html#ordereddict-examples-and-recipes
+    - concurrent.futures module: ProcessPoolExecutor (fibonacci_parallel)
+        https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+    - Fast Doubling (fibonacci_at [F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2]):
+        https://www.nayuki.io/page/fast-fibonacci-algorithms
+"""
+from array import array
+from collections import OrderedDict, deque
+from itertools import accumulate
+from os import cpu_count
+from sys import getsizeof
+from threading import Lock
+from typing import Generator
+
+INT64_MAX = 2**63 - 1 # largest value that fits in an array('q') / numpy int64
+
+# Sequence Cache Definition
+class SequenceCache:
+    """
+    A memory bounded cache of sequence numbers that can be shared by generators (and threads).
+    Numbers are stored in blocks of block_size, and the least recently used blocks are evicted
+    once the cache holds more than max_bytes.
+    """
+    def __init__(self, max_bytes:int = 64 * 1024 * 1024, block_size:int = 4096)->None:
+        """
+        SequenceCache initializer
+
+        Args:
+            (optional) max_bytes (int): The memory budget for the cached numbers.
+            (optional) block_size (int): The amount of numbers stored together (at least 2).
+        """
+        if block_size < 2:
+            raise ValueError(f"Cannot cache blocks of size {block_size}.")
+        self.max_bytes = max_bytes
+        self.block_size = block_size
+        self.blocks = OrderedDict() # (sequence name, block index) -> (numbers, bytes), oldest use first
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = Lock()
+
+    def get(self, name:str, index:int)->list[int] | array | None:
+        """ Returns the numbers in a block (marking it as recently used), or None when it isn't cached """
+        with self._lock:
+            entry = self.blocks.get((name, index))
+            if entry is None:
+                self.misses += 1
+                return None
+            self.blocks.move_to_end((name, index))
+            self.hits += 1
+            return entry[0]
+
+    def put(self, name:str, index:int, numbers:list[int] | array)->None:
+        """ Caches a block of numbers, evicting the least recently used blocks to stay under max_bytes """
+        # arrays hold their numbers inline, lists point to a separate int object per number
+        size = getsizeof(numbers)
+        if not isinstance(numbers, array):
+            size += sum(getsizeof(number) for number in numbers)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self.blocks.pop((name, index), None)
+            if old is not None:
+                self.bytes -= old[1]
+            self.blocks[(name, index)] = (numbers, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self.blocks.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def clear(self)->None:
+        """ Removes every cached block (the counters are kept) """
+        with self._lock:
+            self.blocks.clear()
+            self.bytes = 0
+
+    def stats(self)->dict:
+        """ Returns the hit/miss/eviction counters and the memory in use """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "blocks": len(self.blocks),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Fast Doubling Helper
+def _fib_pair(n:int)->tuple[int, int]:
+    """
+    Finds the nth and (n + 1)th fibonacci numbers using fast doubling (O(log n) multiplications).
+
+    Args:
+        n (int): The (0 based) index of the number in the sequence, must not be negative.
+
+    Returns:
+        (F(n), F(n + 1)) (tuple[int, int]): The nth number in the sequence and the one after it.
+    """
+    a, b = 0, 1 # F(k), F(k + 1) -- k starts at 0 and is built up one bit of n at a time
+    for bit in bin(n)[2:]:
+        # doubling step: k -> 2k
+        a, b = a * (2 * b - a), a * a + b * b
+        # the bit is set: 2k -> 2k + 1
+        if bit == "1":
+            a, b = b, a + b
+    return a, b
+
+
+def fibonacci_at(n:int)->int:
+    """
+    Finds the nth number of the fibonacci sequence without generating the numbers before it.
+
+    Args:
+        n (int): The (0 based) index of the number in the sequence.
+
+    Returns:
+        F(n) (int): The nth number in the sequence.
+    """
+    if n < 0:
+        raise ValueError(f"Cannot find fibonacci number at negative index {n}.")
+    return _fib_pair(n)[0]
+
+
+def fibonacci_range(start:int, stop:int)->Generator[int]:
+    """
+    Generates the fibonacci numbers from index start up to (but not including) index stop.
+    Seeks to start in O(log start) and then uses the usual addition.
+
+    Args:
+        start (int): The (0 based) index of the first number to be generated.
+        stop (int): The index to stop generating at.
+
+    Yields:
+        n1 (int): The next number in the range.
+    """
+    if start < 0:
+        raise ValueError(f"Cannot start fibonacci range at negative index {start}.")
+    yield from fibonacci(stop - start, start=start)
+
+
+# Fibonacci Sequence Definition
+def fibonacci(n:int = None, start:int = 0, cache:SequenceCache = None)->Generator[int]:
+    """
+    Generates the fibonacci sequence.
+
+    Args:
+        (optional) n (int): The amount of numbers in the sequence to be generated.
+        (optional) start (int): The (0 based) index to start generating from, seeked to in O(log start).
+        (optional) cache (SequenceCache): Cache to reuse numbers from (and store new numbers in).
+
+    Yields:
+        n1 (int): The nth number in the sequence.
+    """
+    if start < 0:
+        raise ValueError(f"Cannot start fibonacci sequence at negative index {start}.")
+    if cache is not None:
+        yield from _cached_seq(cache, "fibonacci", n, start, _fib_block, _fib_next_pair)
+        return
+    n1, n2 = _fib_pair(start) # F(start), F(start + 1), later used like the (n - 2)th and (n - 1)st numbers below
+    # bound check is done once here instead of on every number
+    if n is None:
+        while True:
+            yield n1
+            n1, n2 = n2, n1 + n2
+    for _ in range(n):
+        yield n1
+        n1, n2 = n2, n1 + n2
+
+
+def fibonacci_chunks(size:int, n:int = None, start:int = 0)->Generator[list[int]]:
+    """
+    Generates the fibonacci sequence in lists of size numbers at a time (the last list can be shorter).
+
+    Args:
+        size (int): The amount of numbers in each chunk.
+        (optional) n (int): The amount of numbers in the sequence to be generated.
+        (optional) start (int): The (0 based) index to start generating from, seeked to in O(log start).
+
+    Yields:
+        chunk (list[int]): The next size numbers in the sequence.
+    """
+    if size < 1:
+        raise ValueError(f"Cannot generate chunks of size {size}.")
+    if start < 0:
+        raise ValueError(f"Cannot start fibonacci sequence at negative index {start}.")
+    n1, n2 = _fib_pair(start)
+    remaining = n # amount of numbers left, None when unbounded
+    while remaining is None or remaining > 0:
+        length = size if remaining is None else min(size, remaining)
+        chunk = [0] * length # preallocated, filled by index
+        for i in range(length):
+            chunk[i] = n1
+            n1, n2 = n2, n1 + n2
+        yield chunk
+        if remaining is not None:
+            remaining -= length
+        
+
+def _fib_segment(first:int, stop:int, reducer:callable):
+    """ Reduces the fibonacci numbers from index first up to stop (runs in a worker process, only the result is sent back) """
+    return reducer(fibonacci(stop - first, start=first))
+
+
+def fibonacci_parallel(start:int, stop:int, reducer:callable, workers:int = None, segment_size:int = None)->Generator:
+    """
+    Reduces the fibonacci numbers from index start up to (but not including) index stop using several processes.
+    The range is split into segments, each worker seeks to its segment in O(log n), adds from there and passes
+    the numbers to reducer, and only the (small) results come back to this process, in order.
+    The numbers themselves never leave the workers, sending them back would cost more than computing them.
+
+    Args:
+        start (int): The (0 based) index of the first number.
+        stop (int): The index to stop at.
+        reducer (callable): Turns an iterator of a segment's numbers into a result (ex. sum, or a count of
+                            the numbers that match something), it has to be picklable (a module level function).
+        (optional) workers (int): The amount of worker processes (defaults to the amount of cpus).
+        (optional) segment_size (int): The amount of numbers each worker reduces at a time.
+
+    Yields:
+        result: reducer's result for the next segment.
+    """
+    if start < 0:
+        raise ValueError(f"Cannot start fibonacci range at negative index {start}.")
+    if stop <= start:
+        return
+    workers = workers or cpu_count() or 1
+    if segment_size is None:
+        # a few segments per worker keeps them all busy (the later segments have bigger numbers, so they're slower)
+        segment_size = max(1, -(-(stop - start) // (workers * 4)))
+    elif segment_size < 1:
+        raise ValueError(f"Cannot split fibonacci range into segments of size {segment_size}.")
+
+    from concurrent.futures import ProcessPoolExecutor # imported here since multiprocessing is slow to import
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque() # submitted segments, in order
+        first = start # first index of the next segment to submit
+        while first < stop or pending:
+            # only keep a couple of segments per worker in flight so huge ranges don't pile up in memory
+            while first < stop and len(pending) < workers * 2:
+                pending.append(executor.submit(_fib_segment, first, min(first + segment_size, stop), reducer))
+                first += segment_size
+            yield pending.popleft().result()
+
+
+# Custom Sequence Definition
+def custom_seq(n:int = None, cache:SequenceCache = None)->Generator[int]:
+    """
+    Generates a custom sequence, where the difference between each subsequent number in the sequence increases by one.
+
+    Args:
+        (optional) n (int): The amount of numbers in the sequence to be generated.
+        (optional) cache (SequenceCache): Cache to reuse numbers from (and store new numbers in).
+
+    Yields:
+        n1 (int): The nth number in the sequence.
+    """
+    if cache is not None:
+        yield from _cached_seq(cache, "custom_seq", n, 0, _custom_block, lambda block: None)
+        return
+    n1 = 1 # 1st num in the seq, diff is added to determine the next num in sequence
+    diff = 1 # difference var (inc)
+    # bound check is done once here instead of on every number
+    if n is None:
+        while True:
+            yield n1
+            n1 += diff
+            diff += 1
+    for _ in range(n):
+        yield n1
+        n1 += diff
+        diff += 1
+
+
+def custom_seq_chunks(size:int, n:int = None, start:int = 0)->Generator[array | list[int]]:
+    """
+    Generates the custom sequence in batches of size numbers at a time (the last batch can be shorter).
+    Each batch is filled all at once by custom_seq_batch.
+
+    Args:
+        size (int): The amount of numbers in each chunk.
+        (optional) n (int): The amount of numbers in the sequence to be generated.
+        (optional) start (int): The (0 based) index to start generating from.
+
+    Yields:
+        chunk (array | list[int]): The next size numbers in the sequence.
+    """
+    if size < 1:
+        raise ValueError(f"Cannot generate chunks of size {size}.")
+    if start < 0:
+        raise ValueError(f"Cannot start custom sequence at negative index {start}.")
+    index = start
+    stop = None if n is None else start + max(n, 0) # index to stop at, None when unbounded
+    while stop is None or index < stop:
+        end = index + size if stop is None else min(index + size, stop)
+        yield custom_seq_batch(index, end)
+        index = end
+
+
+def custom_seq_at(k:int)->int:
+    """
+    Finds the kth number of the custom sequence using its closed form, 1 + k(k + 1)/2.
+
+    Args:
+        k (int): The (0 based) index of the number in the sequence.
+
+    Returns:
+        n1 (int): The kth number in the sequence.
+    """
+    if k < 0:
+        raise ValueError(f"Cannot find custom sequence number at negative index {k}.")
+    return 1 + k * (k + 1) // 2
+
+
+def custom_seq_batch(start:int, stop:int, numpy:bool = False)->array | list[int]:
+    """
+    Fills the custom sequence from index start up to (but not including) index stop all at once.
+    Uses an array('q') (or a numpy int64 array) when every number fits in 64 bits, and a list of python ints when they don't.
+
+    Args:
+        start (int): The (0 based) index of the first number.
+        stop (int): The index to stop at.
+        (optional) numpy (bool): Return a numpy array instead of an array('q') (needs numpy installed).
+
+    Returns:
+        batch (array | list[int] | numpy.ndarray): The numbers in the range.
+    """
+    if start < 0:
+        raise ValueError(f"Cannot start custom sequence batch at negative index {start}.")
+    stop = max(start, stop) # an empty range gives an empty batch
+
+    # the sequence only grows, so the last number decides whether 64 bits are enough
+    fits = custom_seq_at(max(start, stop - 1)) <= INT64_MAX
+
+    if numpy and fits:
+        import numpy as np # imported here so the module doesn't pay for numpy unless it's asked for
+        k = np.arange(start, stop, dtype=np.int64)
+        # halving whichever of k, k + 1 is even first keeps k(k + 1) from overflowing before the division
+        even = (k % 2) == 0
+        return 1 + np.where(even, (k // 2) * (k + 1), k * ((k + 1) // 2))
+
+    if stop == start:
+        return array("q") if fits else []
+    # running sum of the differences (start + 1, start + 2, ...) done by accumulate in C instead of a python loop
+    values = list(accumulate(range(start + 1, stop), initial=custom_seq_at(start)))
+    if fits:
+        return array("q", values) # building from a list is faster than feeding array() the iterator
+    return values
+
+
+# Cached Generator Helpers
+def _fib_block(first:int, size:int, pair:tuple[int, int] | None)->tuple[list[int], tuple[int, int]]:
+    """
+    Computes a block of fibonacci numbers starting at index first.
+
+    Args:
+        first (int): The index of the first number in the block.
+        size (int): The amount of numbers in the block.
+        pair (tuple[int, int] | None): (F(first), F(first + 1)) when already known, otherwise it's seeked to.
+
+    Returns:
+        (block, pair) (tuple[list[int], tuple[int, int]]): The numbers, and the pair for the block after it.
+    """
+    n1, n2 = pair if pair is not None else _fib_pair(first)
+    block = [0] * size
+    for i in range(size):
+        block[i] = n1
+        n1, n2 = n2, n1 + n2
+    return block, (n1, n2)
+
+
+def _fib_next_pair(block:list[int])->tuple[int, int]:
+    """ Returns the pair of fibonacci numbers that follow a (cached) block """
+    n1 = block[-2] + block[-1]
+    return n1, block[-1] + n1
+
+
+def _custom_block(first:int, size:int, state:None)->tuple[array | list[int], None]:
+    """ Computes a block of the custom sequence starting at index first (no state needed, it has a closed form) """
+    return custom_seq_batch(first, first + size), None
+
+
+def _cached_seq(cache:SequenceCache, name:str, n:int | None, start:int, make_block:callable, next_state:callable)->Generator[int]:
+    """
+    Generates a sequence block by block, using the cached blocks and computing (and caching) the missing ones.
+
+    Args:
+        cache (SequenceCache): The cache to use.
+        name (str): The name of the sequence in the cache.
+        n (int | None): The amount of numbers to be generated, None when unbounded.
+        start (int): The (0 based) index to start generating from.
+        make_block (callable): Computes a missing block from (first index, size, state).
+        next_state (callable): Finds the state for the block after a cached block.
+
+    Yields:
+        number (int): The next number in the sequence.
+    """
+    size = cache.block_size
+    index, offset = divmod(start, size)
+    remaining = n # amount of numbers left, None when unbounded
+    state = None # state carried over from the previous block, so misses after it don't have to seek
+    while remaining is None or remaining > 0:
+        block = cache.get(name, index)
+        if block is None:
+            block, state = make_block(index * size, size, state)
+            cache.put(name, index, block)
+        else:
+            state = next_state(block)
+        end = size if remaining is None else min(size, offset + remaining)
+        yield from block[offset:end]
+        if remaining is not None:
+            remaining -= end - offset
+        offset = 0
+        index += 1
+
+
+# Testing out the generators (only when run directly, so importing the module has no side effects)
+if __name__ == "__main__":
+    print("Testing infinite fibonacci generator:")
+    count = 0
+    stop = 10 # used to test without generator parameter
+    for i in fibonacci():
+        if count >= stop:
+            break
+        print(i)
+        count += 1
+
+    print("Testing infinite custom generator:")
+    count = 0
+    # used same stop variable to test both custom and fibonacci generator
+    for i in custom_seq():
+        if count >= stop:
+            break
+        print(i)
+        count += 1
+
+
+    assert list(fibonacci(10)) == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+    assert list(fibonacci(-1)) == []
+    assert list(fibonacci(0)) == []
+    assert list(fibonacci(1)) == [0]
+    assert list(fibonacci(2)) == [0, 1]
+    assert list(fibonacci(5, start=3)) == [2, 3, 5, 8, 13]
+    assert [fibonacci_at(i) for i in range(10)] == list(fibonacci(10))
+    assert fibonacci_at(100) == 354224848179261915075
+    assert list(fibonacci_range(5, 10)) == [5, 8, 13, 21, 34]
+    assert list(fibonacci_range(10, 5)) == []
+    assert list(fibonacci_chunks(4, 10)) == [[0, 1, 1, 2], [3, 5, 8, 13], [21, 34]]
+    assert list(fibonacci_chunks(3, 3, start=4)) == [[3, 5, 8]]
+    assert list(fibonacci_chunks(4, 0)) == []
+    cache = SequenceCache(block_size=4)
+    assert list(fibonacci(10, cache=cache)) == list(fibonacci(10))
+    assert list(fibonacci(6, start=3, cache=cache)) == list(fibonacci(6, start=3))
+    assert cache.stats()["hits"] == 3 and cache.stats()["misses"] == 3
+    assert [n1 for segment in fibonacci_parallel(5, 30, list, workers=2, segment_size=4) for n1 in segment] == list(fibonacci_range(5, 30))
+    assert sum(fibonacci_parallel(0, 1000, sum, workers=2)) == sum(fibonacci_range(0, 1000))
+
+    # Calculation of First 10 Terms: 1, 1+1=2, 2+2=4, 4+3=7, 7+4=11, 11+5=16, 16+6=22, 22+7=29, 29+8=37, 37+9=46
+    assert list(custom_seq(10)) == [1, 2, 4, 7, 11, 16, 22, 29, 37, 46]
+    assert list(custom_seq(-1)) == []
+    assert list(custom_seq(0)) == []
+    assert list(custom_seq(1)) == [1]
+    assert list(custom_seq(2)) == [1, 2]
+    assert [custom_seq_at(k) for k in range(10)] == list(custom_seq(10))
+    assert list(custom_seq_batch(0, 10)) == list(custom_seq(10))
+    assert list(custom_seq_batch(3, 6)) == [7, 11, 16]
+    assert list(custom_seq_batch(5, 5)) == []
+    assert type(custom_seq_batch(2**31, 2**31 + 1)) is array
+    assert type(custom_seq_batch(2**33, 2**33 + 1)) is list
+    assert [list(chunk) for chunk in custom_seq_chunks(4, 10)] == [[1, 2, 4, 7], [11, 16, 22, 29], [37, 46]]
+    assert list(custom_seq_chunks(4, -1)) == []
+    assert list(custom_seq(10, cache=cache)) == list(custom_seq(10))
+    assert list(custom_seq(5, cache=cache)) == [1, 2, 4, 7, 11]
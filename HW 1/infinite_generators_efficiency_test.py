@@ -1,103 +1,181 @@
-"""
-FileName: infinite_generators_efficiency_test.py
-Author: Karina Solis
-Date: 1/15/2025
-Resources:
-    - Wolf Paulus: Python Syntax (ex. I didn't know that you could declare variables simultaneously [ln 33])
-    - PEP 484: Python Style Guide (ex. Type Hints)
-        https://peps.python.org/pep-0484/
-    - typing module: Generator Class (ex. Type Hints - Generator [ln 15])
-        https://docs.python.org/3/library/typing.html#annotating-generators-and-coroutines
-    - Daniil Gorshkov: efficiency test (Ln[94:])
-"""
-from typing import Generator
-from time import time
-
-# Fibonacci Sequence Definition
-def fibonacci(n:int = None)->Generator[int]:
-    """
-    Generates the fibonacci sequence.
-
-    Args:
-        (optional) n (int): The amount of numbers in the sequence to be generated.
-
-    Yields:
-        n1 (int): The nth number in the sequence.
-    """
-    n1 = 0 # 1st num in seq, later used to hold the (n - 2)th number to determine the nth number in the sequence
-    n2 = 1 # 2nd num in seq, later used to hold the (n - 1)st number to determine the nth number in the sequence
-    count = 0 # loop var (inc)
-    while True:
-        if n != None and count >= n:
-            break
-        yield n1
-        n1, n2 = n2, n1 + n2
-        count += 1
-        
-
-# Custom Sequence Definition
-def custom_seq(n:int = None)->Generator[int]:
-    """
-    Generates a custom sequence, where the difference between each subsequent number in the sequence increases by one.
-
-    Args:
-        (optional) n (int): The amount of numbers in the sequence to be generated.
-
-    Yields:
-        n1 (int): The nth number in the sequence.
-    """
-    n1 = 1 # 1st num in the seq, diff is added to determine the next num in sequence
-    diff = 1 # difference var (inc)
-    count = 0 # loop var (inc)
-    while True: 
-        if n != None and count >= n:
-                break
-        yield n1  
-        n1 += diff
-        diff += 1
-        count += 1
-
-
-# Testing out the generators
-print("Testing infinite fibonacci generator:")
-count = 0
-stop = 10 # used to test without generator parameter
-for i in fibonacci():
-    if count >= stop:
-        break
-    print(i)
-    count += 1
-
-print("Testing infinite custom generator:")
-count = 0
-# used same stop variable to test both custom and fibonacci generator
-for i in custom_seq():
-    if count >= stop:
-        break
-    print(i)
-    count += 1
-    
-
-assert list(fibonacci(10)) == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
-assert list(fibonacci(-1)) == []
-assert list(fibonacci(0)) == []
-assert list(fibonacci(1)) == [0]
-assert list(fibonacci(2)) == [0, 1]
-
-# Calculation of First 10 Terms: 1, 1+1=2, 2+2=4, 4+3=7, 7+4=11, 11+5=16, 16+6=22, 22+7=29, 29+8=37, 37+9=46
-assert list(custom_seq(10)) == [1, 2, 4, 7, 11, 16, 22, 29, 37, 46]
-assert list(custom_seq(-1)) == []
-assert list(custom_seq(0)) == []
-assert list(custom_seq(1)) == [1]
-assert list(custom_seq(2)) == [1, 2]
-
-# Added after Peer Review to test their efficiency against mine
-print("Millionth Test")
-
-print("Millionth frib: ")
-start = time()
-for i in fibonacci(10000):  # Exhaust the generator
-    prime = i 
-end = time()
-print(prime)
-print(f"Time to find: {end-start} s")
+"""
+FileName: infinite_generators_efficiency_test.py
+Author: Karina Solis
+Date: 1/15/2025
+Resources:
+    - Daniil Gorshkov: efficiency test (the original "Millionth Test")
+    - time module: perf_counter_ns
+        https://docs.python.org/3/library/time.html#time.perf_counter_ns
+    - statistics module: median/quantiles
+        https://docs.python.org/3/library/statistics.html
+    - argparse module: command line options
+        https://docs.python.org/3/library/argparse.html
+
+Benchmarks the generators in infinite_generators.py.
+Each case is timed over repeated trials (after warmup runs) for every n in the sweep,
+and the median/p95 times are written to a json file so runs can be compared.
+
+Use:
+    python infinite_generators_efficiency_test.py --output results.json
+    python infinite_generators_efficiency_test.py --compare results.json
+"""
+from collections import deque
+from statistics import median, quantiles
+from time import perf_counter_ns
+import argparse
+import json
+import platform
+import sys
+
+from infinite_generators import (
+    fibonacci,
+    fibonacci_at,
+    fibonacci_chunks,
+    fibonacci_parallel,
+    fibonacci_range,
+    custom_seq,
+    custom_seq_batch,
+    custom_seq_chunks,
+)
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000]
+CHUNK_SIZE = 1024
+
+
+def exhaust(iterator)->None:
+    """ runs through an iterator without keeping any of its values """
+    deque(iterator, maxlen=0)
+
+
+def total_bits(numbers)->int:
+    """ adds up the bit lengths of numbers (a cheap reducer, so the time is spent making the numbers) """
+    return sum(number.bit_length() for number in numbers)
+
+
+# Benchmark Cases (name -> function that does the work for a given n)
+CASES = {
+    "fibonacci": lambda n: exhaust(fibonacci(n)),
+    "fibonacci_chunks": lambda n: exhaust(fibonacci_chunks(CHUNK_SIZE, n)),
+    "fibonacci_at": lambda n: fibonacci_at(n),
+    # the same reduction serially and across processes (the parallel one only wins once n is large enough
+    # to pay for starting the workers, and only with more than one cpu)
+    "fibonacci_range": lambda n: total_bits(fibonacci_range(0, n)),
+    "fibonacci_parallel": lambda n: sum(fibonacci_parallel(0, n, total_bits)),
+    "custom_seq": lambda n: exhaust(custom_seq(n)),
+    "custom_seq_chunks": lambda n: exhaust(custom_seq_chunks(CHUNK_SIZE, n)),
+    "custom_seq_batch": lambda n: custom_seq_batch(0, n),
+}
+
+
+def time_case(case:callable, n:int, trials:int, warmup:int)->dict:
+    """
+    Times one case for one n.
+
+    Args:
+        case (callable): The function being timed, called with n.
+        n (int): The size passed to the case.
+        trials (int): The amount of timed runs.
+        warmup (int): The amount of untimed runs done first.
+
+    Returns:
+        result (dict): The median, p95 and min time (in nanoseconds) of the trials.
+    """
+    for _ in range(warmup):
+        case(n)
+
+    times = []
+    for _ in range(trials):
+        start = perf_counter_ns()
+        case(n)
+        times.append(perf_counter_ns() - start)
+
+    # quantiles needs at least 2 points, a single trial is its own p95
+    p95 = quantiles(times, n=20, method="inclusive")[18] if len(times) > 1 else times[0]
+    return {
+        "n": n,
+        "trials": trials,
+        "median_ns": median(times),
+        "p95_ns": p95,
+        "min_ns": min(times),
+    }
+
+
+def run(cases:list[str], sizes:list[int], trials:int, warmup:int)->dict:
+    """
+    Runs every case for every n in sizes.
+
+    Returns:
+        report (dict): Information about the run and a list of results (one per case/n).
+    """
+    results = []
+    for name in cases:
+        for n in sizes:
+            result = {"case": name, **time_case(CASES[name], n, trials, warmup)}
+            print(f"{name:>18} n={n:<10} median={result['median_ns'] / 1e6:10.3f} ms  p95={result['p95_ns'] / 1e6:10.3f} ms")
+            results.append(result)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "trials": trials,
+        "warmup": warmup,
+        "results": results,
+    }
+
+
+def compare(report:dict, baseline:dict, threshold:float)->list[str]:
+    """
+    Compares the medians of a run against a baseline run.
+
+    Args:
+        report (dict): The current run.
+        baseline (dict): The run being compared against.
+        threshold (float): How many times slower than the baseline a case can be before it counts as a regression.
+
+    Returns:
+        regressions (list[str]): A description of every case/n that got slower than the threshold.
+    """
+    old = {(result["case"], result["n"]): result["median_ns"] for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        key = (result["case"], result["n"])
+        if key not in old or old[key] == 0:
+            continue
+        ratio = result["median_ns"] / old[key]
+        if ratio > threshold:
+            regressions.append(f"{key[0]} n={key[1]}: {ratio:.2f}x slower than baseline")
+    return regressions
+
+
+def main()->None:
+    """
+    handles command line options, runs the benchmarks, and writes/compares the json results
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the infinite generators.")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--trials", type=int, default=15)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--output", help="json file to write the results to")
+    parser.add_argument("--compare", help="json file from an earlier run to check for regressions against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="allowed slowdown ratio before a regression is flagged")
+    args = parser.parse_args()
+
+    report = run(args.cases, args.sizes, args.trials, args.warmup)
+
+    if args.output:
+        with open(args.output, "w") as json_file:
+            json.dump(report, json_file, indent=4)
+
+    if args.compare:
+        with open(args.compare, "r") as json_file:
+            baseline = json.load(json_file)
+        regressions = compare(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+#for command line
+if __name__ == "__main__":
+    main()
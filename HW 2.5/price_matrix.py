@@ -0,0 +1,167 @@
+"""
+FileName: price_matrix.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - NumPy: datetime64 arrays
+        - https://numpy.org/doc/stable/reference/arrays.datetime.html
+    - NumPy: nan-aware statistics (nanmin, nanmax, nanmean, nanmedian)
+        - https://numpy.org/doc/stable/reference/routines.statistics.html
+    - NumPy: sliding_window_view (rolling windows)
+        - https://numpy.org/doc/stable/reference/generated/numpy.lib.stride_tricks.sliding_window_view.html
+
+pip install numpy
+"""
+# Non-Python Modules
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+# Python Modules
+from datetime import datetime
+# Local Modules
+from price_store import NASDAQ_DATE, PriceStore
+
+def to_columns(data:dict)->tuple[np.ndarray, np.ndarray]:
+    """
+    turns a get_data dictionary into a date column and a close column, sorted oldest first
+
+    Args:
+        data (dict): dictionary with price info from a certain ticker
+
+    Returns:
+        (dates, closes) (tuple[np.ndarray, np.ndarray]): datetime64[D] dates and float64 closing prices
+    """
+    prices = data.get("prices", {})
+    dates = np.array([datetime.strptime(day, NASDAQ_DATE).date() for day in prices], dtype="datetime64[D]")
+    # numpy parses the strings itself, once the thousands separators are gone (ex. "1,234.56")
+    closes = np.array([close.replace(",", "") for close in prices.values()], dtype=np.float64)
+    order = np.argsort(dates)
+    return dates[order], closes[order]
+
+
+def store_columns(store:PriceStore, ticker:str)->tuple[np.ndarray, np.ndarray]:
+    """
+    reads a ticker's columns straight out of a PriceStore, without building the string dictionary
+
+    Args:
+        store (PriceStore): The price store
+        ticker (str): The stock ticker
+
+    Returns:
+        (dates, closes) (tuple[np.ndarray, np.ndarray]): datetime64[D] dates and float64 closing prices, oldest first
+    """
+    rows = store.rows(ticker)
+    if not rows:
+        return np.empty(0, dtype="datetime64[D]"), np.empty(0, dtype=np.float64)
+    days, closes = zip(*rows)
+    return np.array(days, dtype="datetime64[D]"), np.array(closes, dtype=np.float64)
+
+
+class PriceMatrix:
+    """
+    Closing prices of many tickers stacked into one 2-D array (one row per ticker, one column per date).
+    Dates a ticker has no price for are NaN.
+    """
+    def __init__(self, tickers:list[str], dates:np.ndarray, closes:np.ndarray)->None:
+        """
+        PriceMatrix initializer
+
+        Args:
+            tickers (list[str]): The ticker of each row
+            dates (np.ndarray): The datetime64[D] date of each column, oldest first
+            closes (np.ndarray): float64 array of shape (len(tickers), len(dates))
+        """
+        self.tickers = list(tickers)
+        self.dates = dates
+        self.closes = closes
+
+    @classmethod
+    def from_columns(cls, columns:dict)->"PriceMatrix":
+        """
+        stacks per-ticker columns into a matrix, lined up on every date any ticker has
+
+        Args:
+            columns (dict): ticker -> (dates, closes) like to_columns/store_columns give
+
+        Returns:
+            matrix (PriceMatrix): The stacked prices
+        """
+        tickers = list(columns)
+        if not tickers:
+            return cls([], np.empty(0, dtype="datetime64[D]"), np.empty((0, 0)))
+        dates = np.unique(np.concatenate([columns[ticker][0] for ticker in tickers]))
+        closes = np.full((len(tickers), len(dates)), np.nan)
+        for row, ticker in enumerate(tickers):
+            ticker_dates, ticker_closes = columns[ticker]
+            closes[row, np.searchsorted(dates, ticker_dates)] = ticker_closes
+        return cls(tickers, dates, closes)
+
+    @classmethod
+    def from_data(cls, data:list[dict])->"PriceMatrix":
+        """ stacks get_data dictionaries (empty ones, and ones that can't be parsed, are skipped like process_data does) """
+        columns = {}
+        for entry in data:
+            if not entry or not entry.get("prices"):
+                continue
+            try:
+                columns[entry["ticker"]] = to_columns(entry)
+            except Exception as e:
+                print(f"Couldn't process data for: {entry['ticker']}. Error: {e}")
+        return cls.from_columns(columns)
+
+    @classmethod
+    def from_store(cls, store:PriceStore, tickers:list[str])->"PriceMatrix":
+        """ stacks tickers read straight out of a PriceStore """
+        return cls.from_columns({ticker.upper(): store_columns(store, ticker) for ticker in tickers})
+
+    def stats(self, quantiles:tuple[float, ...] = ())->dict:
+        """
+        min/max/mean/median of every ticker at once
+
+        Args:
+            (optional) quantiles (tuple[float, ...]): extra (exact) quantiles to add (ex. (0.05, 0.95) adds p5 and p95)
+
+        Returns:
+            stats (dict): ticker -> dictionary in the same format as process_data
+        """
+        if not self.tickers:
+            return {}
+        columns = {
+            "min": np.nanmin(self.closes, axis=1),
+            "max": np.nanmax(self.closes, axis=1),
+            "avg": np.nanmean(self.closes, axis=1),
+            "median": np.nanmedian(self.closes, axis=1),
+        }
+        for p in quantiles:
+            columns[f"p{p * 100:g}"] = np.nanquantile(self.closes, p, axis=1)
+        return {
+            ticker: {"ticker": ticker, **{name: float(values[row]) for name, values in columns.items()}}
+            for row, ticker in enumerate(self.tickers)
+        }
+
+    def returns(self)->np.ndarray:
+        """ simple daily returns (close / previous close - 1), shape (tickers, dates - 1) """
+        return self.closes[:, 1:] / self.closes[:, :-1] - 1
+
+    def rolling_mean(self, window:int)->np.ndarray:
+        """
+        moving average over window dates, shape (tickers, dates - window + 1)
+        (a window with a missing price is NaN)
+        """
+        if window < 1:
+            raise ValueError(f"Cannot use a rolling window of {window}")
+        return sliding_window_view(self.closes, window, axis=1).mean(axis=2)
+
+    def rolling_std(self, window:int)->np.ndarray:
+        """ moving standard deviation over window dates, shape (tickers, dates - window + 1) """
+        if window < 1:
+            raise ValueError(f"Cannot use a rolling window of {window}")
+        return sliding_window_view(self.closes, window, axis=1).std(axis=2)
+
+    def correlation(self)->np.ndarray:
+        """
+        correlation of the daily returns between every pair of tickers, shape (tickers, tickers)
+        (only dates where every ticker has a return are used)
+        """
+        returns = self.returns()
+        complete = ~np.isnan(returns).any(axis=0)
+        return np.corrcoef(returns[:, complete])
@@ -0,0 +1,101 @@
+"""
+FileName: price_store.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - sqlite3 module: one small database file per ticker
+        - https://docs.python.org/3/library/sqlite3.html
+    - SQLite: WITHOUT ROWID tables (the date is the key, so no extra rowid is stored)
+        - https://www.sqlite.org/withoutrowid.html
+"""
+# Python Modules
+from contextlib import closing
+from datetime import date, datetime
+from pathlib import Path
+import sqlite3
+
+NASDAQ_DATE = "%m/%d/%Y" # how the api formats dates (ex. 02/07/2025)
+
+class PriceStore:
+    """
+    Local store of historical closing prices, with one sqlite file per ticker.
+    Dates are kept as ISO strings (so they sort) and prices as floats.
+    """
+    def __init__(self, directory:str = "price_cache")->None:
+        """
+        PriceStore initializer
+
+        Args:
+            (optional) directory (str): The folder the ticker files are kept in (created if it doesn't exist)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _connect(self, ticker:str)->sqlite3.Connection:
+        """ opens (and creates, if needed) the database file for a ticker """
+        conn = sqlite3.connect(self.directory / f"{ticker.upper()}.sqlite")
+        conn.execute("CREATE TABLE IF NOT EXISTS prices (date TEXT PRIMARY KEY, close REAL NOT NULL) WITHOUT ROWID")
+        return conn
+
+    def last_date(self, ticker:str)->date | None:
+        """
+        finds the most recent date stored for a ticker
+
+        Args:
+            ticker (str): The stock ticker
+
+        Returns:
+            last (date | None): The last date fetched, None if nothing is stored yet
+        """
+        with closing(self._connect(ticker)) as conn:
+            (last,) = conn.execute("SELECT max(date) FROM prices").fetchone()
+        return date.fromisoformat(last) if last else None
+
+    def merge(self, ticker:str, rows)->int:
+        """
+        adds (or replaces) prices for a ticker
+
+        Args:
+            ticker (str): The stock ticker
+            rows (iterable): (date, close) pairs the way the api gives them (ex. ("02/07/2025", "$123.45"))
+
+        Returns:
+            count (int): The amount of rows written
+        """
+        # the api sometimes adds commas to prices above 999 (ex. $1,234.56)
+        records = (
+            (datetime.strptime(day, NASDAQ_DATE).date().isoformat(), float(close.replace("$", "").replace(",", "")))
+            for day, close in rows
+        )
+        with closing(self._connect(ticker)) as conn, conn:
+            cursor = conn.executemany("INSERT OR REPLACE INTO prices (date, close) VALUES (?, ?)", records)
+            return cursor.rowcount
+
+    def rows(self, ticker:str, since:date = None)->list[tuple[str, float]]:
+        """
+        gets the stored rows for a ticker, oldest first
+
+        Args:
+            ticker (str): The stock ticker
+            (optional) since (date): The earliest date to include
+
+        Returns:
+            rows (list[tuple[str, float]]): (ISO date, closing price) pairs
+        """
+        start = since.isoformat() if since else ""
+        with closing(self._connect(ticker)) as conn:
+            return conn.execute("SELECT date, close FROM prices WHERE date >= ? ORDER BY date", (start,)).fetchall()
+
+    def prices(self, ticker:str, since:date = None)->dict:
+        """
+        gets the stored prices for a ticker in the same format get_data uses (newest first, like the api)
+
+        Args:
+            ticker (str): The stock ticker
+            (optional) since (date): The earliest date to include
+
+        Returns:
+            prices (dict): date (ex. "02/07/2025") -> closing price without the $ (ex. "123.45")
+        """
+        rows = self.rows(ticker, since)
+        return {date.fromisoformat(day).strftime(NASDAQ_DATE): str(close) for day, close in reversed(rows)}
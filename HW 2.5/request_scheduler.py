@@ -0,0 +1,279 @@
+"""
+FileName: request_scheduler.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - Token bucket rate limiting
+        - https://en.wikipedia.org/wiki/Token_bucket
+    - AWS Architecture Blog: Exponential Backoff And Jitter ("full jitter")
+        - https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    - MDN: Retry-After header (seconds or an HTTP date)
+        - https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Retry-After
+    - threading module: Lock, BoundedSemaphore
+        - https://docs.python.org/3/library/threading.html
+"""
+# Non-Python Modules
+from requests import RequestException, Response, Session
+# Python Modules
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import uniform
+from statistics import quantiles
+from threading import BoundedSemaphore, Lock
+from urllib.parse import urlsplit
+import time
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class TokenBucket:
+    """
+    Thread safe token bucket: tokens refill at rate per second up to capacity, and every request takes one.
+    """
+    def __init__(self, rate:float, capacity:float = None, clock:callable = time.monotonic, sleep:callable = time.sleep)->None:
+        """
+        TokenBucket initializer
+
+        Args:
+            rate (float): Tokens added per second (the sustained requests per second)
+            (optional) capacity (float): Most tokens saved up (the burst size), defaults to rate
+            (optional) clock (callable): Source of the time in seconds
+            (optional) sleep (callable): Function used to wait
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, not {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self._lock = Lock()
+
+    def acquire(self)->float:
+        """
+        takes a token, waiting for one to refill if the bucket is empty
+
+        Returns:
+            waited (float): Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+            waited += wait
+
+
+class HostMetrics:
+    """
+    Request counts, errors and latencies for one host (latency percentiles come from the most recent requests).
+    """
+    def __init__(self, window:int = 1024)->None:
+        """
+        HostMetrics initializer
+
+        Args:
+            (optional) window (int): The amount of recent latencies kept for the percentiles
+        """
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.statuses = {} # status code (or exception name) -> count
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.throttled = 0.0 # seconds spent waiting on the rate limit
+        self.latencies = deque(maxlen=window)
+        self._lock = Lock()
+
+    def record(self, latency:float, outcome:int | str, error:bool)->None:
+        """ adds one finished request """
+        with self._lock:
+            self.requests += 1
+            self.errors += error
+            self.statuses[outcome] = self.statuses.get(outcome, 0) + 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.latencies.append(latency)
+
+    def record_wait(self, throttled:float, retry:bool = False)->None:
+        """ adds time spent waiting on the rate limit, and counts a retry """
+        with self._lock:
+            self.throttled += throttled
+            self.retries += retry
+
+    def summary(self)->dict:
+        """ returns the metrics as a dictionary """
+        with self._lock:
+            summary = {
+                "requests": self.requests,
+                "errors": self.errors,
+                "retries": self.retries,
+                "error_rate": self.errors / self.requests if self.requests else 0.0,
+                "statuses": dict(self.statuses),
+                "avg_latency": self.total_latency / self.requests if self.requests else None,
+                "max_latency": self.max_latency,
+                "throttled_seconds": self.throttled,
+            }
+            latencies = list(self.latencies)
+        if len(latencies) > 1:
+            cuts = quantiles(latencies, n=100, method="inclusive")
+            summary["p50_latency"], summary["p95_latency"] = cuts[49], cuts[94]
+        else:
+            summary["p50_latency"] = summary["p95_latency"] = latencies[0] if latencies else None
+        return summary
+
+
+class RequestScheduler:
+    """
+    Wraps a requests Session so every request is paced by a token bucket, capped at max_concurrency at a time,
+    and retried (with full jitter, or the server's Retry-After) on connection errors, 429 and 5xx.
+    Safe to share between threads, and can be passed anywhere a Session's get() is used.
+    """
+    def __init__(self, session:Session = None, rate:float = 5.0, burst:float = None, max_concurrency:int = 8,
+                 max_retries:int = 3, backoff_base:float = 0.5, backoff_max:float = 30.0,
+                 retry_statuses:frozenset = RETRY_STATUSES, clock:callable = time.monotonic, sleep:callable = time.sleep)->None:
+        """
+        RequestScheduler initializer
+
+        Args:
+            (optional) session (Session): The session requests are made with (a new one is made without one)
+            (optional) rate (float): Most requests started per second, over time
+            (optional) burst (float): Most requests started at once after being idle, defaults to rate
+            (optional) max_concurrency (int): Most requests in flight at the same time
+            (optional) max_retries (int): Retries after the first attempt before the last response/error is given back
+            (optional) backoff_base (float): Seconds of the first retry delay (it doubles every retry)
+            (optional) backoff_max (float): Longest retry delay, Retry-After included
+            (optional) retry_statuses (frozenset): Status codes that are retried
+            (optional) clock (callable): Source of the time in seconds
+            (optional) sleep (callable): Function used to wait
+        """
+        self.session = session if session is not None else Session()
+        self.bucket = TokenBucket(rate, burst, clock, sleep)
+        self.slots = BoundedSemaphore(max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.clock = clock
+        self.sleep = sleep
+        self.hosts = {} # host -> HostMetrics
+        self._lock = Lock()
+
+    def _metrics(self, url:str)->HostMetrics:
+        """ gets (or creates) the metrics for the host of a url """
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self.hosts:
+                self.hosts[host] = HostMetrics()
+            return self.hosts[host]
+
+    def _delay(self, attempt:int, response:Response = None)->float:
+        """ seconds to wait before retry number attempt (Retry-After when the server gives one, full jitter otherwise) """
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def get(self, url:str, **kwargs)->Response:
+        """
+        makes a GET request through the scheduler (takes the same arguments as Session.get)
+
+        Returns:
+            response (Response): The first successful response, or the last one once the retries run out
+                                 (with stream=True the response holds its concurrency slot until it's closed,
+                                 so the body download counts against max_concurrency, close it or use it in a with)
+
+        Raises:
+            RequestException: The last connection error once the retries run out
+        """
+        metrics = self._metrics(url)
+        for attempt in range(self.max_retries + 1):
+            metrics.record_wait(self.bucket.acquire())
+            self.slots.acquire()
+            held = True
+            try:
+                start = self.clock()
+                try:
+                    response = self.session.get(url, **kwargs)
+                except RequestException as e:
+                    metrics.record(self.clock() - start, type(e).__name__, True)
+                    if attempt == self.max_retries:
+                        raise
+                    response = None
+                else:
+                    retry = response.status_code in self.retry_statuses
+                    metrics.record(self.clock() - start, response.status_code, retry or response.status_code >= 400)
+                    if not retry or attempt == self.max_retries:
+                        if kwargs.get("stream"):
+                            self._release_on_close(response)
+                            held = False
+                        return response
+                    response.close()
+            finally:
+                if held:
+                    self.slots.release()
+            # waiting happens outside the concurrency slot so other requests can use it
+            metrics.record_wait(0.0, retry=True)
+            self.sleep(self._delay(attempt, response))
+
+    def _release_on_close(self, response:Response)->None:
+        """ gives a streamed response's concurrency slot back when it's closed (only once, however often it's closed) """
+        close = response.close
+        released = False
+        def close_and_release()->None:
+            nonlocal released
+            try:
+                close()
+            finally:
+                if not released:
+                    released = True
+                    self.slots.release()
+        response.close = close_and_release
+
+    def metrics(self)->dict:
+        """ returns the metrics of every host as a dictionary """
+        with self._lock:
+            return {host: metrics.summary() for host, metrics in self.hosts.items()}
+
+    def close(self)->None:
+        """ closes the session """
+        self.session.close()
+
+    def __enter__(self)->"RequestScheduler":
+        return self
+
+    def __exit__(self, *exc)->None:
+        self.close()
+
+
+def parse_retry_after(value:str | None)->float | None:
+    """
+    reads a Retry-After header
+
+    Args:
+        value (str | None): The header, either seconds (ex. "120") or an HTTP date
+
+    Returns:
+        seconds (float | None): Seconds to wait, None if there's no (valid) header
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
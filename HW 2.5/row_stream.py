@@ -0,0 +1,69 @@
+"""
+FileName: row_stream.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - json module: JSONDecoder.raw_decode (decoding one value out of a longer string)
+        - https://docs.python.org/3/library/json.html#json.JSONDecoder.raw_decode
+    - codecs module: incremental decoders (utf-8 characters can be split between chunks)
+        - https://docs.python.org/3/library/codecs.html#codecs.getincrementaldecoder
+"""
+# Python Modules
+from codecs import getincrementaldecoder
+from json import JSONDecodeError, JSONDecoder
+import re
+
+SKIP = re.compile(r"[\s,]*") # whitespace and commas between rows
+ROWS_START = re.compile(r'"tradesTable"\s*:\s*\{.*?"rows"\s*:\s*(\[|null)', re.DOTALL)
+
+def iter_rows(chunks, fields:tuple[str, ...] = ("date", "close")):
+    """
+    pulls the rows out of a nasdaq historical response (data.tradesTable.rows) while it's still downloading,
+    only one chunk and one row are held in memory at a time (instead of the whole response)
+
+    Args:
+        chunks (iterable): The response body in pieces (bytes), ex. response.iter_content(65536)
+        (optional) fields (tuple[str, ...]): The fields to keep from each row
+
+    Yields:
+        row (tuple): The values of fields for the next row (ex. ("02/07/2025", "$123.45"))
+    """
+    decode = getincrementaldecoder("utf-8")().decode
+    decoder = JSONDecoder()
+    chunks = iter(chunks)
+    buffer = ""
+    done = False # no more chunks
+
+    def more()->bool:
+        """ adds the next chunk to the buffer, returns False when there are none left """
+        nonlocal buffer, done
+        for chunk in chunks:
+            if chunk:
+                buffer += decode(chunk)
+                return True
+        done = True
+        buffer += decode(b"", final=True)
+        return False
+
+    # skip ahead to the start of the rows list
+    while (match := ROWS_START.search(buffer)) is None:
+        if not more():
+            return # no rows in the response
+    if match.group(1) == "null":
+        return
+    pos = match.end()
+
+    while True:
+        pos = SKIP.match(buffer, pos).end()
+        if pos < len(buffer) and buffer[pos] == "]":
+            return
+        try:
+            row, pos = decoder.raw_decode(buffer, pos)
+        except JSONDecodeError:
+            # the row isn't all here yet, drop what's already been read and get more
+            buffer = buffer[pos:]
+            pos = 0
+            if not more():
+                raise ValueError("Response ended in the middle of the rows") from None
+            continue
+        yield tuple(row[field] for field in fields)
@@ -11,20 +11,84 @@ Resources:
         - https://stackoverflow.com/questions/70629619/cannot-get-data-from-nasdaq-site
     - sys module: Command line arguments  (Ln[121])
         - https://docs.python.org/3/library/sys.html
+    - requests Session/HTTPAdapter: keep-alive connection pooling (make_session)
+        - https://requests.readthedocs.io/en/latest/user/advanced/#session-objects
+    - concurrent.futures module: ThreadPoolExecutor (fetch_all)
+        - https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor
+    - price_store.py: local cache of prices, so only new days are fetched (get_data store)
+    - streaming_stats.py: one pass min/max/mean/median (process_data)
+    - price_matrix.py: numpy version of process_data for many tickers at once (main --numpy)
+    - row_stream.py: parses the rows out of the response while it downloads (get_data stream)
+    - request_scheduler.py: rate limit, concurrency cap and retries shared by every request (fetch_all scheduler)
 """
 # Non-Python Modules
-from requests import get
+from requests import Session, get
+from requests.adapters import HTTPAdapter
 # Python Modules
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-import sys 
+import argparse
 import json
+# Local Modules
+from price_store import PriceStore
+from request_scheduler import RequestScheduler
+from row_stream import iter_rows
+from streaming_stats import StreamingStats
 
-def get_data(ticker:str)->dict:
+BASE_URL = "https://api.nasdaq.com"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+MAX_WORKERS = 8 # default amount of tickers fetched at the same time
+TIMEOUT = 10.0 # default seconds to wait on the api for each ticker
+CHUNK_SIZE = 64 * 1024 # bytes read from the socket at a time when streaming
+
+def make_session(max_workers:int = MAX_WORKERS)->Session:
+    """
+    creates a keep-alive session whose connection pool is big enough for max_workers threads
+    
+    Args:
+        max_workers (int): The amount of threads that will share the session
+        
+    Returns:
+        session (Session): The session to pass to get_data
+    """
+    session = Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _request(ticker:str, start:str, session:Session | RequestScheduler = None, timeout:float = None, stream:bool = False):
+    """
+    makes the historical prices request for a ticker
+    
+    Args:
+        ticker (str): The (upper case) stock ticker
+        start (str): The first date to get prices for (ex. 2020-02-10)
+        (optional) session (Session | RequestScheduler): Session (or scheduler) to make the request with (a plain request is made without one)
+        (optional) timeout (float): Seconds to wait on the api before giving up
+        (optional) stream (bool): Don't download the body until it's read
+        
+    Returns:
+        response (Response): The api's response
+    """
+    base_url = BASE_URL
+    path = f"/api/quote/{ticker}/historical?assetclass=stocks&fromdate={start}&limit=9999"
+    
+    if session is not None:
+        return session.get(base_url+path, timeout = timeout, stream = stream)
+    return get(base_url+path, headers = HEADERS, timeout = timeout, stream = stream)
+
+def get_data(ticker:str, session:Session | RequestScheduler = None, timeout:float = None, store:PriceStore = None, stream:bool = False)->dict:
     """
     gets stock data from nasdaq api using http request and returns a dictionary
     
     Args:
         ticker (str): The stock ticker (signifies what kind of stock)
+        (optional) session (Session): Session to reuse connections from (a plain request is made without one)
+        (optional) timeout (float): Seconds to wait on the api before giving up
+        (optional) store (PriceStore): Local price cache, only the days after the last cached day are fetched
+        (optional) stream (bool): Parse the rows while they download instead of loading the whole response
         
     Yields:
         close_dict (dict): The dictionary with the price data of a certain stock over 5 years
@@ -33,43 +97,87 @@ def get_data(ticker:str)->dict:
     try:
         ticker = ticker.upper()
         today = date.today()
-        start = str(today.replace(year=today.year - 5))
-        base_url = "https://api.nasdaq.com"
-        path = f"/api/quote/{ticker}/historical?assetclass=stocks&fromdate={start}&limit=9999"
+        five_years_ago = today.replace(year=today.year - 5)
+        start = str(five_years_ago)
+        if store is not None:
+            # the last cached day is fetched again in case its close was updated
+            last = store.last_date(ticker)
+            if last is not None and last > five_years_ago:
+                start = str(last)
         
-        headers = {"User-Agent": "Mozilla/5.0"}
+        with _request(ticker, start, session, timeout, stream) as response:
+            if response.status_code != 200:
+                print(f"Couldn't get data for: {ticker}. Status Code: {response.status_code}")
+                return {}
+            
+            try:
+                if stream:
+                    rows = iter_rows(response.iter_content(CHUNK_SIZE))
+                else:
+                    # getting the closing data (formatting seen just by using browser to view data)
+                    hist_dict = response.json().get("data", {}).get("tradesTable", {}).get("rows", [])
+                    rows = ((entry["date"], entry["close"]) for entry in hist_dict)
+                
+                if store is not None:
+                    store.merge(ticker, rows)
+                    return {"ticker": ticker, "prices": store.prices(ticker, since=five_years_ago)}
+                
+                # reformatting the data
+                close_dict = {
+                    "ticker": ticker,
+                    "prices": {
+                        day: close.replace("$", "").replace(",", "") # getting rid of $ and , for float conversion
+                        for day, close in rows
+                    }
+                }
+                return close_dict
+            except Exception as e:
+                print(f"Couldn't parse data for: {ticker}. Error: {e}")
+                return {}
+    except Exception as e:
+        print(f"Couldn't get data for: {ticker}. Error: {e}") 
+
+def get_stats(ticker:str, session:Session | RequestScheduler = None, timeout:float = None, quantiles:tuple[float, ...] = ())->dict:
+    """
+    streams a ticker's prices straight from the api into StreamingStats, without keeping the rows
+    
+    Args:
+        ticker (str): The stock ticker
+        (optional) session (Session): Session to reuse connections from (a plain request is made without one)
+        (optional) timeout (float): Seconds to wait on the api before giving up
+        (optional) quantiles (tuple[float, ...]): extra approximate quantiles to add (ex. (0.05, 0.95))
         
-        response = get(base_url+path, headers = headers)
+    Returns:
+        processed_data (dict): The same dictionary process_data gives
+    """
+    try:
+        ticker = ticker.upper()
+        today = date.today()
+        start = str(today.replace(year=today.year - 5))
         
-        if response.status_code != 200:
-            print(f"Couldn't get data for: {ticker}. Status Code: {response.status_code}")
-            return {}
+        with _request(ticker, start, session, timeout, stream=True) as response:
+            if response.status_code != 200:
+                print(f"Couldn't get data for: {ticker}. Status Code: {response.status_code}")
+                return {}
+            stats = StreamingStats(quantiles)
+            stats.update(float(close.replace("$", "").replace(",", "")) for (close,) in iter_rows(response.iter_content(CHUNK_SIZE), ("close",)))
         
-        try:
-            # getting the closing data (formatting seen just by using browser to view data)
-            hist_dict = response.json().get("data", {}).get("tradesTable", {}).get("rows", [])
-        except Exception as e:
-            print(f"Couldn't parse data for: {ticker}. Error: {e}")
+        if not stats.count:
+            print(f"No prices data for {ticker}")
             return {}
-        
-        # reformatting the data
-        close_dict = {
-            "ticker": ticker,
-            "prices": {
-                entry["date"]: entry["close"].replace("$", "") # getting rid of $ for float conversion
-                for entry in hist_dict
-            }
-        }
-        return close_dict
+        return {"ticker": ticker, **stats.result()}
     except Exception as e:
-        print(f"Couldn't get data for: {ticker}. Error: {e}") 
+        print(f"Couldn't get data for: {ticker}. Error: {e}")
+        return {}
 
-def process_data(data:dict)->dict:
+def process_data(data:dict, quantiles:tuple[float, ...] = ())->dict:
     """
     processes data from get_data dictionary to create new dictionary with min/max/mean/median data
+    (the prices are streamed through StreamingStats in one pass instead of being sorted)
     
     Args:
         data (dict): dictionary with price info from a certain ticker
+        (optional) quantiles (tuple[float, ...]): extra approximate quantiles to add (ex. (0.05, 0.95) adds p5 and p95)
         
     Yields:
         processed_data (dict): The dictionary with the price data of a certain stock over 5 years
@@ -80,34 +188,64 @@ def process_data(data:dict)->dict:
             print(f"No prices data for {data["ticker"]}")
             return {}
         
-        prices = [float(price) for price in data["prices"].values()]
-        length = len(prices)
-        
-        if length == 0:
-            print(f"No prices data for {data["ticker"]}")
-        
-        prices.sort()
-        min = prices[0]
-        max = prices[-1]
-        mean = sum(prices)/length
-        
-        if length % 2:
-            median = prices[int(length / 2)]
-        else:
-            median = prices[int(length / 2)] + prices[int((length / 2) - 1)] /2
+        stats = StreamingStats(quantiles)
+        stats.update(float(price) for price in data["prices"].values())
         
         processed_data = {
             "ticker": data["ticker"],
-            "min": min,
-            "max": max,
-            "avg": mean,
-            "median": median
+            **stats.result()
         }
         return processed_data
     except Exception as e:
         print(f"Couldn't process data. Error: {e}")
         return {}
 
+def fetch_all(tickers:list[str], max_workers:int = MAX_WORKERS, timeout:float = TIMEOUT, store:PriceStore = None, stream:bool = False,
+              scheduler:RequestScheduler = None)->dict:
+    """
+    gets the stock data for every ticker at the same time, using a thread pool that shares one keep-alive session
+    (or one scheduler, which also paces and retries the requests)
+    
+    Args:
+        tickers (list[str]): The stock tickers
+        (optional) max_workers (int): The most tickers fetched at the same time
+        (optional) timeout (float): Seconds to wait on the api for each ticker
+        (optional) store (PriceStore): Local price cache passed on to get_data
+        (optional) stream (bool): Parse the rows while they download (passed on to get_data)
+        (optional) scheduler (RequestScheduler): Scheduler to make every request through, instead of a new session
+        
+    Returns:
+        data (dict): The get_data result for each ticker, in the same order as tickers
+    """
+    return _run_all(tickers, max_workers, scheduler, lambda ticker, session: get_data(ticker, session, timeout, store, stream))
+
+def fetch_stats(tickers:list[str], max_workers:int = MAX_WORKERS, timeout:float = TIMEOUT, quantiles:tuple[float, ...] = (),
+                scheduler:RequestScheduler = None)->dict:
+    """
+    streams every ticker's prices straight into its stats (get_stats) at the same time, so no ticker's rows
+    are ever kept, only one chunk per thread is in memory at a time
+    
+    Args:
+        tickers (list[str]): The stock tickers
+        (optional) max_workers (int): The most tickers fetched at the same time
+        (optional) timeout (float): Seconds to wait on the api for each ticker
+        (optional) quantiles (tuple[float, ...]): extra approximate quantiles to add (ex. (0.05, 0.95))
+        (optional) scheduler (RequestScheduler): Scheduler to make every request through, instead of a new session
+        
+    Returns:
+        stats (dict): The get_stats result for each ticker, in the same order as tickers
+    """
+    return _run_all(tickers, max_workers, scheduler, lambda ticker, session: get_stats(ticker, session, timeout, quantiles))
+
+def _run_all(tickers:list[str], max_workers:int, scheduler:RequestScheduler | None, work:callable)->dict:
+    """ calls work(ticker, session) for every ticker on a thread pool sharing one session (or the scheduler) """
+    if scheduler is not None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(tickers, executor.map(lambda ticker: work(ticker, scheduler), tickers)))
+    
+    with make_session(max_workers) as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(tickers, executor.map(lambda ticker: work(ticker, session), tickers)))
+
 def main()->None:
     """
     handles user input and creates a .json file with the ouput from the given input
@@ -118,15 +256,51 @@ def main()->None:
     yields:
         none
     """
-    tickers = sys.argv[1:]
+    parser = argparse.ArgumentParser(usage="python stocks.py ticker1 ticker2 ... [--workers N] [--timeout SECONDS] [--cache DIR] [--quantiles Q ...] [--numpy] [--stream] [--rate PER_SECOND]")
+    parser.add_argument("tickers", nargs="*")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="most tickers fetched at the same time")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT, help="seconds to wait on the api for each ticker")
+    parser.add_argument("--cache", help="folder to keep prices in, so later runs only fetch new days")
+    parser.add_argument("--numpy", action="store_true", help="process every ticker at once with numpy (needs numpy installed)")
+    parser.add_argument("--stream", action="store_true", help="parse the prices while they download, to keep memory low "
+                                                              "(without --cache/--numpy the prices go straight into the stats and are never kept)")
+    parser.add_argument("--rate", type=float, help="most requests per second (also retries throttled/failed requests)")
+    parser.add_argument("--quantiles", nargs="+", type=float, default=(), help="extra approximate quantiles (ex. 0.05 0.95)")
+    args = parser.parse_args()
+    store = PriceStore(args.cache) if args.cache else None
+    tickers = args.tickers
     dict_results = {}
     
     if not tickers:
         print("No tickers. Use: python stocks.py ticker1 ticker2 ...")
     
-    for ticker in tickers:
-        processed_data = process_data(get_data(ticker))
-        dict_results[ticker] = processed_data
+    # streaming without a cache or numpy never needs the rows, only the stats
+    stats_only = args.stream and store is None and not args.numpy
+    
+    def fetch(scheduler:RequestScheduler = None)->dict:
+        if stats_only:
+            return fetch_stats(tickers, args.workers, args.timeout, tuple(args.quantiles), scheduler)
+        return fetch_all(tickers, args.workers, args.timeout, store, args.stream, scheduler)
+    
+    if args.rate:
+        with RequestScheduler(make_session(args.workers), rate=args.rate, max_concurrency=args.workers) as scheduler:
+            fetched = fetch(scheduler)
+        for host, metrics in scheduler.metrics().items():
+            print(f"{host}: {metrics}")
+    else:
+        fetched = fetch()
+    
+    if stats_only:
+        dict_results = fetched
+    elif args.numpy:
+        from price_matrix import PriceMatrix # numpy is only needed for this option
+        matrix_stats = PriceMatrix.from_data(list(fetched.values())).stats(tuple(args.quantiles))
+        for ticker, data in fetched.items():
+            dict_results[ticker] = matrix_stats.get(data["ticker"], {}) if data else {}
+    else:
+        for ticker, data in fetched.items():
+            processed_data = process_data(data, tuple(args.quantiles))
+            dict_results[ticker] = processed_data
         
     with open("stocks.json", "w") as json_file:
         json.dump(dict_results, json_file)
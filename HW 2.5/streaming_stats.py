@@ -0,0 +1,204 @@
+"""
+FileName: streaming_stats.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - heapq module: two heaps for a running median
+        - https://docs.python.org/3/library/heapq.html
+    - Jain & Chlamtac: The P-Square Algorithm for Dynamic Calculation of Quantiles and Histograms
+      Without Storing Observations (P2Quantile)
+        - https://www.cse.wustl.edu/~jain/papers/ftp/psqr.pdf
+"""
+# Python Modules
+from heapq import heappush, heappushpop
+
+EXACT_VALUES = 50 # values a P2Quantile keeps (and answers exactly from) before it switches to markers
+
+class P2Quantile:
+    """
+    Quantile of a stream using the P-Square algorithm.
+    The first exact_values values are kept and the quantile is exact, after that only 5 markers
+    (started from those values) are kept, no matter how many values are added.
+    """
+    def __init__(self, p:float, exact_values:int = EXACT_VALUES)->None:
+        """
+        P2Quantile initializer
+
+        Args:
+            p (float): The quantile to estimate, between 0 and 1 (ex. 0.95)
+            (optional) exact_values (int): The amount of values kept before switching to markers (at least 5)
+        """
+        if not 0 < p < 1:
+            raise ValueError(f"Quantile must be between 0 and 1, not {p}")
+        if exact_values < 5:
+            raise ValueError(f"P2Quantile has to keep at least 5 values, not {exact_values}")
+        self.p = p
+        self.exact_values = exact_values
+        self.values = [] # the values so far, None once the markers are used
+        self.heights = [] # marker heights
+        self.positions = [] # actual marker positions
+        self.desired = [] # where the markers should be
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1] # how far the desired positions move per value
+
+    def _start_markers(self)->None:
+        """ places the markers at their quantiles of the kept values, then drops the values """
+        values = sorted(self.values)
+        last = len(values) - 1
+        indexes = [round(fraction * last) for fraction in self.increments]
+        # markers need distinct positions (a quantile close to 0 or 1 can round onto its neighbour)
+        for i in range(1, 5):
+            indexes[i] = max(indexes[i], indexes[i - 1] + 1)
+        for i in range(3, -1, -1):
+            indexes[i] = min(indexes[i], indexes[i + 1] - 1)
+        self.heights = [values[index] for index in indexes]
+        self.positions = [index + 1 for index in indexes]
+        self.desired = [1 + fraction * last for fraction in self.increments]
+        self.values = None
+
+    def add(self, x:float)->None:
+        """ adds a value to the stream """
+        if self.values is not None:
+            self.values.append(x)
+            if len(self.values) > self.exact_values:
+                self._start_markers()
+            return
+        q = self.heights
+
+        # find the cell the value falls in, stretching the outer markers if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # move the middle markers towards their desired positions
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = self._parabolic(i, d)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    def _parabolic(self, i:int, d:int)->float:
+        """ piecewise parabolic prediction of marker i's height after moving it by d """
+        q = self.heights
+        n = self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self)->float | None:
+        """ returns the current estimate (exact, linearly interpolated, while the values are kept), None when empty """
+        if self.values is None:
+            return self.heights[2]
+        if not self.values:
+            return None
+        values = sorted(self.values)
+        position = self.p * (len(values) - 1)
+        low = int(position)
+        if low + 1 == len(values):
+            return values[low]
+        return values[low] + (values[low + 1] - values[low]) * (position - low)
+
+
+class StreamingStats:
+    """
+    Min/max/mean/median of a stream of values, updated one value at a time.
+    The median is exact (two heaps), or approximate in constant memory when exact_median is False.
+    Extra quantiles (ex. p5/p95) are exact for the first EXACT_VALUES values and approximate after (P2Quantile).
+    """
+    def __init__(self, quantiles:tuple[float, ...] = (), exact_median:bool = True)->None:
+        """
+        StreamingStats initializer
+
+        Args:
+            (optional) quantiles (tuple[float, ...]): Extra quantiles to estimate (ex. (0.05, 0.95))
+            (optional) exact_median (bool): Keep the values needed for an exact median
+        """
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.exact_median = exact_median
+        self._low = [] # max heap (negated) of the smaller half of the values
+        self._high = [] # min heap of the larger half of the values
+        self._median = None if exact_median else P2Quantile(0.5)
+        self.quantiles = {p: P2Quantile(p) for p in quantiles}
+
+    def add(self, x:float)->None:
+        """ adds a value to the stream """
+        self.count += 1
+        self.total += x
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+        if self.exact_median:
+            # the low heap keeps the extra value when the count is odd
+            if len(self._low) == len(self._high):
+                heappush(self._low, -heappushpop(self._high, x))
+            else:
+                heappush(self._high, -heappushpop(self._low, -x))
+        else:
+            self._median.add(x)
+
+        for sketch in self.quantiles.values():
+            sketch.add(x)
+
+    def update(self, values)->None:
+        """ adds every value from an iterable """
+        for x in values:
+            self.add(x)
+
+    @property
+    def mean(self)->float | None:
+        """ the average of the values, None when empty """
+        return self.total / self.count if self.count else None
+
+    @property
+    def median(self)->float | None:
+        """ the median of the values, None when empty """
+        if not self.count:
+            return None
+        if not self.exact_median:
+            return self._median.value()
+        if self.count % 2:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    def quantile(self, p:float)->float | None:
+        """ the estimate of one of the extra quantiles """
+        return self.quantiles[p].value()
+
+    def result(self)->dict:
+        """
+        returns the statistics in the format process_data uses
+
+        Returns:
+            stats (dict): min/max/avg/median, plus pN for each extra quantile (ex. p5, p95)
+        """
+        stats = {
+            "min": self.min,
+            "max": self.max,
+            "avg": self.mean,
+            "median": self.median,
+        }
+        for p, sketch in self.quantiles.items():
+            stats[f"p{p * 100:g}"] = sketch.value()
+        return stats
@@ -0,0 +1,67 @@
+"""
+File: test_price_matrix.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - NumPy testing: assert_array_equal/assert_allclose (NaN aware)
+        - https://numpy.org/doc/stable/reference/routines.testing.html
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from price_matrix import PriceMatrix, store_columns, to_columns
+from price_store import PriceStore
+
+AAA = {"ticker": "AAA", "prices": {"02/07/2025": "1,100.00", "02/05/2025": "1,000.00", "02/06/2025": "1,050.00"}}
+BBB = {"ticker": "BBB", "prices": {"02/07/2025": "20.00", "02/04/2025": "10.00"}}
+
+def test_to_columns():
+    """ Test should sort oldest first and parse closes with thousands separators """
+    dates, closes = to_columns(AAA)
+    assert_array_equal(dates, np.array(["2025-02-05", "2025-02-06", "2025-02-07"], dtype="datetime64[D]"))
+    assert_array_equal(closes, [1000.0, 1050.0, 1100.0])
+
+def test_missing_dates_are_nan():
+    """ Test should line the tickers up on every date and pad the missing ones with NaN """
+    matrix = PriceMatrix.from_data([AAA, BBB, {}, {"ticker": "CCC", "prices": {}}])
+    assert matrix.tickers == ["AAA", "BBB"]
+    assert_array_equal(matrix.dates, np.array(["2025-02-04", "2025-02-05", "2025-02-06", "2025-02-07"], dtype="datetime64[D]"))
+    assert_array_equal(matrix.closes, [[np.nan, 1000.0, 1050.0, 1100.0], [10.0, np.nan, np.nan, 20.0]])
+
+def test_stats_ignore_nan():
+    """ Test should compute the process_data stats of every row without the padding """
+    stats = PriceMatrix.from_data([AAA, BBB]).stats(quantiles=(0.5,))
+    assert stats["AAA"] == {"ticker": "AAA", "min": 1000.0, "max": 1100.0, "avg": 1050.0, "median": 1050.0, "p50": 1050.0}
+    assert stats["BBB"]["avg"] == 15.0
+    assert PriceMatrix.from_data([]).stats() == {}
+
+def test_bad_entry_is_skipped(capsys):
+    """ Test should skip (and report) a ticker whose prices can't be parsed """
+    matrix = PriceMatrix.from_data([AAA, {"ticker": "BAD", "prices": {"02/07/2025": "n/a"}}])
+    assert matrix.tickers == ["AAA"]
+    assert "Couldn't process data for: BAD" in capsys.readouterr().out
+
+def test_returns_and_rolling():
+    """ Test should compute returns and rolling windows along the dates """
+    matrix = PriceMatrix.from_data([AAA])
+    assert_allclose(matrix.returns(), [[0.05, 1100 / 1050 - 1]])
+    assert_allclose(matrix.rolling_mean(2), [[1025.0, 1075.0]])
+    assert_allclose(matrix.rolling_std(3), [[np.std([1000, 1050, 1100])]])
+    with pytest.raises(ValueError):
+        matrix.rolling_mean(0)
+
+def test_correlation_uses_complete_dates():
+    """ Test should only correlate dates where every ticker has a return """
+    up = {"ticker": "UP", "prices": {"01/01/2025": "1", "01/02/2025": "2", "01/03/2025": "3", "01/06/2025": "5"}}
+    double = {"ticker": "DOUBLE", "prices": {"01/01/2025": "2", "01/02/2025": "4", "01/03/2025": "6", "01/06/2025": "10"}}
+    assert_allclose(PriceMatrix.from_data([up, double]).correlation(), [[1.0, 1.0], [1.0, 1.0]])
+
+def test_from_store(tmp_path):
+    """ Test should read the same matrix out of a PriceStore """
+    store = PriceStore(tmp_path)
+    store.merge("AAA", [(day, f"${close}") for day, close in AAA["prices"].items()])
+    matrix = PriceMatrix.from_store(store, ["aaa", "zzz"])
+    assert matrix.tickers == ["AAA", "ZZZ"]
+    assert_array_equal(matrix.closes, [[1000.0, 1050.0, 1100.0], [np.nan] * 3])
+    assert store_columns(store, "zzz")[0].size == 0
@@ -0,0 +1,52 @@
+"""
+File: test_price_store.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/how-to/tmp_path.html
+"""
+
+from datetime import date
+import pytest
+from price_store import PriceStore
+
+@pytest.fixture
+def store(tmp_path):
+    return PriceStore(tmp_path / "cache")
+
+def test_empty(store):
+    """ Test should have nothing stored for a new ticker """
+    assert store.last_date("AAPL") is None
+    assert store.rows("AAPL") == []
+    assert store.prices("AAPL") == {}
+
+def test_merge_and_last_date(store):
+    """ Test should store the api's rows (commas and all) and find the newest date """
+    written = store.merge("aapl", [("02/07/2025", "$1,234.56"), ("02/06/2025", "$99.50")])
+    assert written == 2
+    assert store.last_date("AAPL") == date(2025, 2, 7)
+    assert store.rows("AAPL") == [("2025-02-06", 99.5), ("2025-02-07", 1234.56)]
+
+def test_incremental_merge(store):
+    """ Test should add new days and replace days that are fetched again """
+    store.merge("AAPL", [("02/06/2025", "$99.50"), ("02/05/2025", "$98.00")])
+    store.merge("AAPL", [("02/07/2025", "$101.00"), ("02/06/2025", "$100.00")])
+    assert store.last_date("AAPL") == date(2025, 2, 7)
+    assert store.rows("AAPL") == [("2025-02-05", 98.0), ("2025-02-06", 100.0), ("2025-02-07", 101.0)]
+
+def test_dates_sort_across_years(store):
+    """ Test should order by date, not by the api's month/day/year text """
+    store.merge("AAPL", [("12/31/2024", "$1.00"), ("01/02/2025", "$2.00")])
+    assert store.last_date("AAPL") == date(2025, 1, 2)
+    assert store.rows("AAPL", since=date(2025, 1, 1)) == [("2025-01-02", 2.0)]
+
+def test_prices_format(store):
+    """ Test should give prices the way get_data does (newest first, api dates, no $) """
+    store.merge("AAPL", [("02/06/2025", "$99.50"), ("02/07/2025", "$101.00")])
+    assert list(store.prices("AAPL").items()) == [("02/07/2025", "101.0"), ("02/06/2025", "99.5")]
+
+def test_tickers_are_separate(store):
+    """ Test should keep each ticker in its own file """
+    store.merge("AAPL", [("02/07/2025", "$1.00")])
+    assert store.last_date("MSFT") is None
+    assert sorted(path.name for path in store.directory.iterdir()) == ["AAPL.sqlite", "MSFT.sqlite"]
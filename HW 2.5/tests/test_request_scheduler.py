@@ -0,0 +1,122 @@
+"""
+File: test_request_scheduler.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - http.server module: ThreadingHTTPServer (a local fake of the api)
+        - https://docs.python.org/3/library/http.server.html
+    - https://docs.pytest.org/en/latest/how-to/fixtures.html
+"""
+
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from request_scheduler import RequestScheduler, parse_retry_after
+
+class FakeApi(BaseHTTPRequestHandler):
+    """
+    /ok -> 200, /throttled -> 429 (Retry-After: 0.2) the first time, /flaky -> 502 the first time,
+    /down -> always 503, /slow -> 200 after 0.1 seconds (every response tracks how many are in flight)
+    """
+    protocol_version = "HTTP/1.1"
+    seen = {}
+    active = 0
+    most_active = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.seen[self.path] = count = cls.seen.get(self.path, 0) + 1
+            cls.active += 1
+            cls.most_active = max(cls.most_active, cls.active)
+        headers = {}
+        if self.path == "/throttled" and count == 1:
+            status = 429
+            headers["Retry-After"] = "0.2"
+        elif self.path == "/flaky" and count == 1:
+            status = 502
+        elif self.path == "/down":
+            status = 503
+        else:
+            status = 200
+            if self.path == "/slow":
+                time.sleep(0.1)
+        body = b'{"ok": true}'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        with cls.lock:
+            cls.active -= 1
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def api():
+    FakeApi.seen, FakeApi.active, FakeApi.most_active = {}, 0, 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeApi)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+def test_retry_after(api):
+    """ Test should wait the Retry-After before retrying a 429 """
+    with RequestScheduler(rate=100, backoff_base=0.01) as scheduler:
+        start = time.monotonic()
+        response = scheduler.get(api + "/throttled", timeout=5)
+        assert response.status_code == 200
+        assert time.monotonic() - start >= 0.2
+    assert FakeApi.seen["/throttled"] == 2
+
+def test_retries_5xx(api):
+    """ Test should retry a 502 and give back the last 503 once the retries run out """
+    with RequestScheduler(rate=100, max_retries=2, backoff_base=0.01) as scheduler:
+        assert scheduler.get(api + "/flaky", timeout=5).status_code == 200
+        assert scheduler.get(api + "/down", timeout=5).status_code == 503
+    assert FakeApi.seen["/flaky"] == 2
+    assert FakeApi.seen["/down"] == 3
+
+def test_concurrency_cap(api):
+    """ Test should never have more than max_concurrency requests in flight """
+    with RequestScheduler(rate=1000, burst=1000, max_concurrency=2) as scheduler, ThreadPoolExecutor(8) as pool:
+        statuses = list(pool.map(lambda _: scheduler.get(api + "/slow", timeout=5).status_code, range(8)))
+    assert statuses == [200] * 8
+    assert FakeApi.most_active <= 2
+
+def test_streamed_response_holds_slot(api):
+    """ Test should keep a streamed response's slot until it's closed """
+    with RequestScheduler(rate=100, max_concurrency=1) as scheduler:
+        response = scheduler.get(api + "/ok", timeout=5, stream=True)
+        assert not scheduler.slots.acquire(blocking=False)
+        with response:
+            response.content
+        assert scheduler.slots.acquire(blocking=False)
+        scheduler.slots.release()
+        response.close() # closing again doesn't give back a slot twice
+        with pytest.raises(ValueError):
+            scheduler.slots.release()
+
+def test_metrics(api):
+    """ Test should count requests, retries and statuses per host """
+    with RequestScheduler(rate=100, max_retries=1, backoff_base=0.01) as scheduler:
+        scheduler.get(api + "/ok", timeout=5)
+        scheduler.get(api + "/flaky", timeout=5)
+    metrics = scheduler.metrics()[api.removeprefix("http://")]
+    assert metrics["requests"] == 3
+    assert metrics["retries"] == 1
+    assert metrics["errors"] == 1
+    assert metrics["statuses"] == {200: 2, 502: 1}
+    assert metrics["p95_latency"] is not None
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("") is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
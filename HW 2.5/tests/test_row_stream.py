@@ -0,0 +1,51 @@
+"""
+File: test_row_stream.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/example/parametrize.html
+"""
+
+import json
+import pytest
+from row_stream import iter_rows
+
+ROWS = [
+    {"date": "02/07/2025", "close": "$1,234.56", "volume": "10"},
+    {"date": "02/06/2025", "close": "$99.50", "volume": "20"},
+    {"date": "02/05/2025", "close": "$5.00", "volume": "30", "note": "café — \U0001f4c8"},
+]
+BODY = json.dumps({"data": {"symbol": "X", "tradesTable": {"headers": {"date": "Date"}, "rows": ROWS}}}, ensure_ascii=False).encode()
+EXPECTED = [(row["date"], row["close"]) for row in ROWS]
+
+def pieces(data:bytes, size:int):
+    """ splits data into chunks of size bytes """
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(BODY)])
+def test_chunk_sizes(size):
+    """ Test should give the same rows no matter where the chunks split (even inside a utf-8 character) """
+    assert list(iter_rows(pieces(BODY, size))) == EXPECTED
+
+def test_every_split_point():
+    """ Test should handle the body split in two at every byte """
+    for split in range(1, len(BODY)):
+        assert list(iter_rows([BODY[:split], b"", BODY[split:]])) == EXPECTED
+
+def test_fields():
+    """ Test should keep only the fields asked for """
+    assert list(iter_rows([BODY], fields=("volume",))) == [("10",), ("20",), ("30",)]
+
+@pytest.mark.parametrize("body", [
+    b'{"data": {"tradesTable": {"rows": null}}}',
+    b'{"data": {"tradesTable": {"rows": []}}}',
+    b'{"data": null, "message": "Symbol not exists"}',
+])
+def test_no_rows(body):
+    """ Test should yield nothing when there are no rows """
+    assert list(iter_rows(pieces(body, 5))) == []
+
+def test_truncated_response():
+    """ Test should raise ValueError when the response ends in the middle of the rows """
+    with pytest.raises(ValueError):
+        list(iter_rows(pieces(BODY[:len(BODY) // 2 + 40], 16)))
@@ -0,0 +1,74 @@
+"""
+File: test_streaming_stats.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - statistics module: exact median/quantiles to check against
+        - https://docs.python.org/3/library/statistics.html
+"""
+
+import random
+import statistics
+import pytest
+from streaming_stats import EXACT_VALUES, P2Quantile, StreamingStats
+
+def exact_quantile(values, p):
+    """ linearly interpolated quantile (the same method P2Quantile uses while it keeps the values) """
+    values = sorted(values)
+    position = p * (len(values) - 1)
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+def test_few_values_are_exact():
+    """ Test should answer exactly while it still keeps the values """
+    values = [104.81, 98.2, 131.5, 101.0, 99.9, 110.3]
+    for p in (0.05, 0.5, 0.95):
+        sketch = P2Quantile(p)
+        for x in values:
+            sketch.add(x)
+        assert sketch.value() == pytest.approx(exact_quantile(values, p))
+    assert P2Quantile(0.5).value() is None
+
+def test_switches_to_markers():
+    """ Test should drop the values after EXACT_VALUES and stay close to the exact quantile """
+    rng = random.Random(0)
+    values = [rng.gauss(100, 20) for _ in range(20_000)]
+    for p in (0.05, 0.5, 0.95):
+        sketch = P2Quantile(p)
+        for x in values:
+            sketch.add(x)
+        assert sketch.values is None
+        assert len(sketch.heights) == 5
+        assert sketch.value() == pytest.approx(exact_quantile(values, p), rel=0.01)
+
+def test_markers_start_from_kept_values():
+    """ Test should place the markers on the kept values right after switching """
+    sketch = P2Quantile(0.5, exact_values=10)
+    for x in range(11):
+        sketch.add(x)
+    assert sketch.heights == sorted(sketch.heights)
+    assert sketch.positions == sorted(set(sketch.positions))
+    assert sketch.value() == 5
+    with pytest.raises(ValueError):
+        P2Quantile(0.5, exact_values=4)
+
+def test_streaming_stats():
+    """ Test should match the exact min/max/mean/median, with pN keys for the extra quantiles """
+    rng = random.Random(1)
+    values = [rng.uniform(0, 100) for _ in range(EXACT_VALUES + 1001)]
+    stats = StreamingStats(quantiles=(0.05, 0.95))
+    stats.update(values)
+    result = stats.result()
+    assert (result["min"], result["max"]) == (min(values), max(values))
+    assert result["avg"] == pytest.approx(statistics.fmean(values))
+    assert result["median"] == statistics.median(values)
+    assert result["p5"] == pytest.approx(exact_quantile(values, 0.05), rel=0.1)
+    assert result["p95"] == pytest.approx(exact_quantile(values, 0.95), rel=0.05)
+
+def test_approximate_median():
+    """ Test should estimate the median in constant memory """
+    stats = StreamingStats(exact_median=False)
+    stats.update(range(1, 10_002))
+    assert stats.median == pytest.approx(5001, rel=0.01)
+    assert StreamingStats().median is None
@@ -0,0 +1,158 @@
+"""
+FileName:  call_metrics.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - Prometheus: text exposition format (counters, histograms)
+        - https://prometheus.io/docs/instrumenting/exposition_formats/
+    - bisect module: finding a value's histogram bucket
+        - https://docs.python.org/3/library/bisect.html
+
+Call counts, latency histograms, retries and sleep time for decorated functions.
+Everything is off by default: a disabled CallMetrics costs one attribute check per call.
+"""
+
+from bisect import bisect_left
+from json import dumps
+from threading import Lock
+
+# upper bounds (in seconds) of the latency histogram buckets, the last bucket (+Inf) is implied
+LATENCY_BUCKETS = (0.000001, 0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0, 10.0)
+
+class CallMetrics:
+    """
+    Counters of one decorated function, all allocated up front so recording a call never allocates.
+    """
+    def __init__(self, name: str, buckets: tuple[float, ...] = LATENCY_BUCKETS, enabled: bool = False) -> None:
+        """
+        creates the (zeroed) CallMetrics
+
+        args:
+            - name (str) -- name the function is exported under
+            - buckets (tuple[float, ...]) -- sorted upper bounds of the latency buckets in seconds
+            - enabled (bool) -- whether calls are recorded
+        """
+        self.name = name
+        self.buckets = tuple(buckets)
+        self.enabled = enabled
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """ sets every counter back to 0 """
+        with self._lock:
+            self.calls = 0
+            self.errors = 0
+            self.retries = 0
+            self.sleep_seconds = 0.0
+            self.latency_seconds = 0.0
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, latency: float, error: bool = False) -> None:
+        """ records one finished call that took latency seconds """
+        with self._lock:
+            self.calls += 1
+            self.errors += error
+            self.latency_seconds += latency
+            self.bucket_counts[bisect_left(self.buckets, latency)] += 1
+
+    def record_retry(self, slept: float = 0.0) -> None:
+        """ records one retry and the seconds slept before it """
+        with self._lock:
+            self.retries += 1
+            self.sleep_seconds += slept
+
+    def snapshot(self) -> dict:
+        """ returns the counters as a dictionary (the histogram counts aren't cumulative) """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "retries": self.retries,
+                "sleep_seconds": self.sleep_seconds,
+                "latency_seconds": self.latency_seconds,
+                "avg_latency": self.latency_seconds / self.calls if self.calls else None,
+                "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.bucket_counts)),
+            }
+
+
+class MetricsRegistry:
+    """
+    The CallMetrics of every instrumented function, turned on and off together and exported together.
+    """
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """
+        creates an (empty, disabled) MetricsRegistry
+
+        args:
+            - buckets (tuple[float, ...]) -- latency buckets given to every CallMetrics made by the registry
+        """
+        self.buckets = tuple(buckets)
+        self.enabled = False
+        self.functions = {} # name -> CallMetrics
+        self._lock = Lock()
+
+    def get(self, name: str) -> CallMetrics:
+        """ gets (or creates) the CallMetrics of a function, meant to be called once when decorating """
+        with self._lock:
+            if name not in self.functions:
+                self.functions[name] = CallMetrics(name, self.buckets, self.enabled)
+            return self.functions[name]
+
+    def enable(self) -> None:
+        """ starts recording calls """
+        with self._lock:
+            self.enabled = True
+            for metrics in self.functions.values():
+                metrics.enabled = True
+
+    def disable(self) -> None:
+        """ stops recording calls (the counters are kept) """
+        with self._lock:
+            self.enabled = False
+            for metrics in self.functions.values():
+                metrics.enabled = False
+
+    def reset(self) -> None:
+        """ sets the counters of every function back to 0 """
+        with self._lock:
+            functions = list(self.functions.values())
+        for metrics in functions:
+            metrics.reset()
+
+    def snapshot(self) -> dict:
+        """ returns the counters of every function as a dictionary """
+        with self._lock:
+            functions = list(self.functions.values())
+        return {metrics.name: metrics.snapshot() for metrics in functions}
+
+    def to_json(self, indent: int = None) -> str:
+        """ returns the snapshot as a json string """
+        return dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "calls") -> str:
+        """
+        returns the counters in the Prometheus text format (one series per function, labeled function="name")
+
+        args:
+            - prefix (str) -- start of every metric name
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for suffix, kind, field in (("total", "counter", "calls"), ("errors_total", "counter", "errors"),
+                                    ("retries_total", "counter", "retries"), ("sleep_seconds_total", "counter", "sleep_seconds")):
+            lines.append(f"# TYPE {prefix}_{suffix} {kind}")
+            lines.extend(f'{prefix}_{suffix}{{function="{name}"}} {stats[field]}' for name, stats in snapshot.items())
+        lines.append(f"# TYPE {prefix}_latency_seconds histogram")
+        for name, stats in snapshot.items():
+            total = 0
+            for bound, count in stats["buckets"].items():
+                total += count # prometheus buckets are cumulative
+                lines.append(f'{prefix}_latency_seconds_bucket{{function="{name}",le="{bound}"}} {total}')
+            lines.append(f'{prefix}_latency_seconds_sum{{function="{name}"}} {stats["latency_seconds"]}')
+            lines.append(f'{prefix}_latency_seconds_count{{function="{name}"}} {stats["calls"]}')
+        return "\n".join(lines) + "\n"
+
+
+# registry used by the decorators unless they're given another one (disabled until REGISTRY.enable())
+REGISTRY = MetricsRegistry()
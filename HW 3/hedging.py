@@ -0,0 +1,235 @@
+"""
+FileName:  hedging.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - Dean & Barroso: The Tail at Scale (hedged requests)
+        - https://research.google/pubs/the-tail-at-scale/
+    - concurrent.futures module: ThreadPoolExecutor, wait(FIRST_COMPLETED)
+        - https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.wait
+    - asyncio module: tasks, wait(FIRST_COMPLETED), cancel
+        - https://docs.python.org/3/library/asyncio-task.html#asyncio.wait
+
+Hedged calls for slow/flaky (but idempotent!) functions like call_shaky_service: when the first attempt is slower
+than most calls usually are, a second attempt is started next to it, and whichever succeeds first wins.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import wraps
+from inspect import iscoroutinefunction
+from random import randint, uniform
+from statistics import quantiles
+from threading import Lock
+from time import monotonic, sleep
+
+class HedgeStats:
+    """
+    Recent latencies (for the hedging threshold) and counters of a hedged function, shared by every caller.
+    """
+    def __init__(self, percentile: float, initial_delay: float, max_fraction: float, window: int, min_samples: int) -> None:
+        """
+        creates the HedgeStats
+
+        args:
+            - percentile (float) -- latency percentile (0 to 1) after which a hedge is started
+            - initial_delay (float) -- threshold used until there are min_samples latencies
+            - max_fraction (float) -- most hedges as a fraction of calls
+            - window (int) -- amount of recent latencies kept
+            - min_samples (int) -- latencies needed before the percentile is used
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.max_fraction = max_fraction
+        self.min_samples = min_samples
+        self.latencies = deque(maxlen=window)
+        self.threshold = initial_delay
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0 # calls won by a hedge instead of the first attempt
+        self.failures = 0 # calls where no attempt succeeded
+        self._lock = Lock()
+
+    def start_call(self) -> float:
+        """ counts a call and returns the current threshold """
+        with self._lock:
+            self.calls += 1
+            return self.threshold
+
+    def try_hedge(self) -> bool:
+        """ counts a hedge if it fits in max_fraction of the calls, returns whether it does """
+        with self._lock:
+            if self.hedges + 1 > self.max_fraction * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+    def finish_call(self, latency: float | None, hedge_won: bool) -> None:
+        """ records how a call ended (latency is None when no attempt succeeded) """
+        with self._lock:
+            if latency is None:
+                self.failures += 1
+                return
+            self.hedge_wins += hedge_won
+            self.latencies.append(latency)
+            # recomputed every so often instead of on every call
+            if len(self.latencies) >= self.min_samples and self.calls % 8 == 0:
+                cuts = quantiles(self.latencies, n=100, method="inclusive")
+                self.threshold = cuts[min(98, max(0, round(self.percentile * 100) - 1))]
+
+    def summary(self) -> dict:
+        """ returns the threshold and counters as a dictionary """
+        with self._lock:
+            return {
+                "threshold": self.threshold,
+                "calls": self.calls,
+                "hedges": self.hedges,
+                "hedge_rate": self.hedges / self.calls if self.calls else 0.0,
+                "hedge_wins": self.hedge_wins,
+                "failures": self.failures,
+            }
+
+
+def hedge(max_hedges: int = 1, percentile: float = 0.95, initial_delay: float = 0.05, max_fraction: float = 0.1,
+          window: int = 256, min_samples: int = 20, executor: ThreadPoolExecutor = None) -> callable:
+    """
+    adds customization to the hedging parameters
+
+    args:
+        - max_hedges (int) -- most extra attempts per call
+        - percentile (float) -- latency percentile (0 to 1) of recent successful calls after which a hedge starts
+        - initial_delay (float) -- seconds before a hedge starts until enough calls have been seen
+        - max_fraction (float) -- most hedges as a fraction of all calls (keeps the extra load bounded)
+        - window (int) -- amount of recent latencies the percentile is taken from
+        - min_samples (int) -- latencies needed before the percentile is used
+        - executor (ThreadPoolExecutor) -- (optional) pool regular functions run on (one is made per function without it)
+    returns:
+        - hedge (callable) -- the decorator
+    """
+    def hedge(func: callable) -> callable:
+        """
+        hedging decorator, the first truthy result wins and the other attempts are cancelled
+        (a falsy result or exception starts the next hedge right away, if there's one left)
+
+        args:
+            - func (callable) -- function/callable to be decorated (must be safe to call more than once)
+
+        returns:
+            - inner (callable) -- executes the inner function
+        """
+        stats = HedgeStats(percentile, initial_delay, max_fraction, window, min_samples)
+
+        if iscoroutinefunction(func):
+            import asyncio # only async functions need asyncio (it's slow to import)
+
+            @wraps(func)
+            async def inner(*args, **kwargs):
+                """
+                runs the attempts as asyncio tasks
+
+                returns:
+                    - result -- the first truthy result (or the last result if none are truthy)
+                """
+                start = monotonic()
+                threshold = stats.start_call()
+                first = asyncio.ensure_future(func(*args, **kwargs))
+                pending = {first}
+                hedges = 0
+                result, error = None, None
+                try:
+                    while pending:
+                        can_hedge = hedges < max_hedges
+                        done, pending = await asyncio.wait(pending, timeout=threshold if can_hedge else None, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            if task.exception() is not None:
+                                error = task.exception()
+                            elif task.result():
+                                stats.finish_call(monotonic() - start, task is not first)
+                                return task.result()
+                            else:
+                                result, error = task.result(), None
+                        # slower than the threshold, or an attempt failed: start a hedge
+                        if can_hedge:
+                            if stats.try_hedge():
+                                hedges += 1
+                                pending.add(asyncio.ensure_future(func(*args, **kwargs)))
+                            else:
+                                # over max_fraction, so no hedges for this call (a late hedge wouldn't help it)
+                                hedges = max_hedges
+                finally:
+                    for task in pending:
+                        task.cancel()
+                stats.finish_call(None, False)
+                if error is not None:
+                    raise error
+                return result
+        else:
+            pool = executor or ThreadPoolExecutor(max_workers=16, thread_name_prefix=f"hedge-{func.__name__}")
+            
+            @wraps(func)
+            def inner(*args, **kwargs):
+                """
+                runs the attempts on the thread pool
+
+                returns:
+                    - result -- the first truthy result (or the last result if none are truthy)
+                """
+                start = monotonic()
+                threshold = stats.start_call()
+                first = pool.submit(func, *args, **kwargs)
+                pending = {first}
+                hedges = 0
+                result, error = None, None
+                try:
+                    while pending:
+                        can_hedge = hedges < max_hedges
+                        done, pending = wait(pending, timeout=threshold if can_hedge else None, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            if future.exception() is not None:
+                                error = future.exception()
+                            elif future.result():
+                                stats.finish_call(monotonic() - start, future is not first)
+                                return future.result()
+                            else:
+                                result, error = future.result(), None
+                        # slower than the threshold, or an attempt failed: start a hedge
+                        if can_hedge:
+                            if stats.try_hedge():
+                                hedges += 1
+                                pending.add(pool.submit(func, *args, **kwargs))
+                            else:
+                                # over max_fraction, so no hedges for this call (a late hedge wouldn't help it)
+                                hedges = max_hedges
+                finally:
+                    # attempts that already started can't be stopped, they just finish in the background
+                    for future in pending:
+                        future.cancel()
+                stats.finish_call(None, False)
+                if error is not None:
+                    raise error
+                return result
+
+        # so the hedging can be looked at from the decorated function
+        inner.stats = stats
+        return inner
+    return hedge
+
+
+# hedged version of the shaky service (with a random latency, since hedging is about slow calls)
+@hedge(max_hedges=2, percentile=0.9, initial_delay=0.05, max_fraction=0.5)
+def call_slow_shaky_service() -> bool:
+    """
+    simulates a call that takes 10-100 ms and goes through 1/2 of the time
+
+    returns:
+        - true if a random int between 1 and 2 is 2, false otherwise
+    """
+    sleep(uniform(0.01, 0.1))
+    return 2 == randint(1, 2)
+
+
+# testing the hedging, only when run directly so importing has no side effects
+if __name__ == "__main__":
+    for _ in range(50):
+        call_slow_shaky_service()
+    print(call_slow_shaky_service.stats.summary())
@@ -0,0 +1,210 @@
+"""
+FileName:  retry_policy.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - Martin Fowler: CircuitBreaker (closed/open/half-open)
+        - https://martinfowler.com/bliki/CircuitBreaker.html
+    - AWS Architecture Blog: Exponential Backoff And Jitter (full/decorrelated jitter)
+        - https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    - Finagle: retry budgets (retries as a ratio of requests)
+        - https://twitter.github.io/finagle/guide/Clients.html#retries
+
+Pieces used by the backoff decorator in solis_decorator.py, each one can be used (and configured) on its own.
+"""
+
+from random import uniform
+from threading import Lock
+from time import monotonic
+
+# Jitter (spreads out the delays of callers that failed at the same time)
+def no_jitter(delay: float, initial_delay: float, max_delay: float) -> float:
+    """ sleeps for exactly the backoff delay """
+    return delay
+
+def full_jitter(delay: float, initial_delay: float, max_delay: float) -> float:
+    """ sleeps for a random time between 0 and the backoff delay """
+    return uniform(0, delay)
+
+def decorrelated_jitter(delay: float, initial_delay: float, max_delay: float) -> float:
+    """ sleeps for a random time between the initial delay and 3x the backoff delay (capped at max_delay) """
+    return min(max_delay, uniform(initial_delay, max(initial_delay, delay * 3)))
+
+
+class CircuitOpenError(Exception):
+    """ raised instead of calling the function while the circuit breaker is open """
+
+
+class RetryBudgetExhausted(Exception):
+    """ raised instead of retrying when the retry budget has run out """
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing function for a while.
+        - closed: calls go through, failure_threshold failures in a row open the circuit
+        - open: calls fail fast (CircuitOpenError) until recovery_timeout seconds have passed
+        - half-open: up to half_open_max_calls trial calls go through, a success closes the circuit
+          and a failure opens it again (trial calls that never report back are given up on after
+          another recovery_timeout, so a lost trial call can't leave the circuit stuck)
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1, clock: callable = monotonic) -> None:
+        """
+        creates a (closed) CircuitBreaker
+
+        args:
+            - failure_threshold (int) -- failures in a row that open the circuit
+            - recovery_timeout (float) -- seconds the circuit stays open before trial calls are let through
+            - half_open_max_calls (int) -- trial calls let through while half-open
+            - clock (callable) -- source of the time in seconds
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+        self._state = self.CLOSED
+        self.failures = 0 # failures in a row
+        self.opened_at = 0.0
+        self.half_opened_at = 0.0
+        self.trial_calls = 0
+        # counters (for observing the breaker)
+        self.times_opened = 0
+        self.rejected = 0
+        self.successes = 0
+        self.total_failures = 0
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        """ the current state (an open circuit turns half-open once the recovery timeout has passed) """
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        """ the current state (must be called with the lock held) """
+        now = self.clock()
+        if self._state == self.OPEN and now - self.opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self.half_opened_at = now
+            self.trial_calls = 0
+        elif self._state == self.HALF_OPEN and now - self.half_opened_at >= self.recovery_timeout:
+            # the trial calls never reported back, let new ones through
+            self.half_opened_at = now
+            self.trial_calls = 0
+        return self._state
+
+    def allow(self) -> bool:
+        """ returns whether a call can go through right now (and counts it if it's a trial call) """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self.trial_calls < self.half_open_max_calls:
+                self.trial_calls += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def release(self) -> None:
+        """ gives back a trial call that was let through but never ran/finished (ex. rejected by a retry budget) """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self.trial_calls > 0:
+                self.trial_calls -= 1
+
+    def record_success(self) -> None:
+        """ records a successful call (closes the circuit) """
+        with self._lock:
+            self.successes += 1
+            self.failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """ records a failed call (opens the circuit after too many, or after a failed trial call) """
+        with self._lock:
+            self.total_failures += 1
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                self._state = self.OPEN
+                self.opened_at = self.clock()
+
+    def stats(self) -> dict:
+        """ returns the state and counters as a dictionary """
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "failures_in_a_row": self.failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "successes": self.successes,
+                "failures": self.total_failures,
+            }
+
+
+class RetryBudget:
+    """
+    Limits retries to a ratio of the calls being made (ex. 0.2 -> at most 1 retry for every 5 calls),
+    plus a small allowance per second so low traffic can still retry.
+    Shared by every caller, so a fleet of callers can't multiply the load on a failing dependency.
+    """
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_balance: float = 10.0, clock: callable = monotonic) -> None:
+        """
+        creates a RetryBudget
+
+        args:
+            - ratio (float) -- retries earned per call
+            - min_per_second (float) -- retries earned per second no matter the traffic
+            - max_balance (float) -- most retries that can be saved up
+            - clock (callable) -- source of the time in seconds
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self.clock = clock
+        self.balance = max_balance
+        self.updated = clock()
+        # counters (for observing the budget)
+        self.calls = 0
+        self.retries = 0
+        self.rejected = 0
+        self._lock = Lock()
+
+    def _refill(self, earned: float) -> None:
+        """ adds earned retries plus the per second allowance (must be called with the lock held) """
+        now = self.clock()
+        self.balance = min(self.max_balance, self.balance + earned + (now - self.updated) * self.min_per_second)
+        self.updated = now
+
+    def record_call(self) -> None:
+        """ records a first attempt (earns ratio retries) """
+        with self._lock:
+            self.calls += 1
+            self._refill(self.ratio)
+
+    def try_retry(self) -> bool:
+        """ spends one retry, returns False if there isn't one to spend """
+        with self._lock:
+            self._refill(0)
+            if self.balance >= 1:
+                self.balance -= 1
+                self.retries += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def stats(self) -> dict:
+        """ returns the balance and counters as a dictionary """
+        with self._lock:
+            self._refill(0)
+            return {
+                "balance": self.balance,
+                "calls": self.calls,
+                "retries": self.retries,
+                "rejected": self.rejected,
+                "retry_ratio": self.retries / self.calls if self.calls else 0.0,
+            }
@@ -10,12 +10,27 @@ Resources:
         - https://www.geeksforgeeks.org/python-time-module/
     - getting function name (Ln[60])
         - https://www.geeksforgeeks.org/python-how-to-get-function-name/
+    - contextvars module: state per thread/asyncio task (backoff delay)
+        - https://docs.python.org/3/library/contextvars.html
+    - asyncio sleep: waiting without blocking the event loop (async backoff)
+        - https://docs.python.org/3/library/asyncio-task.html#asyncio.sleep
+    - retry_policy.py: circuit breaker, retry budget and jitter used by backoff
+    - call_metrics.py: call counts, latency histograms, retries and sleep time (off by default)
 """
 
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
 from random import randint
-from time import sleep, asctime
+from threading import Lock
+from time import perf_counter, sleep, asctime
 
-def backoff(initial_delay: float = 0.01, back_off_factor: float = 2.0, max_delay: float = 3.0) -> callable:
+from call_metrics import REGISTRY, MetricsRegistry
+from retry_policy import CircuitBreaker, CircuitOpenError, RetryBudget, RetryBudgetExhausted, no_jitter
+
+def backoff(initial_delay: float = 0.01, back_off_factor: float = 2.0, max_delay: float = 3.0, key: callable = None,
+            jitter: callable = no_jitter, breaker: CircuitBreaker = None, budget: RetryBudget = None,
+            max_retries: int = None, verbose: bool = True, metrics: MetricsRegistry = REGISTRY) -> callable:
     """
     adds customization to the backoff parameters
     
@@ -23,12 +38,22 @@ def backoff(initial_delay: float = 0.01, back_off_factor: float = 2.0, max_delay
         - initial_delay (float) -- delay after the first call that isn't true
         - back_off_factor (float) -- how much exponentially the delay should grow
         - max_delay (float) -- the maximum amount of delay 
+        - key (callable) -- (optional) gets a key from the call's arguments, each key backs off on its own
+                            (without one, each thread/asyncio task backs off on its own)
+        - jitter (callable) -- (optional) turns the delay into the time actually slept (see retry_policy.py)
+        - breaker (CircuitBreaker) -- (optional) fails fast with CircuitOpenError while the circuit is open
+        - budget (RetryBudget) -- (optional) fails fast with RetryBudgetExhausted when a retry isn't in the budget
+        - max_retries (int) -- (optional) retry inside the call up to max_retries times, returning the last result
+                               (without it, each call is one attempt and the caller decides when to call again)
+        - verbose (bool) -- (optional) print a line before every attempt
+        - metrics (MetricsRegistry) -- (optional) where attempts, latencies, retries and sleep time are recorded
+                                       (only while it's enabled, see call_metrics.py)
     returns: 
         - backoff (callable) -- executes the initial/base decorator (no customization)
     """
     def backoff(func: callable) -> callable:
         """
-        (initial) backoff decorator to add exponential backoff
+        (initial) backoff decorator to add exponential backoff, works on both regular and async functions
         
         args: 
             - func (callable) -- function/callable to be decorated
@@ -36,42 +61,151 @@ def backoff(initial_delay: float = 0.01, back_off_factor: float = 2.0, max_delay
         returns:
             - inner (callable) -- executes the inner funcion
         """
-        delay = 0
-    
-        def inner(*args, **kwargs):
+        # delay of the current thread/task (every thread and asyncio task gets its own copy)
+        caller_delay = ContextVar(f"{func.__name__}_delay", default=0)
+        # delay of each key (only used when a key function is given)
+        key_delays = {}
+        key_lock = Lock()
+        attempts = range((max_retries or 0) + 1)
+        call_metrics = metrics.get(func.__qualname__)
+        
+        def get_delay(args, kwargs) -> float:
+            """ gets the delay for this caller/key """
+            if key is None:
+                return caller_delay.get()
+            with key_lock:
+                return key_delays.get(key(*args, **kwargs), 0)
+        
+        def set_delay(args, kwargs, delay: float) -> None:
+            """ saves the delay for this caller/key (keys that are back to 0 are dropped) """
+            if key is None:
+                caller_delay.set(delay)
+                return
+            with key_lock:
+                if delay:
+                    key_delays[key(*args, **kwargs)] = delay
+                else:
+                    key_delays.pop(key(*args, **kwargs), None)
+        
+        def before_call(args, kwargs, attempt: int) -> tuple[float, float]:
             """
-            imposes the specified delay
-            
-            args:
-                - *args -- non-keyworded list of unspecified arguments
-                - **kwargs -- keyworded list of unspecified arguments
+            checks the breaker and budget before an attempt
             
             returns:
-                - result -- the return from calling func (in this case bool)
+                - (delay, sleep time) (tuple[float, float]) -- the current backoff delay and how long to sleep first
             """
-            nonlocal delay, initial_delay, back_off_factor
-            result = func(*args, **kwargs)
-            
-            # capping the delay
-            if delay >= max_delay:
-                delay = max_delay
-                
-            #Output: {Date/time} will be calling {func} after {delay} sec delay
-            print(f"{asctime()}: will be calling {func.__name__} after {delay} sec delay")
+            delay = get_delay(args, kwargs)
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(f"{func.__name__} circuit is open")
+            if budget is not None:
+                # a call after a failure (or a retry inside the call) is a retry, anything else is a new call
+                if delay or attempt:
+                    if not budget.try_retry():
+                        give_back()
+                        raise RetryBudgetExhausted(f"{func.__name__} retry budget is exhausted")
+                else:
+                    budget.record_call()
             
-            # sleep for the delay duration
-            sleep(delay)
+            pause = jitter(delay, initial_delay, max_delay) if delay else 0
+            if call_metrics.enabled and (delay or attempt):
+                call_metrics.record_retry(pause)
             
-            # if func is true, delay resets, otherwise the delay increments exponentially
+            #Output: {Date/time} will be calling {func} after {delay} sec delay
+            if verbose:
+                print(f"{asctime()}: will be calling {func.__name__} after {delay} sec delay")
+            return delay, pause
+        
+        def give_back() -> None:
+            """ gives the breaker back a (trial) call it let through that never ran or never finished """
+            if breaker is not None:
+                breaker.release()
+        
+        def after_call(args, kwargs, delay: float, result, start: float | None) -> None:
+            """ if func is true, delay resets, otherwise the delay increments exponentially (capped at max_delay) """
+            if start is not None:
+                call_metrics.observe(perf_counter() - start, not result)
             if result:
-                delay = 0
-            else:
-                if delay == 0:
-                    delay += initial_delay
-                else:
-                    delay *= back_off_factor
+                if breaker is not None:
+                    breaker.record_success()
+                set_delay(args, kwargs, 0)
+                return
+            if breaker is not None:
+                breaker.record_failure()
+            set_delay(args, kwargs, initial_delay if delay == 0 else min(delay * back_off_factor, max_delay))
+        
+        if iscoroutinefunction(func):
+            from asyncio import sleep as async_sleep # only async functions need asyncio (it's slow to import)
             
-            return result
+            @wraps(func)
+            async def inner(*args, **kwargs):
+                """
+                imposes the specified delay without blocking the event loop
+                
+                args:
+                    - *args -- non-keyworded list of unspecified arguments
+                    - **kwargs -- keyworded list of unspecified arguments
+                
+                returns:
+                    - result -- the return from awaiting func
+                """
+                for attempt in attempts:
+                    delay, pause = before_call(args, kwargs, attempt)
+                    start = None
+                    try:
+                        # only sleep after a failed call
+                        if pause:
+                            await async_sleep(pause)
+                        start = perf_counter() if call_metrics.enabled else None
+                        result = await func(*args, **kwargs)
+                    except Exception:
+                        after_call(args, kwargs, delay, False, start)
+                        raise
+                    except BaseException:
+                        # cancelled/interrupted: the attempt doesn't count for or against the breaker
+                        give_back()
+                        raise
+                    after_call(args, kwargs, delay, result, start)
+                    if result:
+                        break
+                return result
+        else:
+            @wraps(func)
+            def inner(*args, **kwargs):
+                """
+                imposes the specified delay
+                
+                args:
+                    - *args -- non-keyworded list of unspecified arguments
+                    - **kwargs -- keyworded list of unspecified arguments
+                
+                returns:
+                    - result -- the return from calling func (in this case bool)
+                """
+                for attempt in attempts:
+                    delay, pause = before_call(args, kwargs, attempt)
+                    start = None
+                    try:
+                        # only sleep after a failed call
+                        if pause:
+                            sleep(pause)
+                        start = perf_counter() if call_metrics.enabled else None
+                        result = func(*args, **kwargs)
+                    except Exception:
+                        after_call(args, kwargs, delay, False, start)
+                        raise
+                    except BaseException:
+                        # cancelled/interrupted: the attempt doesn't count for or against the breaker
+                        give_back()
+                        raise
+                    after_call(args, kwargs, delay, result, start)
+                    if result:
+                        break
+                return result
+        
+        # so the breaker/budget/metrics can be looked at from the decorated function
+        inner.breaker = breaker
+        inner.budget = budget
+        inner.metrics = call_metrics
         return inner
     return backoff
 
@@ -88,6 +222,8 @@ def call_shaky_service() -> bool:
     """
     return 6 == randint(1, 6)
 
-# testing the function (ctrl + c in terminal - to stop loop)
-while True:
-    print(call_shaky_service())
+# testing the function (ctrl + c in terminal - to stop loop), only when run directly so importing has no side effects
+if __name__ == "__main__":
+    while True:
+        print(call_shaky_service())
+
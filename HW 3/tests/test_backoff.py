@@ -0,0 +1,123 @@
+"""
+File: test_backoff.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/how-to/monkeypatch.html
+    - asyncio: running tasks concurrently
+        - https://docs.python.org/3/library/asyncio-task.html#asyncio.gather
+"""
+
+import asyncio
+import threading
+
+import pytest
+import solis_decorator
+from solis_decorator import backoff
+
+@pytest.fixture
+def slept(monkeypatch):
+    """ records every (blocking) sleep backoff asks for instead of sleeping """
+    calls = []
+    monkeypatch.setattr(solis_decorator, "sleep", calls.append)
+    return calls
+
+def test_success_never_sleeps(slept):
+    """ Test should not sleep before or after calls that keep succeeding """
+    @backoff(verbose=False)
+    def works():
+        return True
+
+    for _ in range(5):
+        assert works()
+    assert slept == []
+
+def test_delay_grows_and_resets(slept):
+    """ Test should sleep initial_delay after a failure, grow it by back_off_factor up to max_delay, and reset on success """
+    results = iter([False, False, False, False, True, True])
+
+    @backoff(initial_delay=1, back_off_factor=2, max_delay=3, verbose=False)
+    def shaky():
+        return next(results)
+
+    for _ in range(6):
+        shaky()
+    assert slept == [1, 2, 3, 3]
+
+def test_threads_back_off_separately(slept):
+    """ Test should not let one thread's failures delay another thread """
+    @backoff(initial_delay=1, verbose=False)
+    def fails():
+        return False
+
+    fails()
+    fails()
+    assert slept == [1]
+    other = []
+    def call_from_thread():
+        before = len(slept)
+        fails()
+        other.append(slept[before:])
+    thread = threading.Thread(target=call_from_thread)
+    thread.start()
+    thread.join()
+    assert other == [[]] # the new thread's first call didn't wait
+
+def test_keys_back_off_separately(slept):
+    """ Test should keep a delay per key """
+    results = {"a": False, "b": True}
+
+    @backoff(initial_delay=1, key=lambda name: name, verbose=False)
+    def fetch(name):
+        return results[name]
+
+    fetch("a")
+    fetch("b")
+    assert slept == []
+    fetch("a")
+    assert slept == [1]
+    fetch("b")
+    assert slept == [1]
+
+def test_async_awaits(monkeypatch, slept):
+    """ Test should await asyncio.sleep (never the blocking sleep) and keep a delay per task """
+    awaited = []
+    async def fake_sleep(delay):
+        awaited.append(delay)
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    @backoff(initial_delay=1, verbose=False)
+    async def fails():
+        return False
+
+    async def twice():
+        await fails()
+        await fails()
+
+    async def main():
+        await asyncio.gather(twice(), twice())
+
+    asyncio.run(main())
+    assert awaited == [1, 1]
+    assert slept == []
+
+def test_async_does_not_block_the_loop():
+    """ Test should let other tasks run while one is backing off """
+    @backoff(initial_delay=0.2, verbose=False)
+    async def fails():
+        return False
+
+    async def main():
+        await fails() # sets this task's delay
+        ticks = 0
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+        ticker = asyncio.create_task(tick())
+        await fails() # waits 0.2 seconds
+        ticker.cancel()
+        return ticks
+
+    assert asyncio.run(main()) >= 5
@@ -0,0 +1,142 @@
+"""
+File: test_hedging.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/how-to/assert.html#assertions-about-expected-exceptions
+"""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+
+import pytest
+from hedging import hedge
+
+class Service:
+    """ a fake service: the delay and result of each attempt are taken from a list, every attempt is counted """
+    def __init__(self, attempts):
+        self.attempts = list(attempts)
+        self.calls = Counter()
+        self.lock = threading.Lock()
+
+    def next_attempt(self, name):
+        with self.lock:
+            self.calls[name] += 1
+            return self.attempts.pop(0) if self.attempts else (0, True)
+
+def test_fast_hedge_wins():
+    """ Test should return the first truthy result, even when it's the hedge's """
+    service = Service([(0.5, "slow"), (0, "fast")])
+
+    @hedge(max_hedges=1, initial_delay=0.02, max_fraction=1)
+    def call(name):
+        delay, result = service.next_attempt(name)
+        time.sleep(delay)
+        return result
+
+    assert call("a") == "fast"
+    assert service.calls["a"] == 2
+    assert call.stats.summary()["hedge_wins"] == 1
+
+def test_fast_first_attempt_needs_no_hedge():
+    """ Test should not hedge calls faster than the threshold """
+    service = Service([])
+
+    @hedge(initial_delay=0.5, max_fraction=1)
+    def call(name):
+        return service.next_attempt(name)[1]
+
+    assert call("a") is True
+    assert service.calls["a"] == 1
+    assert call.stats.summary()["hedges"] == 0
+
+def test_max_hedges_per_call():
+    """ Test should start at most max_hedges extra attempts per call """
+    service = Service([(0.1, False)] * 10)
+
+    @hedge(max_hedges=2, initial_delay=0.01, max_fraction=3) # room for more than one hedge per call
+    def call(name):
+        delay, result = service.next_attempt(name)
+        time.sleep(delay)
+        return result
+
+    assert call("a") is False # every attempt's result was falsy, the last one is returned
+    assert service.calls["a"] == 3
+
+def test_max_fraction_of_traffic():
+    """ Test should not hedge past max_fraction of the calls """
+    service = Service([(0.05, True)] * 20)
+
+    @hedge(max_hedges=1, initial_delay=0.01, max_fraction=0.25)
+    def call(name):
+        delay, result = service.next_attempt(name)
+        time.sleep(delay)
+        return result
+
+    for number in range(8):
+        call(number)
+    assert call.stats.summary()["hedges"] == 2
+    assert sum(service.calls.values()) == 10
+
+def test_refused_hedge_is_not_started_later():
+    """ Test should not hedge a call later once its hedge was refused (even if other calls make room) """
+    service = Service([(0.3, True)])
+
+    @hedge(max_hedges=1, initial_delay=0.02, max_fraction=0.5)
+    def call(name):
+        delay, result = service.next_attempt(name)
+        time.sleep(delay)
+        return result
+
+    slow = threading.Thread(target=call, args=("slow",))
+    slow.start()
+    time.sleep(0.05) # the slow call's hedge is refused (1 hedge would be 100% of 1 call)
+    for number in range(4):
+        call(number) # fast calls, now a hedge would fit in 50%
+    slow.join()
+    assert service.calls["slow"] == 1
+    assert call.stats.summary()["hedges"] == 0
+
+def test_all_attempts_fail():
+    """ Test should re-raise the error when no attempt succeeds """
+    attempts = Counter()
+
+    @hedge(max_hedges=1, initial_delay=0.01, max_fraction=1)
+    def call():
+        attempts["call"] += 1
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        call()
+    assert attempts["call"] == 2
+    assert call.stats.summary()["failures"] == 1
+
+def test_async_hedge():
+    """ Test should hedge async functions with tasks and cancel the losing attempt """
+    started, cancelled = [], []
+
+    @hedge(max_hedges=1, initial_delay=0.02, max_fraction=1)
+    async def call():
+        started.append(len(started))
+        try:
+            await asyncio.sleep(0.5 if len(started) == 1 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return len(started)
+
+    assert asyncio.run(call()) == 2
+    assert started == [0, 1]
+    assert cancelled == [True]
+    assert call.stats.summary()["hedge_wins"] == 1
+
+def test_async_all_attempts_fail():
+    """ Test should re-raise the error of failed async attempts """
+    @hedge(max_hedges=1, initial_delay=0.01, max_fraction=1)
+    async def call():
+        raise TimeoutError("slow")
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(call())
@@ -0,0 +1,168 @@
+"""
+File: test_retry_policy.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/how-to/assert.html#assertions-about-expected-exceptions
+    - asyncio: cancelling a task
+        - https://docs.python.org/3/library/asyncio-task.html#asyncio.Task.cancel
+"""
+
+import asyncio
+import json
+
+import pytest
+from call_metrics import MetricsRegistry
+from retry_policy import CircuitBreaker, CircuitOpenError, RetryBudget, RetryBudgetExhausted
+from solis_decorator import backoff
+
+class FakeClock:
+    """ a clock that only moves when told to """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+
+def test_breaker_opens_after_threshold(breaker):
+    """ Test should open after failure_threshold failures in a row and reject calls """
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+
+def test_breaker_half_open_trial(breaker, clock):
+    """ Test should let one trial call through after recovery_timeout, and close on its success """
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_breaker_trial_failure_reopens(breaker, clock):
+    """ Test should open again when the trial call fails """
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+def test_breaker_release(breaker, clock):
+    """ Test should give a trial call back """
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+def test_breaker_half_open_times_out(breaker, clock):
+    """ Test should let a new trial call through when the last one never reported back """
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+    clock.now = 15
+    assert not breaker.allow()
+    clock.now = 20
+    assert breaker.allow()
+
+def test_budget(clock):
+    """ Test should earn ratio retries per call and min_per_second retries per second, capped at max_balance """
+    budget = RetryBudget(ratio=0.5, min_per_second=1, max_balance=2, clock=clock)
+    assert budget.try_retry() and budget.try_retry()
+    assert not budget.try_retry()
+    budget.record_call()
+    budget.record_call()
+    assert budget.try_retry()
+    clock.now = 100
+    assert budget.stats()["balance"] == 2
+    assert budget.stats()["rejected"] == 1
+
+def test_budget_rejection_gives_back_trial(breaker, clock):
+    """ Test should not leave the breaker stuck half-open when the budget rejects its trial call """
+    budget = RetryBudget(ratio=0, min_per_second=0, max_balance=0, clock=clock)
+    calls = []
+
+    @backoff(breaker=breaker, budget=budget, verbose=False)
+    def fails():
+        calls.append(1)
+        return False
+
+    fails()
+    breaker.record_failure() # opens it
+    clock.now = 10
+    with pytest.raises(RetryBudgetExhausted):
+        fails()
+    assert len(calls) == 1
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+def test_cancelled_call_gives_back_trial(breaker, clock):
+    """ Test should give the trial call back when an async attempt is cancelled """
+    @backoff(breaker=breaker, verbose=False)
+    async def hangs():
+        await asyncio.sleep(60)
+        return True
+
+    async def cancel_trial():
+        task = asyncio.create_task(hangs())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+    asyncio.run(cancel_trial())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+def test_open_circuit_fails_fast(breaker):
+    """ Test should raise CircuitOpenError without calling the function """
+    calls = []
+
+    @backoff(breaker=breaker, verbose=False)
+    def works():
+        calls.append(1)
+        return True
+
+    breaker.record_failure()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        works()
+    assert calls == []
+
+def test_metrics_registry():
+    """ Test should record attempts, retries and sleep time into the registry (only while it's enabled) """
+    registry = MetricsRegistry()
+    results = iter([False, True, False, True])
+
+    @backoff(initial_delay=0, max_retries=1, verbose=False, metrics=registry)
+    def shaky():
+        return next(results)
+
+    registry.enable()
+    assert shaky()
+    registry.disable()
+    shaky()
+    snapshot = registry.snapshot()[shaky.metrics.name]
+    assert (snapshot["calls"], snapshot["errors"], snapshot["retries"]) == (2, 1, 1)
+    assert json.loads(registry.to_json())[shaky.metrics.name]["calls"] == 2
+    assert "calls_retries_total" in registry.to_prometheus()
@@ -0,0 +1,231 @@
+"""
+File: bench_bank_account.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - time module: perf_counter_ns
+        https://docs.python.org/3/library/time.html#time.perf_counter_ns
+    - tracemalloc module: memory allocated by a piece of code
+        https://docs.python.org/3/library/tracemalloc.html
+    - inspect.unwrap: the undecorated function behind functools.wraps
+        https://docs.python.org/3/library/inspect.html#inspect.unwrap
+    - argparse module: command line options
+        https://docs.python.org/3/library/argparse.html
+
+Benchmarks the bank_account package: deposit/withdraw throughput, decorator overhead (the same calls
+without the decorators), to_json/from_json latency as the history grows, and memory per transaction.
+Each case is timed over repeated trials (after warmup runs, with its setup left out of the timing)
+and the median/p95 times are written to a json file so runs can be compared against a baseline.
+baseline.json was recorded on one machine, record a new one before comparing on another.
+
+Use:
+    python benchmarks/bench_bank_account.py --output benchmarks/baseline.json
+    python benchmarks/bench_bank_account.py --compare benchmarks/baseline.json
+"""
+from inspect import unwrap
+from pathlib import Path
+from statistics import median, quantiles
+from tempfile import TemporaryDirectory
+from time import perf_counter_ns
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from bank_account import BankAccount
+
+DEFAULT_SIZES = [100, 1_000, 10_000]
+TEMPORARY = TemporaryDirectory()
+JSON_FILE = Path(TEMPORARY.name) / "account.json"
+
+# undecorated versions of the transactions (to measure what the decorators cost)
+raw_deposit = unwrap(BankAccount.deposit)
+raw_withdraw = unwrap(BankAccount.withdraw)
+
+def account_with_history(n:int) -> BankAccount:
+    """Return an account with n transactions."""
+    account = BankAccount(12345, "Karina", 0)
+    account.apply_batch([("deposit", 2), ("withdraw", 1)] * (n // 2) + [("deposit", 2)] * (n % 2))
+    return account
+
+def setup_deposit(n:int) -> callable:
+    account = BankAccount(12345, "Karina", 0)
+    def work():
+        for _ in range(n):
+            account.deposit(1)
+    return work
+
+def setup_deposit_undecorated(n:int) -> callable:
+    account = BankAccount(12345, "Karina", 0)
+    def work():
+        for _ in range(n):
+            raw_deposit(account, 1)
+    return work
+
+def setup_withdraw(n:int) -> callable:
+    account = BankAccount(12345, "Karina", n)
+    def work():
+        for _ in range(n):
+            account.withdraw(1)
+    return work
+
+def setup_withdraw_undecorated(n:int) -> callable:
+    account = BankAccount(12345, "Karina", n)
+    def work():
+        for _ in range(n):
+            raw_withdraw(account, 1)
+    return work
+
+def setup_apply_batch(n:int) -> callable:
+    account = BankAccount(12345, "Karina", 0)
+    ops = [("deposit", 1)] * n
+    return lambda: account.apply_batch(ops)
+
+def setup_to_json(n:int) -> callable:
+    account = account_with_history(n)
+    return lambda: account.to_json(JSON_FILE)
+
+def setup_from_json(n:int) -> callable:
+    account_with_history(n).to_json(JSON_FILE)
+    return lambda: BankAccount().from_json(JSON_FILE)
+
+# Benchmark Cases (name -> function that sets up n operations and returns the work to time)
+CASES = {
+    "deposit": setup_deposit,
+    "deposit_undecorated": setup_deposit_undecorated,
+    "withdraw": setup_withdraw,
+    "withdraw_undecorated": setup_withdraw_undecorated,
+    "apply_batch": setup_apply_batch,
+    "to_json": setup_to_json,
+    "from_json": setup_from_json,
+}
+
+def time_case(setup:callable, n:int, trials:int, warmup:int) -> dict:
+    """
+    Times one case for one n.
+
+    Args:
+        setup (callable): Called with n before every run (untimed), returns the work to time.
+        n (int): The size passed to setup.
+        trials (int): The amount of timed runs.
+        warmup (int): The amount of untimed runs done first.
+
+    Returns:
+        result (dict): The median, p95 and min time (in nanoseconds) of the trials, and the median per operation.
+    """
+    for _ in range(warmup):
+        setup(n)()
+
+    times = []
+    for _ in range(trials):
+        work = setup(n)
+        start = perf_counter_ns()
+        work()
+        times.append(perf_counter_ns() - start)
+
+    # quantiles needs at least 2 points, a single trial is its own p95
+    p95 = quantiles(times, n=20, method="inclusive")[18] if len(times) > 1 else times[0]
+    return {
+        "n": n,
+        "trials": trials,
+        "median_ns": median(times),
+        "p95_ns": p95,
+        "min_ns": min(times),
+        "per_op_ns": median(times) / n,
+    }
+
+def memory_per_transaction(n:int) -> dict:
+    """Return the bytes allocated (and kept) per transaction while making n deposits."""
+    account = BankAccount(12345, "Karina", 0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(n):
+        account.deposit(1)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {"case": "memory", "n": n, "bytes_per_transaction": (after - before) / n}
+
+def run(cases:list[str], sizes:list[int], trials:int, warmup:int) -> dict:
+    """
+    Runs every case for every n in sizes, then measures the memory per transaction.
+
+    Returns:
+        report (dict): Information about the run and a list of results (one per case/n).
+    """
+    results = []
+    for name in cases:
+        for n in sizes:
+            result = {"case": name, **time_case(CASES[name], n, trials, warmup)}
+            print(f"{name:>21} n={n:<8} median={result['median_ns'] / 1e6:10.3f} ms  p95={result['p95_ns'] / 1e6:10.3f} ms  per op={result['per_op_ns']:8.0f} ns")
+            results.append(result)
+    memory = [memory_per_transaction(n) for n in sizes]
+    for result in memory:
+        print(f"{'memory':>21} n={result['n']:<8} {result['bytes_per_transaction']:.1f} bytes/transaction")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "trials": trials,
+        "warmup": warmup,
+        "results": results,
+        "memory": memory,
+    }
+
+def compare(report:dict, baseline:dict, threshold:float) -> list[str]:
+    """
+    Compares the medians (and memory) of a run against a baseline run.
+
+    Args:
+        report (dict): The current run.
+        baseline (dict): The run being compared against.
+        threshold (float): How many times worse than the baseline a case can be before it counts as a regression.
+
+    Returns:
+        regressions (list[str]): A description of every case/n that got worse than the threshold.
+    """
+    old = {(result["case"], result["n"]): result["median_ns"] for result in baseline["results"]}
+    old.update({("memory", result["n"]): result["bytes_per_transaction"] for result in baseline.get("memory", [])})
+    new = {(result["case"], result["n"]): result["median_ns"] for result in report["results"]}
+    new.update({("memory", result["n"]): result["bytes_per_transaction"] for result in report["memory"]})
+    regressions = []
+    for key, value in new.items():
+        if key not in old or old[key] <= 0:
+            continue
+        ratio = value / old[key]
+        if ratio > threshold:
+            regressions.append(f"{key[0]} n={key[1]}: {ratio:.2f}x {'more memory' if key[0] == 'memory' else 'slower'} than baseline")
+    return regressions
+
+def main() -> None:
+    """
+    handles command line options, runs the benchmarks, and writes/compares the json results
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the bank_account package.")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--trials", type=int, default=15)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--output", help="json file to write the results to")
+    parser.add_argument("--compare", help="json file from an earlier run to check for regressions against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="allowed slowdown ratio before a regression is flagged")
+    args = parser.parse_args()
+
+    report = run(args.cases, args.sizes, args.trials, args.warmup)
+
+    if args.output:
+        with open(args.output, "w") as json_file:
+            json.dump(report, json_file, indent=4)
+
+    if args.compare:
+        with open(args.compare, "r") as json_file:
+            baseline = json.load(json_file)
+        regressions = compare(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            sys.exit(1)
+
+#for command line
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+File: bench_money.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - time module: perf_counter_ns
+        https://docs.python.org/3/library/time.html#time.perf_counter_ns
+    - decimal module
+        https://docs.python.org/3/library/decimal.html
+    - argparse module: command line options
+        https://docs.python.org/3/library/argparse.html
+
+Compares keeping a balance as float dollars, decimal.Decimal, Money and plain int cents: the time to
+add up n amounts, the time to format n balances, and how far each total drifts from the exact one.
+
+Use:
+    python benchmarks/bench_money.py --n 1000000
+"""
+from decimal import Decimal
+from pathlib import Path
+from random import Random
+from statistics import median
+from time import perf_counter_ns
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from money import Money, format_money
+
+def amounts(n:int) -> list[int]:
+    """Return n random amounts in cents."""
+    rng = Random(0)
+    return [rng.randint(1, 10_000) for _ in range(n)]
+
+# Representations (name -> (convert cents to it, format it))
+KINDS = {
+    "float": (lambda cents: cents / 100, lambda value: f"{value:.2f}"),
+    "Decimal": (lambda cents: Decimal(cents).scaleb(-2), lambda value: f"{value:.2f}"),
+    "Money": (Money, str),
+    "int cents": (lambda cents: cents, format_money),
+}
+
+def total(values:list):
+    """Add values up one at a time (the way a balance is updated)."""
+    balance = values[0] - values[0]
+    for value in values:
+        balance += value
+    return balance
+
+def best_of(trials:int, work:callable) -> int:
+    """Return the median nanoseconds of trials runs of work."""
+    times = []
+    for _ in range(trials):
+        start = perf_counter_ns()
+        work()
+        times.append(perf_counter_ns() - start)
+    return median(times)
+
+def main() -> None:
+    """
+    runs the comparison and prints ns per operation and drift for each representation
+    """
+    parser = argparse.ArgumentParser(description="Compare float, Decimal, Money and int cents balances.")
+    parser.add_argument("--n", type=int, default=200_000, help="amounts added up per trial")
+    parser.add_argument("--trials", type=int, default=5)
+    args = parser.parse_args()
+
+    cents = amounts(args.n)
+    exact = sum(cents)
+    print(f"{'':>10} {'add ns/op':>10} {'format ns/op':>13} {'drift (cents)':>14}")
+    for name, (convert, format_value) in KINDS.items():
+        values = [convert(amount) for amount in cents]
+        add = best_of(args.trials, lambda: total(values)) / args.n
+        result = total(values)
+        formatted = values[:10_000]
+        fmt = best_of(args.trials, lambda: [format_value(value) for value in formatted]) / len(formatted)
+        drift = exact - (result if name == "int cents" else result * 100)
+        print(f"{name:>10} {add:10.1f} {fmt:13.1f} {float(drift):14.6g}")
+
+if __name__ == "__main__":
+    main()
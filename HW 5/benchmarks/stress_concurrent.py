@@ -0,0 +1,80 @@
+"""
+File: stress_concurrent.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - concurrent.futures module: ThreadPoolExecutor
+        https://docs.python.org/3/library/concurrent.futures.html
+    - argparse module: command line options
+        https://docs.python.org/3/library/argparse.html
+
+Multi-thread stress test of ConcurrentBankAccount: worker threads make random deposits, withdrawals
+and transfers between accounts, then the ops/sec is reported and the totals are checked
+(no account below 0, and money is only created/destroyed by deposits/withdrawals).
+
+Use:
+    python benchmarks/stress_concurrent.py --threads 1 2 4 8 --accounts 1000 --ops 200000
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from random import Random
+from time import perf_counter
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from concurrent_account import ConcurrentBankAccount, transfer
+from money import to_cents
+
+def worker(accounts:list, ops:int, seed:int) -> int:
+    """Make ops random operations, return the net cents deposited (deposits minus withdrawals)."""
+    rng = Random(seed)
+    net = 0
+    for _ in range(ops):
+        kind = rng.random()
+        amount = rng.randint(1, 100)
+        account = rng.choice(accounts)
+        try:
+            if kind < 0.3:
+                account.deposit(amount)
+                net += to_cents(amount)
+            elif kind < 0.6:
+                account.withdraw(amount)
+                net -= to_cents(amount)
+            else:
+                other = rng.choice(accounts)
+                if other is not account:
+                    transfer(account, other, amount)
+        except ValueError:
+            pass # insufficient funds
+    return net
+
+def run(threads:int, accounts:int, ops:int, balance:int) -> dict:
+    """Run one stress test, return its ops/sec (raises AssertionError if the totals are wrong)."""
+    bank = [ConcurrentBankAccount(number, f"owner-{number}", balance) for number in range(accounts)]
+    start = perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        nets = list(pool.map(worker, [bank] * threads, [ops // threads] * threads, range(threads)))
+    seconds = perf_counter() - start
+    total = sum(account.cents for account in bank)
+    assert total == to_cents(balance) * accounts + sum(nets), "money was created or destroyed"
+    assert all(account.balance >= 0 for account in bank), "an account was overdrawn"
+    return {"threads": threads, "ops": ops // threads * threads, "seconds": seconds, "ops_per_sec": ops // threads * threads / seconds}
+
+def main() -> None:
+    """
+    runs the stress test for every thread count and prints the throughput
+    """
+    parser = argparse.ArgumentParser(description="Stress test ConcurrentBankAccount from many threads.")
+    parser.add_argument("--threads", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--accounts", type=int, default=1_000)
+    parser.add_argument("--ops", type=int, default=200_000, help="operations per run (split between the threads)")
+    parser.add_argument("--balance", type=int, default=500, help="starting balance of every account")
+    args = parser.parse_args()
+
+    for threads in args.threads:
+        result = run(threads, args.accounts, args.ops, args.balance)
+        print(f"{result['threads']:>3} threads: {result['ops_per_sec']:>12,.0f} ops/sec ({result['ops']:,} ops in {result['seconds']:.2f}s)")
+
+if __name__ == "__main__":
+    main()
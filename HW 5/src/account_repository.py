@@ -0,0 +1,193 @@
+"""
+File: account_repository.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - __slots__: smaller objects without a __dict__
+        - https://docs.python.org/3/reference/datamodel.html#slots
+    - bisect module: range scans over a sorted list
+        - https://docs.python.org/3/library/bisect.html
+    - zlib.crc32: a hash that's the same in every process (hash() of a str changes between runs)
+        - https://docs.python.org/3/library/zlib.html#zlib.crc32
+
+Many accounts kept in memory as small records, spread over shards by account number, with an index
+by owner and a sorted index by balance (kept sorted as records change, not rebuilt). Saved in bulk as one json file per shard instead of
+one file per account, and a single account can be loaded by reading just its shard's file.
+"""
+import json
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from zlib import crc32
+
+from bank_account import BankAccount
+from money import Money
+
+SHARDS = 16
+MANIFEST = "manifest.json"
+
+def shard_of(account_number, shards:int) -> int:
+    """Return the index of the shard an account number belongs to (the same in every process)."""
+    return crc32(str(account_number).encode()) % shards
+
+def shard_file(directory:Path, index:int) -> Path:
+    """Return the path of a saved shard."""
+    return Path(directory) / f"shard-{index:03d}.json"
+
+# Account Record Class
+class AccountRecord:
+    """The balance (in cents) and owner of one account, without its history."""
+
+    __slots__ = ("account_number", "owner", "cents")
+
+    def __init__(self, account_number, owner:str, cents:int):
+        """Initialize an AccountRecord."""
+        self.account_number = account_number
+        self.owner = owner
+        self.cents = cents
+
+    def __repr__(self):
+        return f"AccountRecord({self.account_number!r}, {self.owner!r}, {self.cents})"
+
+    def __eq__(self, other):
+        if not isinstance(other, AccountRecord):
+            return NotImplemented
+        return (self.account_number, self.owner, self.cents) == (other.account_number, other.owner, other.cents)
+
+    @classmethod
+    def from_account(cls, account:BankAccount) -> "AccountRecord":
+        """Build a record from a BankAccount."""
+        return cls(account.account_number, account.owner, account.cents)
+
+    def to_account(self) -> BankAccount:
+        """Build a BankAccount (with an empty history) from the record."""
+        return BankAccount(self.account_number, self.owner, Money(self.cents))
+
+# Account Repository Class
+class AccountRepository:
+    """Accounts sharded by crc32 of account number, with lookups by account number, owner and balance range."""
+
+    def __init__(self, shards:int = SHARDS):
+        """Initialize an empty AccountRepository."""
+        if shards < 1:
+            raise ValueError(f"Cannot use {shards} shards.")
+        self.shards = [{} for _ in range(shards)] # account number -> AccountRecord
+        self.owners = {} # owner -> set of account numbers
+        self._balances = [] # every balance in cents, sorted (what bisect searches)
+        self._numbers = [] # the account number of each balance in _balances
+
+    def __len__(self):
+        """Return the number of accounts."""
+        return sum(len(shard) for shard in self.shards)
+
+    def __contains__(self, account_number):
+        return account_number in self._shard(account_number)
+
+    def __iter__(self):
+        """Iterate over every record (shard by shard)."""
+        for shard in self.shards:
+            yield from shard.values()
+
+    def _shard(self, account_number) -> dict:
+        """Return the shard an account number belongs to."""
+        return self.shards[shard_of(account_number, len(self.shards))]
+
+    def get(self, account_number) -> AccountRecord:
+        """Return the record of an account number (raises KeyError if there isn't one)."""
+        return self._shard(account_number)[account_number]
+
+    def put(self, record:AccountRecord):
+        """Add a record, or replace the record with the same account number."""
+        shard = self._shard(record.account_number)
+        old = shard.get(record.account_number)
+        if old is not None:
+            self._unindex_balance(old.account_number, old.cents)
+            if old.owner != record.owner:
+                self._unindex_owner(old)
+        shard[record.account_number] = record
+        self.owners.setdefault(record.owner, set()).add(record.account_number)
+        self._index_balance(record.account_number, record.cents)
+
+    def remove(self, account_number) -> AccountRecord:
+        """Remove and return the record of an account number (raises KeyError if there isn't one)."""
+        record = self._shard(account_number).pop(account_number)
+        self._unindex_owner(record)
+        self._unindex_balance(record.account_number, record.cents)
+        return record
+
+    def _unindex_owner(self, record:AccountRecord):
+        """Remove a record from the owner index."""
+        numbers = self.owners[record.owner]
+        numbers.discard(record.account_number)
+        if not numbers:
+            del self.owners[record.owner]
+
+    def _index_balance(self, account_number, cents:int):
+        """Add a balance to the balance index (after any equal balances)."""
+        index = bisect_right(self._balances, cents)
+        self._balances.insert(index, cents)
+        self._numbers.insert(index, account_number)
+
+    def _unindex_balance(self, account_number, cents:int):
+        """Remove a balance from the balance index."""
+        index = bisect_left(self._balances, cents)
+        while self._numbers[index] != account_number: # only the equal balances are scanned
+            index += 1
+        del self._balances[index]
+        del self._numbers[index]
+
+    def set_balance(self, account_number, cents:int):
+        """Change the balance (in cents) of an account (change it here, not on the record, so the index follows)."""
+        record = self.get(account_number)
+        self._unindex_balance(account_number, record.cents)
+        record.cents = cents
+        self._index_balance(account_number, cents)
+
+    def find_by_owner(self, owner:str) -> list[AccountRecord]:
+        """Return every record of an owner."""
+        return [self.get(number) for number in self.owners.get(owner, ())]
+
+    def balance_range(self, low:int, high:int) -> list[AccountRecord]:
+        """Return the records with low <= balance (in cents) <= high, lowest balance first."""
+        start = bisect_left(self._balances, low)
+        end = bisect_right(self._balances, high)
+        return [self.get(number) for number in self._numbers[start:end]]
+
+    def add_accounts(self, accounts):
+        """Add the records of many BankAccounts."""
+        for account in accounts:
+            self.put(AccountRecord.from_account(account))
+
+    def bulk_save(self, directory):
+        """Write every shard to its own json file of [account number, owner, cents] rows."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for index, shard in enumerate(self.shards):
+            rows = [[record.account_number, record.owner, record.cents] for record in shard.values()]
+            shard_file(directory, index).write_text(json.dumps(rows, separators=(",", ":")))
+        (directory / MANIFEST).write_text(json.dumps({"shards": len(self.shards)}))
+
+    @classmethod
+    def bulk_load(cls, directory, shards:int = None) -> "AccountRepository":
+        """Read a repository written by bulk_save (records are re-sharded if shards is different)."""
+        directory = Path(directory)
+        saved = json.loads((directory / MANIFEST).read_text())["shards"]
+        repository = cls(shards or saved)
+        for index in range(saved):
+            for account_number, owner, cents in json.loads(shard_file(directory, index).read_text()):
+                repository._shard(account_number)[account_number] = AccountRecord(account_number, owner, cents)
+                repository.owners.setdefault(owner, set()).add(account_number)
+        # the balance index is sorted once at the end instead of inserting into it record by record
+        by_balance = sorted(repository, key=lambda record: record.cents)
+        repository._balances = [record.cents for record in by_balance]
+        repository._numbers = [record.account_number for record in by_balance]
+        return repository
+
+    @staticmethod
+    def load_account(directory, account_number) -> AccountRecord:
+        """Read one account saved by bulk_save, only its shard's file is read (raises KeyError if it isn't there)."""
+        directory = Path(directory)
+        saved = json.loads((directory / MANIFEST).read_text())["shards"]
+        for number, owner, cents in json.loads(shard_file(directory, shard_of(account_number, saved)).read_text()):
+            if number == account_number:
+                return AccountRecord(number, owner, cents)
+        raise KeyError(account_number)
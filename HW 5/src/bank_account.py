@@ -4,34 +4,69 @@ Author: Karina Solis
 Date: 3/10/25
 Resources:
     - Wolf Paulus: Python Syntax, BankAccount Outline, midterm.py
+    - call_metrics.py: call counts, latency histograms and errors (off by default)
+    - ledger.py: array backed transaction history
+    - money.py: exact integer cents balance
 """
 import functools
 import json
+from array import array
+from time import perf_counter
+
+from call_metrics import REGISTRY
+from ledger import OP_CODES, WITHDRAW, Ledger
+from money import INT64_MAX, Money, checked, to_cents
 
 # Decorators (from Midterm)
 def log_transaction(func:callable):
-    """Logs any transaction that changes the account balance"""
+    """
+    Logs any transaction that changes the account balance (to the ledger, the strings are made when they're shown).
+    The amount is converted to cents once here, func gets the cents. The transaction is logged before func
+    changes the balance, so if logging fails (ex. a durable ledger's write) nothing changes.
+    """
+    op = OP_CODES[func.__name__]
     @functools.wraps(func)
     def wrapper(self, amount:float):
-        result = func(self, amount)
-        self.transactions.append(f"{func.__name__}: ${amount}")
-        return result
+        cents = to_cents(amount)
+        self.ledger.append(op, cents)
+        return func(self, cents)
     return wrapper
 
 def validate_amount(func:callable):
-    """ This decorator will make sure that the amount is positive and that the account has the sufficient balance"""
+    """ This decorator will make sure that the amount is at least a cent, that the account has the sufficient balance and that a deposit still fits in 64 bits"""
+    is_withdraw = func.__name__ == "withdraw"
     @functools.wraps(func)
     def wrapper(self, amount:float):
         if (amount < 0):
             raise ValueError(f"Cannot {func.__name__} negative amount.")
-        elif (amount == 0):
+        cents = to_cents(amount)
+        if (cents == 0): # ex. 0.004 rounds to 0 cents
             raise ValueError(f"Cannot {func.__name__} 0")
-        elif (func.__name__ == "withdraw"):
-            if (amount > self.balance):
+        elif (is_withdraw):
+            if (cents > self._balance):
                 raise ValueError(f"Cannot withdraw {amount}. Insufficient funds. Balance: ${self.balance}")
+        elif (cents > INT64_MAX - self._balance):
+            raise OverflowError(f"Cannot deposit {amount}. The balance would not fit in 64 bits.")
         return func(self, amount)
     return wrapper
 
+def record_metrics(func:callable):
+    """Records the calls, latency and errors of a transaction in call_metrics.REGISTRY (only while it's enabled)"""
+    call_metrics = REGISTRY.get(func.__qualname__)
+    @functools.wraps(func)
+    def wrapper(self, amount:float):
+        if not call_metrics.enabled:
+            return func(self, amount)
+        start = perf_counter()
+        try:
+            result = func(self, amount)
+        except Exception:
+            call_metrics.observe(perf_counter() - start, True)
+            raise
+        call_metrics.observe(perf_counter() - start)
+        return result
+    return wrapper
+
 # Bank Account Class
 class BankAccount:
     """A simple BankAccount class with methods to deposit, withdraw, and get_balance."""
@@ -40,11 +75,42 @@ class BankAccount:
         """Initialize a BankAccount with an owner and an optional starting balance."""
         self.account_number = account_number
         self.owner = owner
-        self.transactions = []
         if (balance < 0):
             raise ValueError("Cannot Initialize Account with negative balance.")
+        self.ledger = Ledger(to_cents(balance))
         self.balance = balance
 
+    @property
+    def balance(self) -> int | float:
+        """The current balance in plain dollars (int when there are no cents), anything assigned to it is read as dollars."""
+        dollars, rest = divmod(self._balance, 100)
+        return dollars if rest == 0 else self._balance / 100
+
+    @balance.setter
+    def balance(self, balance):
+        self._balance = checked(to_cents(balance)) # kept as plain int cents
+
+    @property
+    def cents(self) -> int:
+        """The current balance in whole cents."""
+        return self._balance
+
+    @property
+    def money(self) -> Money:
+        """The current balance as exact Money."""
+        return Money(self._balance)
+
+    @property
+    def transactions(self) -> list[str]:
+        """The transactions as legacy strings (ex. "deposit: $100"), rendered from the ledger."""
+        return self.ledger.lines()
+
+    @transactions.setter
+    def transactions(self, transactions:list[str]):
+        """Replaces the history, the opening balance is worked out from the current balance."""
+        self.ledger = Ledger.from_lines(transactions)
+        self.ledger.opening = self._balance - self.ledger.net
+
     def from_json(self, filename:str) -> dict | None:
         """Deserialize a BankAccount object from a json file."""
         with open(filename, "r") as file:
@@ -52,32 +118,78 @@ class BankAccount:
             file.close()
         self.account_number = data["account_number"]
         self.owner = data["owner"]
-        self.balance = int(data["balance"])
+        self.balance = data["balance"]
         self.transactions = data["transactions"]
 
     def to_json(self, filename:str):
         """Serialize a BankAccount object to a json file."""
         with open(filename, "w") as file:
-            file.write(json.dumps(self.__dict__))
+            file.write(json.dumps({
+                "account_number": self.account_number,
+                "owner": self.owner,
+                "balance": self.balance,
+                "transactions": self.transactions,
+            }))
             file.close()
 
+    @record_metrics
     @validate_amount
     @log_transaction
     def deposit(self, amount:float):
         """Deposit a positive amount to the account."""
-        self.balance += amount
+        self._balance += amount # in cents (log_transaction converted it)
 
+    @record_metrics
     @validate_amount
     @log_transaction
     def withdraw(self, amount:float):
         """Withdraw a positive amount if sufficient balance exists."""
-        self.balance -= amount
+        self._balance -= amount # in cents (log_transaction converted it)
         
+    def apply_batch(self, ops) -> int:
+        """
+        Apply many ("deposit" | "withdraw", amount) operations in order, all of them or none of them.
+        Everything is validated in one pass first (including the running balance for withdrawals),
+        then the balance is set once and the ledger is extended in bulk. Returns the amount applied.
+        """
+        codes = array("b")
+        cents = array("q")
+        balance = self._balance
+        for name, amount in ops:
+            code = OP_CODES.get(name)
+            if (code is None):
+                raise ValueError(f"Cannot apply unknown operation {name!r}.")
+            elif (amount < 0):
+                raise ValueError(f"Cannot {name} negative amount.")
+            amount_cents = to_cents(amount)
+            if (amount_cents == 0):
+                raise ValueError(f"Cannot {name} 0")
+            elif (code == WITHDRAW):
+                if (amount_cents > balance):
+                    raise ValueError(f"Cannot withdraw {amount}. Insufficient funds. Balance: ${Money(balance)}")
+                balance -= amount_cents
+            else:
+                balance += amount_cents
+            codes.append(code)
+            cents.append(amount_cents)
+        checked(balance) # raises OverflowError before anything changes
+        self.ledger.extend(codes, cents)
+        self._balance = balance
+        return len(codes)
+
     def get_balance(self):
         """Return the current balance."""
         return self.balance
+
+    def balance_at(self, time_ns:int) -> Money:
+        """Return the balance after every transaction made at or before time_ns (a time.time_ns timestamp)."""
+        return Money(self.ledger.balance_at(time_ns))
+
+    def net_flow(self, start_ns:int, end_ns:int) -> Money:
+        """Return the deposits minus the withdrawals made after start_ns and at or before end_ns."""
+        return Money(self.ledger.net_flow(start_ns, end_ns))
         
     def show_transactions(self):
         """Prints all account transactions."""
-        for transaction in self.transactions:
-            print(f"{transaction}")
\ No newline at end of file
+        for index in range(len(self.ledger)):
+            print(self.ledger.render(index))
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+File: concurrent_account.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - threading module: Lock
+        - https://docs.python.org/3/library/threading.html#lock-objects
+    - Lock striping / lock ordering (avoiding deadlock)
+        - https://en.wikipedia.org/wiki/Dining_philosophers_problem#Resource_hierarchy_solution
+"""
+from threading import Lock
+
+from bank_account import BankAccount
+from money import INT64_MAX, to_cents
+
+# Amount of locks shared by every account (accounts are spread over them by account number)
+STRIPES = 64
+_stripes = tuple(Lock() for _ in range(STRIPES))
+
+def stripe_of(account_number) -> int:
+    """Return the index of the lock an account number uses."""
+    return hash(account_number) % STRIPES
+
+# Concurrent Bank Account Class
+class ConcurrentBankAccount(BankAccount):
+    """
+    A BankAccount that can be shared between threads: every change (and its insufficient funds check)
+    happens while holding the account's lock stripe, so concurrent withdrawals can't overdraw.
+    """
+
+    def __init__(self, account_number=0, owner="", balance=0):
+        """Initialize a ConcurrentBankAccount, its lock stripe is picked from the account number."""
+        super().__init__(account_number, owner, balance)
+        self.stripe = stripe_of(account_number)
+        self.lock = _stripes[self.stripe]
+
+    def deposit(self, amount:float):
+        """Deposit a positive amount to the account."""
+        with self.lock:
+            BankAccount.deposit(self, amount)
+
+    def withdraw(self, amount:float):
+        """Withdraw a positive amount if sufficient balance exists."""
+        with self.lock:
+            BankAccount.withdraw(self, amount)
+
+    def apply_batch(self, ops) -> int:
+        """Apply many operations all-or-nothing, holding the lock for the whole batch."""
+        with self.lock:
+            return BankAccount.apply_batch(self, ops)
+
+    def get_balance(self):
+        """Return the current balance."""
+        with self.lock:
+            return self.balance
+
+def transfer(source:ConcurrentBankAccount, target:ConcurrentBankAccount, amount:float):
+    """
+    Move an amount from source to target atomically (either both change or neither does).
+    Both lock stripes are taken in index order, so transfers going opposite ways can't deadlock.
+    """
+    if source is target:
+        raise ValueError("Cannot transfer to the same account.")
+    first, second = sorted((source.stripe, target.stripe))
+    with _stripes[first]:
+        if second == first:
+            _transfer(source, target, amount)
+            return
+        with _stripes[second]:
+            _transfer(source, target, amount)
+
+def _transfer(source:ConcurrentBankAccount, target:ConcurrentBankAccount, amount:float):
+    """Move an amount (both locks must already be held)."""
+    # the withdrawal validates the amount and the funds, the target's room is checked before it,
+    # so nothing is taken from source when the deposit would overflow
+    if (to_cents(amount) > INT64_MAX - target._balance):
+        raise OverflowError(f"Cannot deposit {amount}. The balance would not fit in 64 bits.")
+    BankAccount.withdraw(source, amount)
+    BankAccount.deposit(target, amount)
@@ -0,0 +1,321 @@
+"""
+File: durable_account.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - Write-ahead logging, group commit
+        - https://www.postgresql.org/docs/current/wal-intro.html
+    - struct module: fixed size binary records
+        - https://docs.python.org/3/library/struct.html
+    - zlib.crc32: detecting torn/corrupt records
+        - https://docs.python.org/3/library/zlib.html#zlib.crc32
+    - os.fsync / os.replace: durable, atomic file updates
+        - https://docs.python.org/3/library/os.html#os.fsync
+    - threading.Event: a background thread that wakes up every so often (and stops on close)
+        - https://docs.python.org/3/library/threading.html#event-objects
+
+An account is a directory with a snapshot (the whole account at some point) and a write-ahead log
+(every transaction after it). Saving a transaction only appends one record to the log, and the log is
+folded into a new snapshot every so often so recovery only ever replays a short tail.
+"""
+import json
+import os
+import struct
+from array import array
+from itertools import repeat
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import monotonic
+from zlib import crc32
+
+from bank_account import BankAccount
+from ledger import Ledger
+from money import Money
+
+SNAPSHOT = "snapshot.bin"
+WAL = "wal.log"
+SNAPSHOT_MAGIC = b"BAS1"
+HEADER = struct.Struct("<I") # length of the snapshot's json header
+RECORD = struct.Struct("<QbqqI") # sequence number, op code, cents, timestamp, crc32 of the rest
+BODY = struct.Struct("<Qbqq")
+
+def fsync_directory(directory:Path):
+    """Make a rename/creation in a directory durable (not possible on every platform)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+# Write-Ahead Log Class
+class WriteAheadLog:
+    """
+    An append-only file of fixed size transaction records. Records are flushed to the OS as soon as
+    they're written (so they survive the process crashing) and made durable in groups: one fsync covers
+    every record written before it, and happens once sync_every records are waiting, on commit(), or
+    from a background thread at most sync_interval seconds after a record was written (even if nothing
+    else is written after it). sync_interval=0 fsyncs every write.
+    """
+
+    def __init__(self, path:Path, sync_every:int = 64, sync_interval:float = 0.05):
+        """Open (or create) a log for appending."""
+        self.path = Path(path)
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.file = open(self.path, "ab")
+        self.written = 0 # records written since the log was opened
+        self.durable = 0 # records fsynced since the log was opened
+        self.synced_at = monotonic()
+        self.syncs = 0
+        self._write_lock = Lock()
+        self._sync_lock = Lock()
+        self._closed = Event()
+        self._flusher = None
+        if sync_interval > 0:
+            self._flusher = Thread(target=self._flush_every_interval, name=f"wal-flusher {self.path}", daemon=True)
+            self._flusher.start()
+
+    def _flush_every_interval(self):
+        """Background thread: fsync whatever is waiting every sync_interval seconds, until the log is closed."""
+        while not self._closed.wait(self.sync_interval):
+            if self.written > self.durable:
+                self.commit()
+
+    def append(self, seq:int, op:int, cents:int, time_ns:int):
+        """Write one record (durable after the next sync, at most sync_interval seconds from now)."""
+        self.extend([(seq, op, cents, time_ns)])
+
+    def extend(self, records):
+        """Write many (seq, op, cents, time_ns) records in one write, then sync if the group is full."""
+        data = bytearray()
+        for record in records:
+            body = BODY.pack(*record)
+            data += body
+            data += struct.pack("<I", crc32(body))
+        with self._write_lock:
+            self.file.write(data)
+            self.file.flush()
+            self.written += len(data) // RECORD.size
+            waiting = self.written - self.durable
+        if waiting >= self.sync_every or monotonic() - self.synced_at >= self.sync_interval:
+            self.commit()
+
+    def commit(self):
+        """Make every record written so far durable (threads that commit together share one fsync)."""
+        with self._write_lock:
+            target = self.written
+        with self._sync_lock:
+            if self.durable >= target:
+                return # another thread's fsync already covered these records
+            with self._write_lock:
+                target = self.written
+            os.fsync(self.file.fileno())
+            self.durable = target
+            self.synced_at = monotonic()
+            self.syncs += 1
+
+    def truncate(self):
+        """Drop every record (after they've been folded into a snapshot)."""
+        with self._sync_lock, self._write_lock:
+            self.file.truncate(0)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.written = self.durable = 0
+
+    def close(self):
+        """Stop the background thread, commit and close the log."""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.commit()
+        self.file.close()
+
+    @staticmethod
+    def read(path:Path) -> tuple[list[tuple], int]:
+        """
+        Read every complete, intact record of a log.
+        Returns the records and the byte length they take up (anything after it is a torn write).
+        """
+        path = Path(path)
+        if not path.exists():
+            return [], 0
+        data = path.read_bytes()
+        records = []
+        end = 0
+        for offset in range(0, len(data) - RECORD.size + 1, RECORD.size):
+            *body, crc = RECORD.unpack_from(data, offset)
+            if crc32(data[offset:offset + BODY.size]) != crc:
+                break
+            records.append(tuple(body))
+            end = offset + RECORD.size
+        return records, end
+
+def write_snapshot(directory:Path, account:BankAccount):
+    """Atomically replace the snapshot of an account (a json header followed by the raw ledger arrays)."""
+    ledger = account.ledger
+    header = json.dumps({
+        "account_number": account.account_number,
+        "owner": account.owner,
+        "balance_cents": account.cents,
+        "opening": ledger.opening,
+        "net": ledger.net,
+        "interval": ledger.interval,
+        "count": len(ledger),
+        "checkpoints": len(ledger.checkpoints),
+    }).encode()
+    temporary = Path(directory) / (SNAPSHOT + ".tmp")
+    with open(temporary, "wb") as file:
+        file.write(SNAPSHOT_MAGIC + HEADER.pack(len(header)) + header)
+        for column in (ledger.ops, ledger.amounts, ledger.times, ledger.checkpoints):
+            column.tofile(file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, Path(directory) / SNAPSHOT)
+    fsync_directory(Path(directory))
+
+def read_snapshot(directory:Path, ledger_class:type = Ledger) -> tuple[dict, Ledger]:
+    """Read the snapshot of an account, returns its header and its ledger (made with ledger_class)."""
+    with open(Path(directory) / SNAPSHOT, "rb") as file:
+        if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            raise ValueError(f"{directory} does not have an account snapshot.")
+        (length,) = HEADER.unpack(file.read(HEADER.size))
+        header = json.loads(file.read(length))
+        ledger = ledger_class(header["opening"], header["interval"])
+        ledger.checkpoints = array("q")
+        for column, count in ((ledger.ops, header["count"]), (ledger.amounts, header["count"]),
+                              (ledger.times, header["count"]), (ledger.checkpoints, header["checkpoints"])):
+            column.fromfile(file, count)
+        ledger.net = header["net"]
+    return header, ledger
+
+# Durable Ledger Class
+class DurableLedger(Ledger):
+    """
+    A Ledger that writes every transaction to a WriteAheadLog before it's added (once it has one),
+    so a transaction that couldn't be logged never shows up in memory either.
+    """
+
+    wal = None
+
+    def append(self, op:int, cents:int, time_ns:int = None):
+        """Log one transaction, then add it."""
+        if time_ns is None:
+            time_ns = self._now()
+        self.wal.append(len(self), op, cents, time_ns)
+        super().append(op, cents, time_ns)
+
+    def extend(self, ops:array, amounts:array, time_ns:int = None):
+        """Log many transactions with one write, then add them."""
+        if len(ops) != len(amounts):
+            raise ValueError(f"Cannot add {len(ops)} ops with {len(amounts)} amounts.")
+        if time_ns is None:
+            time_ns = self._now()
+        start = len(self)
+        self.wal.extend(zip(range(start, start + len(ops)), ops, amounts, repeat(time_ns)))
+        super().extend(ops, amounts, time_ns)
+
+# Durable Bank Account Class
+class DurableBankAccount(BankAccount):
+    """
+    A BankAccount saved to a directory as it changes: each transaction appends a record to the
+    write-ahead log (O(1) per save), and every snapshot_every transactions the account is written to
+    a snapshot and the log is emptied, so recover() loads one snapshot and replays a short tail.
+
+    A transaction survives the process crashing as soon as it returns, but it's only durable (survives
+    the machine crashing) once it's been fsynced: after commit(), or within sync_interval seconds.
+    """
+
+    def __init__(self, directory, account_number=0, owner="", balance=0,
+                 sync_every:int = 64, sync_interval:float = 0.05, snapshot_every:int = 100_000):
+        """Create a new account in directory (raises FileExistsError if one is already saved there, load it with recover())."""
+        directory = Path(directory)
+        if (directory / SNAPSHOT).exists():
+            raise FileExistsError(f"An account is already saved in {directory}, use DurableBankAccount.recover() to load it.")
+        super().__init__(account_number, owner, balance)
+        self.ledger = DurableLedger(self.ledger.opening)
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot_every = snapshot_every
+        self._open_wal(sync_every, sync_interval)
+        self.wal.truncate()
+        self.snapshot()
+
+    @classmethod
+    def recover(cls, directory, sync_every:int = 64, sync_interval:float = 0.05, snapshot_every:int = 100_000) -> "DurableBankAccount":
+        """Load the account saved in directory: its latest snapshot plus the log records after it."""
+        directory = Path(directory)
+        header, ledger = read_snapshot(directory, DurableLedger)
+        records, end = WriteAheadLog.read(directory / WAL)
+        snapshot_net = ledger.net
+        for seq, op, cents, time_ns in records:
+            if seq < len(ledger):
+                continue # already in the snapshot (the log wasn't emptied before a crash)
+            if seq > len(ledger):
+                break # a gap means everything after it can't be trusted
+            Ledger.append(ledger, op, cents, time_ns) # replayed records are already in the log
+        # drop a torn last record so new records start on a record boundary
+        with open(directory / WAL, "ab") as file:
+            file.truncate(end)
+
+        account = cls.__new__(cls)
+        account.account_number = header["account_number"]
+        account.owner = header["owner"]
+        account.balance = Money(header["balance_cents"] + ledger.net - snapshot_net)
+        account.directory = directory
+        account.snapshot_every = snapshot_every
+        account.ledger = ledger
+        account._open_wal(sync_every, sync_interval)
+        return account
+
+    def _open_wal(self, sync_every:int, sync_interval:float):
+        """Open the log and make the ledger write to it."""
+        self.wal = WriteAheadLog(self.directory / WAL, sync_every, sync_interval)
+        self.ledger.wal = self.wal
+        self.snapshot_seq = len(self.ledger)
+
+    def deposit(self, amount:float):
+        """Deposit a positive amount to the account."""
+        BankAccount.deposit(self, amount)
+        self._maybe_snapshot()
+
+    def withdraw(self, amount:float):
+        """Withdraw a positive amount if sufficient balance exists."""
+        BankAccount.withdraw(self, amount)
+        self._maybe_snapshot()
+
+    def apply_batch(self, ops) -> int:
+        """Apply many operations all-or-nothing, they're logged with one write."""
+        applied = BankAccount.apply_batch(self, ops)
+        self._maybe_snapshot()
+        return applied
+
+    def _maybe_snapshot(self):
+        """Snapshot once enough transactions have been logged since the last one."""
+        if len(self.ledger) - self.snapshot_seq >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self):
+        """Write the whole account to a new snapshot, then empty the log."""
+        self.wal.commit()
+        write_snapshot(self.directory, self)
+        self.wal.truncate()
+        self.snapshot_seq = len(self.ledger)
+
+    def commit(self):
+        """Make every transaction so far durable (call it before reporting a transaction as saved)."""
+        self.wal.commit()
+
+    def close(self):
+        """Commit and close the log."""
+        self.wal.close()
+
+    def __enter__(self) -> "DurableBankAccount":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
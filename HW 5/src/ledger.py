@@ -0,0 +1,146 @@
+"""
+File: ledger.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - array module: compact arrays of C numbers
+        - https://docs.python.org/3/library/array.html
+    - time.time_ns: wall clock timestamps (they stay meaningful after a restart, unlike monotonic_ns)
+        - https://docs.python.org/3/library/time.html#time.time_ns
+    - bisect module: binary search on the (sorted) timestamps
+        - https://docs.python.org/3/library/bisect.html
+"""
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from time import time_ns as now_ns
+
+from money import TWO_DIGITS, to_cents
+
+# Operation codes (stored as one signed byte each)
+DEPOSIT = 0
+WITHDRAW = 1
+OP_NAMES = ("deposit", "withdraw")
+OP_CODES = {name: code for code, name in enumerate(OP_NAMES)}
+SIGNS = (1, -1) # how each op changes the balance
+
+# Transactions between balance checkpoints
+CHECKPOINT_INTERVAL = 64
+
+def format_cents(cents:int) -> str:
+    """Formats cents as dollars the way the legacy transaction strings did ($100, $12.5, $0.25)."""
+    dollars, rest = divmod(abs(cents), 100)
+    sign = "-" if cents < 0 else ""
+    if rest == 0:
+        return f"{sign}{dollars}"
+    return f"{sign}{dollars}.{TWO_DIGITS[rest]}".rstrip("0")
+
+# Ledger Class
+class Ledger:
+    """
+    An append-only transaction history kept in parallel arrays (op code, amount in cents, wall clock timestamp in ns).
+    The timestamps never go backwards (if the clock is set back, new transactions keep the last timestamp), so
+    they stay sorted for bisect, including across restarts of a saved ledger.
+    The net flow before every CHECKPOINT_INTERVAL-th transaction is kept too, so the balance at any point
+    is a checkpoint plus less than CHECKPOINT_INTERVAL amounts.
+    """
+
+    def __init__(self, opening:int = 0, interval:int = CHECKPOINT_INTERVAL):
+        """Initialize an empty Ledger that starts from an opening balance (in cents)."""
+        if interval < 1:
+            raise ValueError(f"Cannot checkpoint every {interval} transactions.")
+        self.ops = array("b")
+        self.amounts = array("q")
+        self.times = array("q")
+        self.opening = opening
+        self.net = 0 # net flow of every transaction (in cents)
+        self.interval = interval
+        self.checkpoints = array("q", [0]) # net flow of the first i * interval transactions
+
+    def __len__(self):
+        """Return the number of transactions."""
+        return len(self.ops)
+
+    def append(self, op:int, cents:int, time_ns:int = None):
+        """Add one transaction (time_ns defaults to now)."""
+        times = self.times
+        if time_ns is None:
+            time_ns = now_ns()
+            if times and time_ns < times[-1]:
+                time_ns = times[-1] # the clock was set back
+        self.ops.append(op)
+        self.amounts.append(cents)
+        times.append(time_ns)
+        self.net += SIGNS[op] * cents
+        if len(self.ops) % self.interval == 0:
+            self.checkpoints.append(self.net)
+
+    def extend(self, ops:array, amounts:array, time_ns:int = None):
+        """Add many transactions at once (op codes and cents of the same length), they all get the same timestamp."""
+        if len(ops) != len(amounts):
+            raise ValueError(f"Cannot add {len(ops)} ops with {len(amounts)} amounts.")
+        start = len(self.ops)
+        running = list(accumulate((SIGNS[op] * cents for op, cents in zip(ops, amounts)), initial=self.net))
+        self.ops.extend(ops)
+        self.amounts.extend(amounts)
+        self.times.extend(array("q", [self._now() if time_ns is None else time_ns]) * len(ops))
+        self.net = running[-1]
+        # running[i] is the net flow after i of the new transactions, keep the ones that land on a checkpoint
+        first = -start % self.interval or self.interval
+        self.checkpoints.extend(running[first::self.interval])
+
+    def _now(self) -> int:
+        """Return the current time in ns, but never earlier than the last transaction."""
+        now = now_ns()
+        times = self.times
+        if times and now < times[-1]:
+            return times[-1] # the clock was set back
+        return now
+
+    @property
+    def balance(self) -> int:
+        """The balance after every transaction (in cents)."""
+        return self.opening + self.net
+
+    def balance_after(self, count:int) -> int:
+        """Return the balance (in cents) after the first count transactions."""
+        if not 0 <= count <= len(self.ops):
+            raise IndexError(f"Ledger has no balance after {count} transactions.")
+        block, offset = divmod(count, self.interval)
+        start = count - offset
+        net = self.checkpoints[block]
+        for op, cents in zip(self.ops[start:count], self.amounts[start:count]):
+            net += SIGNS[op] * cents
+        return self.opening + net
+
+    def balance_at(self, time_ns:int) -> int:
+        """Return the balance (in cents) including every transaction made at or before time_ns."""
+        return self.balance_after(bisect_right(self.times, time_ns))
+
+    def net_flow(self, start_ns:int, end_ns:int) -> int:
+        """Return the net flow (in cents) of the transactions made after start_ns and at or before end_ns."""
+        return self.balance_at(end_ns) - self.balance_at(start_ns)
+
+    def entries(self):
+        """Yield every transaction as (op name, amount in cents, timestamp in ns)."""
+        for op, cents, time_ns in zip(self.ops, self.amounts, self.times):
+            yield OP_NAMES[op], cents, time_ns
+
+    def render(self, index:int) -> str:
+        """Return one transaction as a legacy string (ex. "deposit: $100")."""
+        return f"{OP_NAMES[self.ops[index]]}: ${format_cents(self.amounts[index])}"
+
+    def lines(self) -> list[str]:
+        """Return every transaction as a legacy string."""
+        return [f"{OP_NAMES[op]}: ${format_cents(cents)}" for op, cents in zip(self.ops, self.amounts)]
+
+    @classmethod
+    def from_lines(cls, lines:list[str], opening:int = 0) -> "Ledger":
+        """Build a Ledger from legacy strings (their times are unknown, so they're stored as 0)."""
+        ledger = cls(opening)
+        for line in lines:
+            name, _, amount = line.partition(": $")
+            if name not in OP_CODES or not amount:
+                raise ValueError(f"Cannot read transaction {line!r}")
+            ledger.append(OP_CODES[name], to_cents(float(amount)), 0)
+        return ledger
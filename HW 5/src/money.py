@@ -0,0 +1,207 @@
+"""
+File: money.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - decimal module: exact decimal arithmetic, rounding
+        - https://docs.python.org/3/library/decimal.html
+    - __slots__: smaller objects without a __dict__
+        - https://docs.python.org/3/reference/datamodel.html#slots
+    - numbers module: how numeric types compare and hash
+        - https://docs.python.org/3/library/numbers.html#notes-for-type-implementors
+
+Money kept as a whole number of cents, so it never drifts the way float dollars do. The cents have to
+fit in a signed 64-bit integer (the same limit as the ledger's arrays) and an OverflowError is raised
+as soon as a result doesn't.
+"""
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from fractions import Fraction
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+EXACT_NUMBERS = (int, float, Decimal, Fraction) # what Money compares with
+TWO_DIGITS = tuple(f"{cents:02d}" for cents in range(100)) # "00" to "99" (faster than formatting with :02d)
+
+def to_cents(amount) -> int:
+    """Converts a dollar amount (Money, int, float, Decimal or a string like "12.34") to whole cents (rounded to the nearest cent)."""
+    kind = type(amount)
+    if kind is int:
+        return amount * 100
+    if kind is Money:
+        return amount.cents
+    if kind is float:
+        return round(amount * 100)
+    if kind is str:
+        try:
+            amount = Decimal(amount.strip().lstrip("$").replace(",", ""))
+        except InvalidOperation:
+            raise ValueError(f"Cannot read {amount!r} as money.") from None
+    if isinstance(amount, Decimal):
+        if not amount.is_finite():
+            raise ValueError(f"Cannot use {amount} as money.")
+        return int((amount * 100).to_integral_value(ROUND_HALF_EVEN))
+    return round(amount * 100) # other numbers (ex. Fraction, bool)
+
+def checked(cents:int) -> int:
+    """Return cents if they fit in a signed 64-bit integer, raise OverflowError otherwise."""
+    if not INT64_MIN <= cents <= INT64_MAX:
+        raise OverflowError(f"{cents} cents does not fit in 64 bits.")
+    return cents
+
+def format_money(cents:int) -> str:
+    """Formats cents as dollars with 2 decimals (ex. "12.50", "-0.05")."""
+    if cents >= 0:
+        return f"{cents // 100}.{TWO_DIGITS[cents % 100]}"
+    return f"-{-cents // 100}.{TWO_DIGITS[-cents % 100]}"
+
+_new = object.__new__ # makes Money without going through __init__ (for cents that are already checked)
+
+# Money Class
+class Money:
+    """
+    An exact amount of money in cents. Adds and subtracts other Money and plain numbers (read as dollars,
+    rounded to the nearest cent). Compares exactly with Money, int, float, Decimal and Fraction dollars
+    (nothing is rounded, so Money(12345) == Decimal("123.45") but Money(12345) != 123.45, a float that's
+    a little more than 123.45), and hashes like the equal number. Strings never compare equal.
+    """
+
+    __slots__ = ("cents",)
+
+    def __init__(self, cents:int = 0):
+        """Initialize Money from a whole number of cents."""
+        if type(cents) is not int:
+            raise TypeError(f"Money takes whole cents, not {type(cents).__name__} (use Money.from_dollars).")
+        self.cents = checked(cents)
+
+    @classmethod
+    def from_dollars(cls, amount) -> "Money":
+        """Return amount as Money (it's returned as is if it already is Money)."""
+        if type(amount) is cls:
+            return amount
+        return cls(checked(to_cents(amount)))
+
+    @property
+    def dollars(self) -> int | float:
+        """The amount as a plain number (int when there are no cents), ex. for json."""
+        dollars, rest = divmod(self.cents, 100)
+        return dollars if rest == 0 else self.cents / 100
+
+    def to_decimal(self) -> Decimal:
+        """The exact amount as a Decimal."""
+        return Decimal(self.cents).scaleb(-2)
+
+    # Arithmetic (the hot path, so the 64-bit check is written out instead of calling checked())
+    def __add__(self, other):
+        kind = type(other)
+        if kind is Money:
+            cents = self.cents + other.cents
+        elif kind is int:
+            cents = self.cents + other * 100
+        else:
+            try:
+                cents = self.cents + to_cents(other)
+            except (TypeError, ValueError):
+                return NotImplemented
+        if INT64_MIN <= cents <= INT64_MAX:
+            money = _new(Money)
+            money.cents = cents
+            return money
+        raise OverflowError(f"{cents} cents does not fit in 64 bits.")
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        kind = type(other)
+        if kind is Money:
+            cents = self.cents - other.cents
+        elif kind is int:
+            cents = self.cents - other * 100
+        else:
+            try:
+                cents = self.cents - to_cents(other)
+            except (TypeError, ValueError):
+                return NotImplemented
+        if INT64_MIN <= cents <= INT64_MAX:
+            money = _new(Money)
+            money.cents = cents
+            return money
+        raise OverflowError(f"{cents} cents does not fit in 64 bits.")
+
+    def __rsub__(self, other):
+        try:
+            return Money(checked(to_cents(other) - self.cents))
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    def __mul__(self, other):
+        if type(other) is not int:
+            return NotImplemented # only whole multiples stay exact
+        return Money(checked(self.cents * other))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Money(checked(-self.cents))
+
+    def __abs__(self):
+        return Money(checked(abs(self.cents)))
+
+    def __bool__(self):
+        return self.cents != 0
+
+    # Comparisons (exact, other is never rounded)
+    def _operands(self, other) -> tuple | None:
+        """Return (self, other) as values that compare exactly, None if other can't be compared."""
+        kind = type(other)
+        if kind is Money:
+            return self.cents, other.cents
+        if kind is int:
+            return self.cents, other * 100
+        if isinstance(other, EXACT_NUMBERS):
+            return Fraction(self.cents, 100), other # Fraction compares exactly with floats and Decimals
+        return None
+
+    def __eq__(self, other):
+        operands = self._operands(other)
+        return NotImplemented if operands is None else operands[0] == operands[1]
+
+    def __lt__(self, other):
+        operands = self._operands(other)
+        return NotImplemented if operands is None else operands[0] < operands[1]
+
+    def __le__(self, other):
+        operands = self._operands(other)
+        return NotImplemented if operands is None else operands[0] <= operands[1]
+
+    def __gt__(self, other):
+        operands = self._operands(other)
+        return NotImplemented if operands is None else operands[0] > operands[1]
+
+    def __ge__(self, other):
+        operands = self._operands(other)
+        return NotImplemented if operands is None else operands[0] >= operands[1]
+
+    def __hash__(self):
+        # the same hash as the equal int/float/Decimal/Fraction (ex. hash(Money(10000)) == hash(100))
+        return hash(Fraction(self.cents, 100))
+
+    # Conversions
+    def __int__(self):
+        # whole dollars, truncated toward 0 like int() of a float
+        dollars = abs(self.cents) // 100
+        return dollars if self.cents >= 0 else -dollars
+
+    def __float__(self):
+        return self.cents / 100
+
+    def __str__(self):
+        return format_money(self.cents)
+
+    def __repr__(self):
+        return f"Money('{format_money(self.cents)}')"
+
+    def __format__(self, spec:str):
+        return format_money(self.cents) if not spec else format(self.to_decimal(), spec)
+
+    def __reduce__(self):
+        return (Money, (self.cents,))
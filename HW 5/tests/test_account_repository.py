@@ -0,0 +1,109 @@
+"""
+File: test_account_repository.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/how-to/tmp_path.html
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from account_repository import AccountRecord, AccountRepository, shard_file, shard_of
+from bank_account import BankAccount
+
+@pytest.fixture
+def repository():
+    repository = AccountRepository(shards=4)
+    for number in range(100):
+        repository.put(AccountRecord(number, f"owner-{number % 10}", number * 100))
+    return repository
+
+def test_get_and_shards(repository):
+    """ Test should find every account and spread them over the shards """
+    assert len(repository) == 100
+    assert repository.get(42) == AccountRecord(42, "owner-2", 4200)
+    assert all(repository.shards)
+    with pytest.raises(KeyError):
+        repository.get(1000)
+
+def test_records_have_no_dict():
+    """ Test should keep records in __slots__ """
+    assert not hasattr(AccountRecord(1, "A", 0), "__dict__")
+
+def test_find_by_owner(repository):
+    """ Test should follow owner changes and removals """
+    assert sorted(record.account_number for record in repository.find_by_owner("owner-3")) == list(range(3, 100, 10))
+    repository.put(AccountRecord(3, "someone-else", 0))
+    repository.remove(13)
+    assert 3 not in [record.account_number for record in repository.find_by_owner("owner-3")]
+    assert 13 not in repository
+    assert repository.find_by_owner("someone-else") == [AccountRecord(3, "someone-else", 0)]
+    assert repository.find_by_owner("nobody") == []
+
+def test_balance_range(repository):
+    """ Test should return the balances in range, lowest first, and see changes """
+    assert [record.cents for record in repository.balance_range(1000, 1500)] == [1000, 1100, 1200, 1300, 1400, 1500]
+    repository.set_balance(99, 1250)
+    assert [record.account_number for record in repository.balance_range(1200, 1300)] == [12, 99, 13]
+
+def test_balance_index_follows_changes(repository, tmp_path):
+    """ Test should keep the balance index sorted through puts, removes and balance changes """
+    repository.put(AccountRecord(5, "owner-5", 99_999))
+    repository.remove(50)
+    repository.set_balance(7, 0)
+    repository.put(AccountRecord("ACC-1", "A", 700)) # a str account number next to the int ones
+    expected = sorted(repository, key=lambda record: record.cents)
+    assert [record.cents for record in repository.balance_range(0, 10 ** 6)] == [record.cents for record in expected]
+    assert [record.account_number for record in repository.balance_range(0, 700)] == [0, 7, 1, 2, 3, 4, 6, "ACC-1"]
+    assert 50 not in [record.account_number for record in repository.balance_range(0, 10 ** 6)]
+    repository.bulk_save(tmp_path)
+    loaded = AccountRepository.bulk_load(tmp_path)
+    assert [record.cents for record in loaded.balance_range(0, 10 ** 6)] == [record.cents for record in expected]
+    assert [record.cents for record in loaded.balance_range(100, 700)] == [100, 200, 300, 400, 600, 700]
+
+def test_bulk_save_and_load(repository, tmp_path):
+    """ Test should load the same records, even with a different shard count """
+    repository.bulk_save(tmp_path)
+    assert len(list(tmp_path.glob("shard-*.json"))) == 4
+    loaded = AccountRepository.bulk_load(tmp_path, shards=8)
+    assert len(loaded.shards) == 8
+    assert sorted(loaded, key=lambda record: record.account_number) == sorted(repository, key=lambda record: record.account_number)
+    assert len(loaded.find_by_owner("owner-0")) == 10
+
+def test_shards_are_stable_across_processes():
+    """ Test should put a str account number in the same shard no matter the hash seed """
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    script = f"import sys; sys.path.insert(0, {src!r}); from account_repository import shard_of; print(shard_of('ACC-0042', 16))"
+    shards = set()
+    for seed in ("1", "2", "3"):
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                env={**os.environ, "PYTHONHASHSEED": seed})
+        shards.add(int(result.stdout))
+    assert shards == {shard_of("ACC-0042", 16)}
+
+def test_load_account_reads_one_shard(tmp_path):
+    """ Test should load one account from its shard's file alone """
+    repository = AccountRepository(shards=4)
+    for number in range(20):
+        repository.put(AccountRecord(f"ACC-{number:04d}", "A", number))
+    repository.bulk_save(tmp_path)
+    index = shard_of("ACC-0007", 4)
+    for other in range(4):
+        if other != index:
+            shard_file(tmp_path, other).unlink()
+    assert AccountRepository.load_account(tmp_path, "ACC-0007") == AccountRecord("ACC-0007", "A", 7)
+    missing = next(f"ACC-{number}" for number in range(10_000, 20_000) if shard_of(f"ACC-{number}", 4) == index)
+    with pytest.raises(KeyError):
+        AccountRepository.load_account(tmp_path, missing)
+
+def test_bank_account_round_trip():
+    """ Test should turn BankAccounts into records and back """
+    repository = AccountRepository()
+    repository.add_accounts([BankAccount(1, "A", 12.5), BankAccount(2, "B", 100)])
+    assert repository.get(1).cents == 1250
+    account = repository.get(2).to_account()
+    assert (account.account_number, account.owner, account.balance) == (2, "B", 100)
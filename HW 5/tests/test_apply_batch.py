@@ -0,0 +1,59 @@
+"""
+File: test_apply_batch.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/example/parametrize.html
+"""
+
+import pytest
+from bank_account import BankAccount
+from ledger import Ledger
+
+@pytest.fixture
+def bank_account():
+    return BankAccount(12345, "Karina", 100)
+
+def test_apply_batch(bank_account):
+    """ Test should match making the same calls one by one """
+    ops = [("deposit", 50), ("withdraw", 120), ("deposit", 10.5), ("withdraw", 40.5)]
+    one_by_one = BankAccount(12345, "Karina", 100)
+    for name, amount in ops:
+        getattr(one_by_one, name)(amount)
+    assert bank_account.apply_batch(ops) == 4
+    assert bank_account.balance == one_by_one.balance == 0
+    assert bank_account.transactions == one_by_one.transactions
+
+def test_apply_batch_uses_running_balance(bank_account):
+    """ Test should allow a withdrawal that an earlier deposit in the batch pays for """
+    bank_account.apply_batch([("deposit", 100), ("withdraw", 200)])
+    assert bank_account.balance == 0
+
+@pytest.mark.parametrize("ops", [
+    [("deposit", 10), ("withdraw", 500)],
+    [("deposit", 10), ("withdraw", -5)],
+    [("deposit", 10), ("deposit", 0)],
+    [("deposit", 10), ("withdraw", 0.001)],
+    [("deposit", 10), ("refund", 5)],
+])
+def test_apply_batch_all_or_nothing(bank_account, ops):
+    """ Test should raise ValueError and apply none of the batch """
+    with pytest.raises(ValueError):
+        bank_account.apply_batch(ops)
+    assert bank_account.balance == 100
+    assert bank_account.transactions == []
+
+def test_extend_matches_append():
+    """ Test should keep the same checkpoints as appending one at a time """
+    appended, extended = Ledger(interval=4), Ledger(interval=4)
+    ops = [i % 2 for i in range(11)]
+    amounts = [i * 7 + 1 for i in range(11)]
+    for op, cents in zip(ops[:3], amounts[:3]):
+        appended.append(op, cents, 0)
+        extended.append(op, cents, 0)
+    for op, cents in zip(ops[3:], amounts[3:]):
+        appended.append(op, cents, 0)
+    extended.extend(ops[3:], amounts[3:], 0)
+    assert list(extended.checkpoints) == list(appended.checkpoints)
+    assert extended.net == appended.net
+    assert [extended.balance_after(i) for i in range(12)] == [appended.balance_after(i) for i in range(12)]
@@ -8,6 +8,7 @@ Resources:
         - https://docs.pytest.org/en/latest/example/parametrize.html
         - https://docs.pytest.org/en/latest/reference/reference.html#pytest.raises
         - https://docs.pytest.org/en/latest/how-to/fixtures.html#fixture-parametrize-marks
+        - https://docs.pytest.org/en/latest/how-to/tmp_path.html
 """
 
 import pytest
@@ -22,8 +23,9 @@ def bank_account(starting_balance):
     return BankAccount(12345, "Karina", starting_balance)
 
 # JSON Deserialization and Serialization Tests
-def test_to_json(bank_account):
-    bank_account.to_json('example.json')
+def test_to_json(bank_account, tmp_path):
+    bank_account.to_json(tmp_path / 'example.json')
+    assert (tmp_path / 'example.json').exists()
     
 def test_from_json(bank_account):
     bank_account2 = BankAccount()
@@ -66,6 +68,15 @@ def test_get_balance(bank_account):
     """ Test should pass if get_balance method runs correctly  """
     bank_account.balance = 12345
     assert bank_account.get_balance() == 12345
+
+def test_balance_compares_with_floats():
+    """ Test should compare the balance with the float dollars it holds """
+    bank_account = BankAccount(12345, "Karina", 100.1)
+    assert bank_account.balance == 100.1
+    assert bank_account.get_balance() == 100.1
+    bank_account.deposit(0.2)
+    assert bank_account.balance == 100.3
+    assert bank_account.cents == 10030
     
 # Edge Case Tests
 def test_withdraw_zero(bank_account):
@@ -77,6 +88,16 @@ def test_deposit_zero(bank_account):
     """ Test should catch depositing 0  """
     with pytest.raises(ValueError):
         bank_account.withdraw(0)
+
+@pytest.mark.parametrize("starting_balance", [100])
+def test_less_than_a_cent(bank_account):
+    """ Test should catch amounts that round to 0 cents and log nothing """
+    with pytest.raises(ValueError, match="Cannot deposit 0"):
+        bank_account.deposit(0.004)
+    with pytest.raises(ValueError, match="Cannot withdraw 0"):
+        bank_account.withdraw(0.001)
+    assert bank_account.balance == 100
+    assert bank_account.transactions == []
         
 def test_negative_init():
     with pytest.raises(ValueError):
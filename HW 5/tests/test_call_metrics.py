@@ -0,0 +1,67 @@
+"""
+File: test_call_metrics.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/how-to/fixtures.html#teardown-cleanup-aka-fixture-finalization
+"""
+
+import json
+import pytest
+from bank_account import BankAccount
+from call_metrics import REGISTRY, CallMetrics, MetricsRegistry
+
+@pytest.fixture
+def metrics():
+    REGISTRY.reset()
+    REGISTRY.enable()
+    yield REGISTRY
+    REGISTRY.disable()
+    REGISTRY.reset()
+
+@pytest.fixture
+def bank_account():
+    return BankAccount(12345, "Karina", 100)
+
+def test_disabled_by_default(bank_account):
+    """ Test should record nothing while the registry is disabled """
+    REGISTRY.reset()
+    bank_account.deposit(10)
+    assert REGISTRY.snapshot()["BankAccount.deposit"]["calls"] == 0
+
+def test_records_calls_and_errors(metrics, bank_account):
+    """ Test should count successful calls and calls that raised """
+    bank_account.deposit(10)
+    bank_account.withdraw(20)
+    with pytest.raises(ValueError):
+        bank_account.withdraw(1000)
+    snapshot = metrics.snapshot()
+    assert snapshot["BankAccount.deposit"]["calls"] == 1
+    assert snapshot["BankAccount.withdraw"]["calls"] == 2
+    assert snapshot["BankAccount.withdraw"]["errors"] == 1
+    assert sum(snapshot["BankAccount.withdraw"]["buckets"].values()) == 2
+
+def test_histogram_buckets():
+    """ Test should put latencies in the first bucket they fit under """
+    call_metrics = CallMetrics("f", buckets=(0.1, 1.0), enabled=True)
+    for latency in (0.05, 0.1, 0.5, 5.0):
+        call_metrics.observe(latency)
+    call_metrics.record_retry(0.25)
+    snapshot = call_metrics.snapshot()
+    assert snapshot["buckets"] == {"0.1": 2, "1.0": 1, "+Inf": 1}
+    assert snapshot["retries"] == 1
+    assert snapshot["sleep_seconds"] == 0.25
+
+def test_exports():
+    """ Test should export cumulative prometheus buckets and valid json """
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.enable()
+    call_metrics = registry.get("f")
+    call_metrics.observe(0.05)
+    call_metrics.observe(0.5, error=True)
+    text = registry.to_prometheus()
+    assert 'calls_total{function="f"} 2' in text
+    assert 'calls_errors_total{function="f"} 1' in text
+    assert 'calls_latency_seconds_bucket{function="f",le="1.0"} 2' in text
+    assert 'calls_latency_seconds_count{function="f"} 2' in text
+    assert json.loads(registry.to_json())["f"]["calls"] == 2
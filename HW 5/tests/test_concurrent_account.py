@@ -0,0 +1,84 @@
+"""
+File: test_concurrent_account.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor
+"""
+
+import sys
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from concurrent_account import ConcurrentBankAccount, transfer
+from money import INT64_MAX, Money
+
+@pytest.fixture
+def fast_switching():
+    """ switches threads as often as possible so races show up """
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+def try_withdraw(account, amount):
+    try:
+        account.withdraw(amount)
+        return True
+    except ValueError:
+        return False
+
+def test_concurrent_withdrawals_cannot_overdraw(fast_switching):
+    """ Test should let exactly balance / amount withdrawals through """
+    account = ConcurrentBankAccount(1, "Karina", 100)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(try_withdraw, [account] * 400, [1] * 400))
+    assert sum(results) == 100
+    assert account.balance == 0
+    assert len(account.transactions) == 100
+
+def test_transfer():
+    """ Test should move the amount between the accounts """
+    a = ConcurrentBankAccount(1, "A", 100)
+    b = ConcurrentBankAccount(2, "B", 0)
+    transfer(a, b, 40)
+    assert (a.balance, b.balance) == (60, 40)
+    assert a.transactions == ["withdraw: $40"]
+    assert b.transactions == ["deposit: $40"]
+
+def test_transfer_insufficient_funds_changes_nothing():
+    """ Test should raise ValueError and leave both accounts alone """
+    a = ConcurrentBankAccount(1, "A", 10)
+    b = ConcurrentBankAccount(2, "B", 0)
+    with pytest.raises(ValueError):
+        transfer(a, b, 40)
+    assert (a.balance, b.balance) == (10, 0)
+    assert b.transactions == []
+
+def test_transfer_overflow_changes_nothing():
+    """ Test should raise OverflowError before taking anything from the source """
+    a = ConcurrentBankAccount(1, "A", 100)
+    b = ConcurrentBankAccount(2, "B", 0)
+    b.balance = Money(INT64_MAX - 10)
+    with pytest.raises(OverflowError):
+        transfer(a, b, 50)
+    assert (a.balance, b.cents) == (100, INT64_MAX - 10)
+    assert a.transactions == b.transactions == []
+
+def test_transfer_same_stripe():
+    """ Test should work when both accounts share a lock stripe """
+    a = ConcurrentBankAccount(1, "A", 100)
+    b = ConcurrentBankAccount(1 + 64, "B", 0)
+    assert a.lock is b.lock
+    transfer(a, b, 100)
+    assert (a.balance, b.balance) == (0, 100)
+
+def test_opposite_transfers_do_not_deadlock(fast_switching):
+    """ Test should finish transfers going both ways and keep the total """
+    a = ConcurrentBankAccount(1, "A", 1000)
+    b = ConcurrentBankAccount(2, "B", 1000)
+    def move(pair):
+        for _ in range(200):
+            transfer(*pair, 1)
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(move, [(a, b), (b, a)] * 2))
+    assert a.balance + b.balance == 2000
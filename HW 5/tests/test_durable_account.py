@@ -0,0 +1,147 @@
+"""
+File: test_durable_account.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/how-to/tmp_path.html
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from durable_account import SNAPSHOT, WAL, DurableBankAccount, RECORD, write_snapshot
+
+@pytest.fixture
+def account(tmp_path):
+    account = DurableBankAccount(tmp_path, 12345, "Karina", 100, snapshot_every=1000)
+    yield account
+    account.close()
+
+def test_recover(account, tmp_path):
+    """ Test should load the snapshot and replay the log """
+    account.deposit(50)
+    account.withdraw(20.5)
+    account.apply_batch([("deposit", 5), ("withdraw", 10)])
+    account.commit()
+    recovered = DurableBankAccount.recover(tmp_path)
+    assert recovered.balance == account.balance == 124.5
+    assert recovered.transactions == account.transactions
+    assert list(recovered.ledger.times) == list(account.ledger.times)
+    assert (recovered.account_number, recovered.owner) == (12345, "Karina")
+    recovered.close()
+
+def test_saves_only_append(account, tmp_path):
+    """ Test should grow the log by one record per transaction and leave the snapshot alone """
+    snapshot = (tmp_path / SNAPSHOT).stat().st_mtime_ns
+    for _ in range(10):
+        account.deposit(1)
+    account.commit()
+    assert (tmp_path / WAL).stat().st_size == 10 * RECORD.size
+    assert (tmp_path / SNAPSHOT).stat().st_mtime_ns == snapshot
+
+def test_snapshot_empties_log(tmp_path):
+    """ Test should snapshot every snapshot_every transactions and recover from it """
+    with DurableBankAccount(tmp_path, 1, "A", 0, snapshot_every=8) as account:
+        for _ in range(10):
+            account.deposit(1)
+    assert (tmp_path / WAL).stat().st_size == 2 * RECORD.size
+    recovered = DurableBankAccount.recover(tmp_path)
+    assert recovered.balance == 10
+    assert len(recovered.transactions) == 10
+    recovered.close()
+
+def test_torn_record_is_dropped(account, tmp_path):
+    """ Test should ignore a partly written last record """
+    account.deposit(10)
+    account.commit()
+    with open(tmp_path / WAL, "ab") as file:
+        file.write(b"\x01\x02\x03")
+    recovered = DurableBankAccount.recover(tmp_path)
+    assert recovered.balance == 110
+    recovered.deposit(1)
+    recovered.close()
+    assert DurableBankAccount.recover(tmp_path).balance == 111
+
+def test_crash_between_snapshot_and_truncate(account, tmp_path):
+    """ Test should not replay records that are already in the snapshot """
+    account.deposit(10)
+    account.commit()
+    write_snapshot(tmp_path, account) # the log still has the deposit
+    account.deposit(5)
+    account.commit()
+    recovered = DurableBankAccount.recover(tmp_path)
+    assert recovered.balance == 115
+    assert recovered.transactions == ["deposit: $10", "deposit: $5"]
+    recovered.close()
+
+def test_group_commit(tmp_path):
+    """ Test should fsync once per group of records """
+    with DurableBankAccount(tmp_path, 1, "A", 0, sync_every=16, sync_interval=60) as account:
+        syncs = account.wal.syncs
+        for _ in range(32):
+            account.deposit(1)
+        assert account.wal.syncs - syncs == 2
+
+def test_quiet_log_is_synced(tmp_path):
+    """ Test should fsync a waiting record within sync_interval even if nothing is written after it """
+    with DurableBankAccount(tmp_path, 1, "A", 0, sync_every=64, sync_interval=0.02) as account:
+        account.deposit(1)
+        deadline = time.monotonic() + 5
+        while account.wal.durable < account.wal.written and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert account.wal.durable == account.wal.written == 1
+
+def test_process_crash_keeps_records(tmp_path):
+    """ Test should recover every transaction made before the process died without closing the log """
+    script = f"""
+import os, sys, time
+sys.path.insert(0, {str(Path(__file__).resolve().parent.parent / "src")!r})
+from durable_account import DurableBankAccount
+account = DurableBankAccount({str(tmp_path)!r}, 1, "A", 0, sync_interval=60)
+account.deposit(5)
+time.sleep(0.1)
+account.deposit(7)
+account.deposit(9)
+os._exit(0)
+"""
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+    recovered = DurableBankAccount.recover(tmp_path)
+    assert recovered.transactions == ["deposit: $5", "deposit: $7", "deposit: $9"]
+    recovered.close()
+
+def test_times_stay_sorted_after_recover(account, tmp_path):
+    """ Test should keep the saved times and the new ones in order after a restart """
+    account.deposit(1)
+    account.close()
+    recovered = DurableBankAccount.recover(tmp_path)
+    recovered.deposit(2)
+    times = list(recovered.ledger.times)
+    assert times == sorted(times)
+    assert recovered.balance_at(times[0]) == 101
+    recovered.close()
+
+def test_failed_log_write_changes_nothing(account, tmp_path):
+    """ Test should leave the balance and the ledger alone when the log can't be written """
+    account.close()
+    with pytest.raises(ValueError):
+        account.deposit(5)
+    with pytest.raises(ValueError):
+        account.apply_batch([("deposit", 1), ("withdraw", 2)])
+    assert account.balance == 100
+    assert len(account.ledger) == 0
+    recovered = DurableBankAccount.recover(tmp_path)
+    assert recovered.balance == 100
+    recovered.close()
+
+def test_saved_account_is_not_replaced(account, tmp_path):
+    """ Test should refuse to create an account over one that's already saved """
+    account.deposit(5)
+    account.close()
+    with pytest.raises(FileExistsError, match="recover"):
+        DurableBankAccount(tmp_path, 1, "A", 0)
+    recovered = DurableBankAccount.recover(tmp_path)
+    assert recovered.balance == 105
+    recovered.close()
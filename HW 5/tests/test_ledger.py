@@ -0,0 +1,116 @@
+"""
+File: test_ledger.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/how-to/capture-stdout-stderr.html
+"""
+
+import time
+
+import ledger as ledger_module
+import pytest
+from bank_account import BankAccount
+from ledger import DEPOSIT, WITHDRAW, Ledger, format_cents
+
+@pytest.fixture
+def bank_account():
+    return BankAccount(12345, "Karina", 100)
+
+def test_ledger_records_cents(bank_account):
+    """ Test should store op codes and amounts in cents """
+    bank_account.deposit(12.5)
+    bank_account.withdraw(70)
+    assert list(bank_account.ledger.ops) == [DEPOSIT, WITHDRAW]
+    assert list(bank_account.ledger.amounts) == [1250, 7000]
+    assert bank_account.ledger.times[0] <= bank_account.ledger.times[1]
+
+def test_transactions_view(bank_account):
+    """ Test should render the legacy strings """
+    bank_account.deposit(100)
+    bank_account.withdraw(0.25)
+    assert bank_account.transactions == ["deposit: $100", "withdraw: $0.25"]
+
+def test_show_transactions(bank_account, capsys):
+    """ Test should print one legacy string per transaction """
+    bank_account.deposit(100)
+    bank_account.show_transactions()
+    assert capsys.readouterr().out == "deposit: $100\n"
+
+def test_json_round_trip(bank_account, tmp_path):
+    """ Test should save and load the transactions as legacy strings """
+    bank_account.deposit(10.5)
+    bank_account.withdraw(77)
+    bank_account.to_json(tmp_path / "account.json")
+    bank_account2 = BankAccount()
+    bank_account2.from_json(tmp_path / "account.json")
+    assert bank_account2.transactions == ["deposit: $10.5", "withdraw: $77"]
+    assert list(bank_account2.ledger.amounts) == [1050, 7700]
+
+def test_from_lines_invalid():
+    """ Test should raise ValueError for a string that isn't a transaction """
+    with pytest.raises(ValueError):
+        Ledger.from_lines(["refund: $10"])
+
+@pytest.mark.parametrize("cents, text", [(10000, "100"), (1250, "12.5"), (25, "0.25"), (-5, "-0.05")])
+def test_format_cents(cents, text):
+    assert format_cents(cents) == text
+
+# Balance Queries
+def test_balance_after_matches_replay():
+    """ Test should match replaying the transactions, on and between checkpoints """
+    ledger = Ledger(opening=500, interval=4)
+    balances = [500]
+    for i in range(1, 20):
+        op = WITHDRAW if i % 3 == 0 else DEPOSIT
+        ledger.append(op, i * 10, i * 1000)
+        balances.append(balances[-1] + (-i * 10 if op == WITHDRAW else i * 10))
+    assert [ledger.balance_after(count) for count in range(20)] == balances
+    assert ledger.balance == balances[-1]
+    with pytest.raises(IndexError):
+        ledger.balance_after(21)
+
+def test_balance_at_and_net_flow():
+    """ Test should use every transaction at or before a time """
+    ledger = Ledger(opening=1000, interval=2)
+    ledger.append(DEPOSIT, 500, 10)
+    ledger.append(WITHDRAW, 200, 20)
+    ledger.append(DEPOSIT, 100, 30)
+    assert ledger.balance_at(5) == 1000
+    assert ledger.balance_at(20) == 1300
+    assert ledger.balance_at(25) == 1300
+    assert ledger.net_flow(10, 30) == -100
+    assert ledger.net_flow(0, 30) == 400
+
+def test_times_are_wall_clock(bank_account):
+    """ Test should stamp transactions with the wall clock (so saved times still mean something after a restart) """
+    before = time.time_ns()
+    bank_account.deposit(1)
+    assert before <= bank_account.ledger.times[-1] <= time.time_ns()
+
+def test_times_never_go_back(monkeypatch):
+    """ Test should keep the times sorted when the clock is set back """
+    ledger = Ledger()
+    monkeypatch.setattr(ledger_module, "now_ns", lambda: 2000)
+    ledger.append(DEPOSIT, 100)
+    monkeypatch.setattr(ledger_module, "now_ns", lambda: 1000)
+    ledger.append(DEPOSIT, 100)
+    ledger.extend([DEPOSIT, WITHDRAW], [5, 5])
+    assert list(ledger.times) == [2000] * 4
+    assert ledger.balance_at(1500) == 0
+
+def test_account_balance_at(bank_account):
+    """ Test should answer balance at a time in dollars """
+    bank_account.deposit(50)
+    middle = bank_account.ledger.times[-1]
+    bank_account.withdraw(25.5)
+    assert bank_account.balance_at(middle) == 150
+    assert bank_account.balance_at(bank_account.ledger.times[-1]) == 124.5
+    assert bank_account.net_flow(0, bank_account.ledger.times[-1]) == 24.5
+
+def test_from_json_opening_balance():
+    """ Test should work out the opening balance of a loaded history """
+    bank_account = BankAccount()
+    bank_account.from_json("example2.json")
+    assert bank_account.ledger.opening == 0
+    assert bank_account.ledger.balance == 12300
@@ -0,0 +1,92 @@
+"""
+File: test_money.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - https://docs.pytest.org/en/latest/example/parametrize.html
+"""
+
+import json
+import pytest
+from decimal import Decimal
+from fractions import Fraction
+from bank_account import BankAccount
+from money import INT64_MAX, Money, to_cents
+
+@pytest.mark.parametrize("amount, cents", [(100, 10000), (12.5, 1250), (0.1, 10), ("$1,234.56", 123456), (Decimal("0.005"), 0), (Decimal("0.015"), 2)])
+def test_to_cents(amount, cents):
+    assert to_cents(amount) == cents
+
+def test_exact_sums():
+    """ Test should not drift the way float dollars do """
+    total = Money()
+    floats = 0.0
+    for _ in range(1000):
+        total += 0.1
+        floats += 0.1
+    assert total == 100
+    assert total.cents == 10000
+    assert floats != 100
+
+def test_compares_with_numbers():
+    """ Test should compare exactly and hash like the equal number """
+    assert Money(12345) == Decimal("123.45") == Fraction(12345, 100)
+    assert Money(1250) == 12.5
+    assert Money(12345) != 123.45 # the float is a little more than 123.45
+    assert Money(100) != 1.004
+    assert Money(100) < 1.004
+    assert Money(100) < 1.5
+    assert 2 > Money(150)
+    for number in (100, 12.5, Decimal("0.01"), Fraction(1, 4)):
+        money = Money.from_dollars(number)
+        assert money == number and hash(money) == hash(number)
+    assert Money(100) != "1"
+    assert Money(5) != "five"
+    with pytest.raises(TypeError):
+        Money(100) < "2"
+
+def test_formatting():
+    """ Test should format with 2 decimals """
+    assert str(Money(1250)) == "12.50"
+    assert str(Money(-5)) == "-0.05"
+    assert f"{Money(123456):,.2f}" == "1,234.56"
+    assert repr(Money(1)) == "Money('0.01')"
+    assert Money(1250).dollars == 12.5
+    assert Money(1200).dollars == 12
+
+def test_overflow():
+    """ Test should raise OverflowError past 64 bits """
+    with pytest.raises(OverflowError):
+        Money(INT64_MAX) + Money(1)
+    with pytest.raises(OverflowError):
+        Money(INT64_MAX + 1)
+    with pytest.raises(TypeError):
+        Money(1.5)
+
+def test_deposit_overflow_changes_nothing():
+    """ Test should refuse a deposit past 64 bits before the balance or the ledger change """
+    bank_account = BankAccount(12345, "Karina", 0)
+    bank_account.balance = Money(INT64_MAX - 50)
+    with pytest.raises(OverflowError):
+        bank_account.deposit(1)
+    assert bank_account.cents == INT64_MAX - 50
+    assert len(bank_account.ledger) == 0
+
+def test_balance_is_exact():
+    """ Test should keep the balance in exact cents """
+    bank_account = BankAccount(12345, "Karina", 0)
+    for _ in range(10):
+        bank_account.deposit(0.1)
+    bank_account.withdraw(0.3)
+    assert bank_account.money == Decimal("0.7")
+    assert bank_account.cents == 70
+    assert bank_account.balance == 0.7
+
+def test_json_keeps_cents(tmp_path):
+    """ Test should save and load the balance without dropping the cents """
+    bank_account = BankAccount(12345, "Karina", 12.34)
+    bank_account.to_json(tmp_path / "account.json")
+    assert json.loads((tmp_path / "account.json").read_text())["balance"] == 12.34
+    bank_account2 = BankAccount()
+    bank_account2.from_json(tmp_path / "account.json")
+    assert bank_account2.cents == 1234
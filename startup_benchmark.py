@@ -0,0 +1,102 @@
+"""
+FileName: startup_benchmark.py
+Author: Karina Solis
+Date: 10/18/2026
+Resources:
+    - subprocess module: running a fresh interpreter for each import
+        https://docs.python.org/3/library/subprocess.html
+    - time module: perf_counter_ns
+        https://docs.python.org/3/library/time.html#time.perf_counter_ns
+
+Checks that the library modules import quickly and without side effects (no demo loops, prints or requests).
+Every module is imported in a fresh interpreter several times, and the median import time has to stay under the limit.
+
+Use:
+    python startup_benchmark.py
+    python startup_benchmark.py --limit-ms 10 --runs 9
+"""
+from pathlib import Path
+from statistics import median
+import argparse
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parent
+
+# (folder, module name) of every module that should be importable
+MODULES = [
+    ("HW 1", "infinite_generators"),
+    ("HW 3", "solis_decorator"),
+    ("EC", "solis_decoder"),
+]
+
+# imports the module and prints how long it took (in ns), run in a fresh interpreter
+IMPORT_SCRIPT = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter_ns()
+import {module}
+print(time.perf_counter_ns() - start)
+"""
+
+
+def time_import(folder:str, module:str, timeout:float)->tuple[int, str]:
+    """
+    Imports a module in a fresh interpreter.
+
+    Args:
+        folder (str): The folder the module is in.
+        module (str): The name of the module.
+        timeout (float): How long (in seconds) the import gets before it counts as hanging.
+
+    Returns:
+        (ns, output) (tuple[int, str]): The import time in nanoseconds, and anything else the import printed.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module), str(ROOT / folder)],
+        capture_output=True, text=True, timeout=timeout, check=True,
+    )
+    *printed, ns = result.stdout.strip().splitlines()
+    return int(ns), "\n".join(printed)
+
+
+def main()->None:
+    """
+    handles command line options and checks every module, exits with 1 if any module is slow, prints or hangs
+    """
+    parser = argparse.ArgumentParser(description="Check that the library modules import quickly.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--limit-ms", type=float, default=20.0, help="highest allowed median import time")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds before an import counts as hanging")
+    args = parser.parse_args()
+
+    failed = False
+    for folder, module in MODULES:
+        try:
+            runs = [time_import(folder, module, args.timeout) for _ in range(args.runs)]
+        except subprocess.TimeoutExpired:
+            print(f"FAIL {folder}/{module}: import did not finish in {args.timeout} s")
+            failed = True
+            continue
+        except subprocess.CalledProcessError as e:
+            print(f"FAIL {folder}/{module}: import raised\n{e.stderr}")
+            failed = True
+            continue
+
+        ms = median(ns for ns, _ in runs) / 1e6
+        printed = runs[0][1]
+        status = "ok"
+        if ms > args.limit_ms or printed:
+            status = "FAIL"
+            failed = True
+        print(f"{status:>4} {folder}/{module}: {ms:.2f} ms")
+        if printed:
+            print(f"     printed on import: {printed!r}")
+
+    if failed:
+        sys.exit(1)
+
+
+#for command line
+if __name__ == "__main__":
+    main()